@@ -6,9 +6,6 @@ Entry point for yt-dlp-gui command line tool
 import argparse
 import sys
 import signal
-from .core.downloader import Downloader
-from .gui.terminal_ui import TerminalUI
-from .gui.modern_ui import ModernUI
 
 
 def setup_global_signal_handlers():
@@ -39,6 +36,7 @@ def main():
 
     if args.url:
         # Direct download mode
+        from .core.downloader import Downloader
         downloader = Downloader()
         try:
             downloader.download(args.url, args.output, args.audio_only, force_playlist_redownload=False)
@@ -50,6 +48,7 @@ def main():
             print(f"Error: {e}")
     elif args.terminal:
         # Terminal UI mode
+        from .gui.terminal_ui import TerminalUI
         try:
             ui = TerminalUI()
             ui.run()
@@ -57,6 +56,7 @@ def main():
             print("\n👋 Exiting gracefully...")
     else:
         # Default: Modern GUI mode
+        from .gui.modern_ui import ModernUI
         try:
             ui = ModernUI()
             ui.run()
@@ -1,89 +1,289 @@
 import customtkinter as ctk
+import errno
+import hashlib
+import importlib
 import threading
 import os
-import signal
+import shutil
+import queue
 import sys
-import json
-import re
-import difflib
-import math
+import tempfile
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import zip_longest
+from operator import attrgetter
 from pathlib import Path
 from tkinter import filedialog, messagebox
-from ..core.downloader import Downloader
 from ..utils.config import Config
-from .task_item import TaskItem
+from .task_item import TaskItem, _parse_url
+from .update_album_dialog import UpdateAlbumDialog
 
-# Try to import darkdetect, fallback to system detection
-try:
-    import darkdetect
-    DARKDETECT_AVAILABLE = True
-except ImportError:
-    DARKDETECT_AVAILABLE = False
+# darkdetect is optional and only needed once while configuring the appearance,
+# so it is imported on first use rather than at module load
+_darkdetect = None
+_darkdetect_checked = False
 
 
-class ModernUI:
-    # Modern color palette for both light and dark themes
-    COLORS = {
-        'dark': {
-            'primary': '#6366f1',      # Indigo
-            'primary_hover': '#5856d6', # Darker indigo
-            'secondary': '#10b981',    # Emerald
-            'accent': '#f59e0b',       # Amber
-            'danger': '#ef4444',       # Red
-            'warning': '#f97316',      # Orange
-            'success': '#22c55e',      # Green
-            'surface': '#1f2937',      # Dark surface
-            'surface_light': '#374151', # Light surface
-            'background': '#111827',    # Dark background
-            'card': '#1f2937',         # Card background
-            'text_primary': '#f9fafb',  # Light text
-            'text_secondary': '#d1d5db', # Muted text
-            'border': '#374151',       # Border color
-        },
-        'light': {
-            'primary': '#6366f1',      # Indigo (same for consistency)
-            'primary_hover': '#5856d6', # Darker indigo
-            'secondary': '#10b981',    # Emerald
-            'accent': '#f59e0b',       # Amber
-            'danger': '#dc2626',       # Red
-            'warning': '#ea580c',      # Orange
-            'success': '#16a34a',      # Green
-            'surface': '#f8fafc',      # Light surface
-            'surface_light': '#f1f5f9', # Lighter surface
-            'background': '#ffffff',    # White background
-            'card': '#ffffff',         # White card background
-            'text_primary': '#0f172a',  # Dark text
-            'text_secondary': '#64748b', # Muted text
-            'border': '#e2e8f0',       # Light border color
-        }
+def _get_darkdetect():
+    """Return the darkdetect module, or None if it is not installed"""
+    global _darkdetect, _darkdetect_checked
+    if not _darkdetect_checked:
+        _darkdetect_checked = True
+        try:
+            import darkdetect
+            _darkdetect = darkdetect
+        except ImportError:
+            _darkdetect = None
+    return _darkdetect
+
+
+def __getattr__(name):
+    # Keep the old module-level flag available without importing darkdetect eagerly
+    if name == "DARKDETECT_AVAILABLE":
+        return _get_darkdetect() is not None
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# Linux can copy file data inside the kernel: copy_file_range (5.3+, reflinks on CoW
+# filesystems) or sendfile, which shutil.copyfile also uses there; anything else goes
+# through shutil.copyfileobj
+_HAS_COPY_FILE_RANGE = hasattr(os, 'copy_file_range')
+_HAS_FILE_SENDFILE = hasattr(os, 'sendfile') and sys.platform.startswith('linux')
+_UNSUPPORTED_COPY_ERRNOS = (errno.ENOSYS, errno.EXDEV, errno.EINVAL, errno.EOPNOTSUPP)
+_COPY_CHUNK_SIZE = 8 * 1024 * 1024
+
+
+def _copy_data(fsrc, fdst):
+    """Copy all of fsrc into the empty fdst, inside the kernel when the OS allows it
+
+    Falls back to shutil.copyfileobj when no kernel method is available or one copies
+    nothing at offset 0 (some filesystems and pseudo-files fail that way silently).
+    """
+    infd, outfd = fsrc.fileno(), fdst.fileno()
+    methods = []
+    if _HAS_COPY_FILE_RANGE:
+        methods.append(lambda count: os.copy_file_range(infd, outfd, count))
+    if _HAS_FILE_SENDFILE:
+        methods.append(lambda count: os.sendfile(outfd, infd, None, count))
+    # Like shutil: the reported size only picks the chunk size, EOF is a call copying 0 bytes
+    try:
+        chunk = max(os.fstat(infd).st_size, _COPY_CHUNK_SIZE)
+    except OSError:
+        chunk = _COPY_CHUNK_SIZE
+    for copy_chunk in methods:
+        total = 0
+        try:
+            while True:
+                copied = copy_chunk(chunk)
+                if copied == 0:
+                    break
+                total += copied
+            if total:
+                return
+            # Nothing copied: unsupported here without an error; try the next method
+            continue
+        except OSError as e:
+            if e.errno not in _UNSUPPORTED_COPY_ERRNOS:
+                raise
+        # Not supported for these files; start over with the next method
+        fsrc.seek(0)
+        fdst.seek(0)
+        fdst.truncate()
+    shutil.copyfileobj(fsrc, fdst)
+
+
+def _copy_file(src, dst, dst_fd=None):
+    """Copy data and metadata like shutil.copy2, letting the kernel move the data where possible
+
+    dst_fd, if given, is a descriptor already opened on dst (e.g. claimed with O_EXCL); it is closed.
+    """
+    with open(src, 'rb') as fsrc, open(dst if dst_fd is None else dst_fd, 'wb') as fdst:
+        _copy_data(fsrc, fdst)
+    shutil.copystat(src, dst)
+
+
+# Undo backups of an import are kept in "<output>/.import_backup_<timestamp>" so originals
+# can be hardlinked; they are removed when the dialog closes, on exit and at next startup
+_IMPORT_BACKUP_PREFIX = ".import_backup_"
+
+
+def _replace_with_backup(src, dst, backup):
+    """Overwrite dst with a copy of src, keeping the original at backup so it can be restored
+
+    The original is hardlinked (copied where the filesystem can't link) and the new data is
+    written to a temporary file that atomically replaces dst, so dst is never half-written.
+    """
+    os.makedirs(os.path.dirname(backup), exist_ok=True)
+    try:
+        os.link(dst, backup)
+    except OSError:
+        shutil.copy2(dst, backup)
+    try:
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(dst), suffix=".tmp")
+        try:
+            _copy_file(src, tmp, fd)
+            os.replace(tmp, dst)
+        except BaseException:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            raise
+    except BaseException:
+        try:
+            os.remove(backup)
+        except OSError:
+            pass
+        raise
+
+
+# Import content check: files are compared by a 64-bit simhash of their leading bytes,
+# built from per-block digests, so a few differing blocks (e.g. rewritten tags) still match
+_SIGNATURE_BLOCK_SIZE = 4096
+_SIGNATURE_MAX_DISTANCE = 3
+
+
+@lru_cache(maxsize=4096)
+def _head_signature(path, mtime_ns, size, nbytes):
+    """Simhash of the first nbytes of a file; mtime_ns and size key out stale cache entries"""
+    weights = [0] * 64
+    with open(path, 'rb') as f:
+        if hasattr(os, 'posix_fadvise'):
+            try:
+                os.posix_fadvise(f.fileno(), 0, nbytes, os.POSIX_FADV_SEQUENTIAL)
+            except OSError:
+                pass
+        remaining = nbytes
+        while remaining > 0:
+            block = f.read(min(_SIGNATURE_BLOCK_SIZE, remaining))
+            if not block:
+                break
+            remaining -= len(block)
+            block_hash = int.from_bytes(hashlib.blake2b(block, digest_size=8).digest(), 'little')
+            for bit in range(64):
+                if block_hash >> bit & 1:
+                    weights[bit] += 1
+                else:
+                    weights[bit] -= 1
+    signature = 0
+    for bit, weight in enumerate(weights):
+        if weight > 0:
+            signature |= 1 << bit
+    return signature
+
+
+# Modern color palette: entries shared by both themes, plus per-mode overrides.
+# get_current_colors() merges them into a full palette the first time a mode is used.
+_BASE_COLORS = {
+    'primary': '#6366f1',      # Indigo
+    'primary_hover': '#5856d6', # Darker indigo
+    'secondary': '#10b981',    # Emerald
+    'accent': '#f59e0b',       # Amber
+}
+
+_MODE_COLORS = {
+    'dark': {
+        'danger': '#ef4444',       # Red
+        'warning': '#f97316',      # Orange
+        'success': '#22c55e',      # Green
+        'surface': '#1f2937',      # Dark surface
+        'surface_light': '#374151', # Light surface
+        'background': '#111827',    # Dark background
+        'card': '#1f2937',         # Card background
+        'text_primary': '#f9fafb',  # Light text
+        'text_secondary': '#d1d5db', # Muted text
+        'border': '#374151',       # Border color
+    },
+    'light': {
+        'danger': '#dc2626',       # Red
+        'warning': '#ea580c',      # Orange
+        'success': '#16a34a',      # Green
+        'surface': '#f8fafc',      # Light surface
+        'surface_light': '#f1f5f9', # Lighter surface
+        'background': '#ffffff',    # White background
+        'card': '#ffffff',         # White card background
+        'text_primary': '#0f172a',  # Dark text
+        'text_secondary': '#64748b', # Muted text
+        'border': '#e2e8f0',       # Light border color
     }
+}
+
+
+class ModernUI:
+    # Widget color specs per appearance mode, built lazily by _apply_modern_styling
+    _theme_spec_cache = {}
+
+    # Shared CTkFont objects keyed by (size, weight, family); see _font()
+    _FONT_CACHE = {}
+
+    # Persisted task fields, in the order they are stored per column in _task_state
+    _TASK_FIELDS = ("url", "format", "output", "video_name", "playlist_name", "is_playlist")
+    # Maximum number of removed task cards kept hidden for reuse
+    _TASK_POOL_SIZE = 8
+    # Every TaskItem defines these in __init__; fetched together when snapshotting a row
+    _task_vars = attrgetter("format_var", "output_var")
+    _task_info = attrgetter("video_name", "playlist_name", "is_playlist")
+    # Number of threads fetching video/playlist info for task URLs
+    _METADATA_WORKERS = 4
+    # Download settings panel: (column, title, options, needs_ffmpeg), options being
+    # (config key, label, default); needs_ffmpeg categories are disabled without FFmpeg
+    _SETTINGS_CATEGORIES = (
+        ("left", "📝 Metadata Embedding", (
+            ("embed_metadata", "Embed Metadata", True),
+            ("embed_thumbnail", "Embed Thumbnail", True),
+            ("embed_chapters", "Embed Chapters", True),
+        ), True),
+        ("left", "💾 File Options", (
+            ("write_thumbnail", "Save Thumbnail", True),
+            ("include_author", "Include Author", False),
+            ("write_description", "Save Description", False),
+            ("write_info_json", "Save Info JSON", False),
+        ), False),
+        ("right", "📀 Playlist Options", (
+            ("playlist_album_override", "Use Playlist as Album", False),
+            ("create_m3u", "Create M3U", False),
+            ("m3u_to_parent", "Place M3U in parent folder", False),
+        ), False),
+        ("right", "📥 Download Options", (
+            ("embed_subs", "Download Subtitles", False),
+            ("force_playlist_redownload", "Force Re-download All", False),
+        ), False),
+    )
 
     # Animation constants
     ANIMATION_DURATION = 300
-    EASING_FUNCTIONS = {
-        'ease_out': lambda t: 1 - math.pow(1 - t, 3),
-        'ease_in_out': lambda t: 3 * t * t - 2 * t * t * t if t < 0.5 else 1 - math.pow(-2 * t + 2, 3) / 2
-    }
 
     def __init__(self):
         # Initialize config first
         self.config = Config()
+        # Palette lookups keyed by appearance mode (see get_current_colors)
+        self._colors_cache = {}
+        # ctk appearance mode ("Dark"/"Light") for per-widget palette lookups; refreshed when
+        # this class changes it and by the appearance tracker when the OS theme changes
+        self._appearance_mode = ctk.get_appearance_mode()
+        self._last_applied_mode = None
 
         # Configure CustomTkinter appearance
         self.setup_appearance()
         
-        # Keep a single downloader instance for capability checks (FFmpeg, etc.)
-        self.downloader = Downloader()
+        # Single downloader instance for capability checks (FFmpeg, etc.); created by
+        # _post_paint_init so yt-dlp loading and the FFmpeg probe don't delay the window
+        self.downloader = None
+        # Settings checkboxes that require FFmpeg, disabled once it is known to be missing
+        self._ffmpeg_checkboxes = []
         # Multi-task management
         self.tasks = []  # List of TaskItem instances
         
-        # Check FFmpeg availability and show warning if needed
-        if not self.downloader.ffmpeg_available:
-            self.show_ffmpeg_warning()
-        
         # Create the main window with modern styling
         self.root = ctk.CTk()
         self.root.title("🎬 YouTube Media Downloader")
+        # With the "auto" theme CustomTkinter follows the OS at runtime; keep the cached mode in step
+        try:
+            ctk.AppearanceModeTracker.add(self._on_appearance_mode_changed, self.root)
+        except Exception:
+            pass
 
         # Set minimum size
         self.root.minsize(800, 600)
@@ -92,52 +292,76 @@ class ModernUI:
         try:
             # Try modern maximized state first
             self.root.state('zoomed')
-            # Ensure window is not minimized and is visible
-            self.root.update()
-            self.root.deiconify()
-            self.root.focus_force()
         except:
             try:
                 # Fallback for older Tkinter versions
                 self.root.attributes('-zoomed', True)
-                self.root.update()
-                self.root.deiconify()
-                self.root.focus_force()
             except:
                 # Final fallback - set large geometry
                 screen_width = self.root.winfo_screenwidth()
                 screen_height = self.root.winfo_screenheight()
                 self.root.geometry(f"{screen_width}x{screen_height}+0+0")
-                self.root.update()
-                self.root.deiconify()
-                self.root.focus_force()
+
+        # Ensure window is not minimized and is visible; update_idletasks() applies
+        # the new geometry without dispatching pending user events
+        try:
+            self.root.update_idletasks()
+            self.root.deiconify()
+            self.root.focus_force()
+        except Exception:
+            pass
 
         # Modern window appearance (no transparency for better visibility)
         pass
         
         # Set window icon (resolve relative to project root with fallback)
         try:
-            project_root = Path(__file__).resolve().parent.parent.parent
-            icon_candidates = [
-                project_root / "icon.ico",
-                project_root / "assets" / "icon.ico",
-                Path.cwd() / "icon.ico",
-            ]
-            for candidate in icon_candidates:
-                if candidate.exists():
-                    self.root.iconbitmap(str(candidate))
-                    break
+            icon_path = self._resolve_icon_path()
+            if icon_path:
+                self.root.iconbitmap(icon_path)
         except Exception:
             pass
         
         # Track debounced persistence and restoration state
         self._persist_after_id = None
         self._restoring_tasks = False
+        self._silenced = False  # Set by _silent() while variables are written programmatically
+        self._restore_queue = deque()
+        self._persist_delay = 300
+        # Persisted task fields stored column-wise (one list per field, indexed by
+        # task._idx); only tasks in _dirty_tasks are re-read on save
+        self._task_state = {field: [] for field in self._TASK_FIELDS}
+        self._dirty_tasks = set()
+        # Removed, idle task cards kept hidden for reuse by add_task
+        self._task_pool = []
+        # (widget, {option: (light_key, dark_key)}) for section widgets recolored by toggle_theme
+        self._themable_widgets = []
+        self._import_state = None  # State of the open import dialog (see show_import_dialog)
+        # path -> (exists, checked_at) for _path_exists_cached
+        self._exists_cache = {}
+        # Task persistence is written by a background thread; the queue holds at most
+        # one pending save request and the writer saves the settings as they are then
+        self._save_queue = queue.Queue(maxsize=1)
+        self._save_thread = threading.Thread(target=self._save_worker, daemon=True)
+        self._save_thread.start()
+        # Video info lookups (yt-dlp network calls) are queued and run by a few workers so
+        # adding many URLs doesn't block the UI; results are applied on the Tk thread
+        self._metadata_queue = queue.Queue()
+        for _ in range(self._METADATA_WORKERS):
+            threading.Thread(target=self._metadata_worker, daemon=True).start()
+        # Background jobs (import/undo, album metadata updates) share one small pool
+        # instead of starting a thread per click; copies inside an import use their own executor
+        self._bg_pool = ThreadPoolExecutor(max_workers=max(2, (os.cpu_count() or 1) - 3),
+                                           thread_name_prefix="background")
+        # Warm the downloader/yt-dlp imports (a few hundred modules) off the Tk thread so
+        # the post-paint FFmpeg check and the first Start hit a populated sys.modules
+        self._bg_pool.submit(importlib.import_module, "..core.downloader", __package__)
 
         # Create and pack the GUI elements
         self.create_widgets()
 
-        # Restore tasks state (count and URLs) from config after UI is created
+        # Restore tasks state (count and URLs) from config after UI is created;
+        # the task widgets themselves are built after the window first paints
         self.restore_tasks_from_config()
 
         # Note: Window is launched maximized to fill screen
@@ -146,17 +370,77 @@ class ModernUI:
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
         self.root.bind("<Escape>", self.toggle_maximize)
         self.root.bind("<F11>", self.toggle_maximize)
+        # Maximized state is re-read once per burst of window resizes and cached
+        self._is_maximized = False
+        self._maximize_check_pending = False
+        self.root.bind("<Configure>", self._on_root_configure, add="+")
         
-        # Set up signal handlers for graceful exit
-        self.setup_signal_handlers()
+        # FFmpeg check and signal handlers are set up once the window has painted
+        self.root.after_idle(self._post_paint_init)
         
         # Debouncing for output directory changes
         self._output_dir_save_after_id = None
 
+    def _get_downloader(self):
+        """Get or create the shared downloader instance lazily"""
+        if self.downloader is None:
+            from ..core.downloader import Downloader
+            self.downloader = Downloader()
+        return self.downloader
+
+    def _post_paint_init(self):
+        """Finish startup work that isn't needed to show the window"""
+        try:
+            # Check FFmpeg availability and show warning if needed
+            if not self._get_downloader().ffmpeg_available:
+                for checkbox in self._ffmpeg_checkboxes:
+                    try:
+                        checkbox.configure(state="disabled")
+                    except Exception:
+                        pass
+                self.show_ffmpeg_warning()
+        except Exception as e:
+            print(f"Error initializing downloader: {e}")
+
+        # Undo backups only live as long as the import dialog; clear any left by a crash
+        self._bg_pool.submit(self._remove_stale_import_backups)
+
+        # Set up signal handlers for graceful exit
+        self.setup_signal_handlers()
+
+    def _resolve_icon_path(self):
+        """Locate the window icon, reusing the path cached in config while it still exists"""
+        cached = self.config.get("icon_path", "")
+        if cached and os.path.isfile(cached):
+            return cached
+
+        project_root = Path(__file__).resolve().parent.parent.parent
+        icon_candidates = [
+            (project_root, "icon.ico"),
+            (project_root / "assets", "icon.ico"),
+            (Path.cwd(), "icon.ico"),
+        ]
+        # One directory listing per parent instead of a stat() per candidate
+        listings = {}
+        for parent, name in icon_candidates:
+            names = listings.get(parent)
+            if names is None:
+                try:
+                    names = set(os.listdir(parent))
+                except OSError:
+                    names = set()
+                listings[parent] = names
+            if name in names:
+                icon_path = str(parent / name)
+                self.config.set("icon_path", icon_path)
+                return icon_path
+        return None
+
     def setup_appearance(self):
         """Configure CustomTkinter appearance with modern styling"""
         # Set appearance mode based on system or config
-        if DARKDETECT_AVAILABLE:
+        darkdetect = _get_darkdetect()
+        if darkdetect is not None:
             system_mode = darkdetect.theme()
         else:
             # Fallback: assume dark mode for modern look
@@ -168,14 +452,85 @@ class ModernUI:
             ctk.set_appearance_mode("system")
         else:
             ctk.set_appearance_mode(config_mode)
+        self._appearance_mode = ctk.get_appearance_mode()
 
         # Configure modern styling
         self._apply_modern_styling()
 
     def get_current_colors(self):
         """Get the current color palette based on the theme mode"""
-        current_mode = ctk.get_appearance_mode().lower()
-        return self.COLORS.get(current_mode, self.COLORS['dark'])
+        current_mode = self._appearance_mode.lower()
+        colors = self._colors_cache.get(current_mode)
+        if colors is None:
+            colors = {**_BASE_COLORS, **_MODE_COLORS.get(current_mode, _MODE_COLORS['dark'])}
+            self._colors_cache[current_mode] = colors
+        return colors
+
+    @staticmethod
+    def _build_theme_spec(cc):
+        """Build the per-widget color overrides for a palette"""
+        # Create custom color theme for current mode
+        return [
+            ("CTk", {"fg_color": [cc['background'], cc['surface']]}),
+            ("CTkToplevel", {"fg_color": [cc['background'], cc['surface']]}),
+            ("CTkFrame", {"fg_color": [cc['surface'], cc['surface_light']]}),
+            ("CTkButton", {
+                "fg_color": [cc['primary'], cc['primary_hover']],
+                "hover_color": [cc['primary_hover'], cc['primary']],
+                "border_color": [cc['primary'], cc['primary_hover']],
+                "text_color": [cc['text_primary'], cc['text_primary']],
+                "border_width": [1, 1]
+            }),
+            ("CTkLabel", {
+                "fg_color": "transparent",
+                "text_color": [cc['text_primary'], cc['text_secondary']]
+            }),
+            ("CTkEntry", {
+                "fg_color": [cc['surface_light'], cc['surface']],
+                "border_color": [cc['border'], cc['border']],
+                "text_color": [cc['text_primary'], cc['text_primary']],
+                "placeholder_text_color": [cc['text_secondary'], cc['text_secondary']]
+            }),
+            ("CTkTextbox", {
+                "fg_color": [cc['surface_light'], cc['surface']],
+                "border_color": [cc['border'], cc['border']],
+                "text_color": [cc['text_primary'], cc['text_primary']]
+            }),
+            ("CTkScrollableFrame", {
+                "fg_color": [cc['surface'], cc['surface_light']],
+                "scrollbar_fg_color": [cc['surface_light'], cc['surface']],
+                "scrollbar_button_color": [cc['primary'], cc['primary_hover']],
+                "scrollbar_button_hover_color": [cc['primary_hover'], cc['primary']]
+            }),
+            ("CTkProgressBar", {
+                "fg_color": [cc['surface_light'], cc['surface']],
+                "progress_color": [cc['secondary'], cc['secondary']],
+                "border_color": [cc['border'], cc['border']]
+            }),
+            ("CTkCheckBox", {
+                "fg_color": [cc['surface_light'], cc['surface']],
+                "border_color": [cc['border'], cc['border']],
+                "hover_color": [cc['primary'], cc['primary_hover']],
+                "checkmark_color": [cc['text_primary'], cc['text_primary']],
+                "text_color": [cc['text_primary'], cc['text_primary']]
+            }),
+            ("CTkRadioButton", {
+                "fg_color": [cc['surface_light'], cc['surface']],
+                "border_color": [cc['border'], cc['border']],
+                "hover_color": [cc['primary'], cc['primary_hover']],
+                "checkmark_color": [cc['text_primary'], cc['text_primary']],
+                "text_color": [cc['text_primary'], cc['text_primary']]
+            }),
+            ("CTkOptionMenu", {
+                "fg_color": [cc['surface_light'], cc['surface']],
+                "button_color": [cc['primary'], cc['primary_hover']],
+                "button_hover_color": [cc['primary_hover'], cc['primary']],
+                "text_color": [cc['text_primary'], cc['text_primary']],
+                "dropdown_fg_color": [cc['surface'], cc['surface_light']],
+                "dropdown_text_color": [cc['text_primary'], cc['text_primary']],
+                "dropdown_hover_color": [cc['primary'], cc['primary_hover']]
+            })
+        ]
 
     def _apply_modern_styling(self):
         """Apply modern styling and custom colors to the app"""
@@ -183,68 +538,14 @@ class ModernUI:
             # Get current colors based on theme mode
             current_colors = self.get_current_colors()
 
-            # Create custom color theme for current mode
-            colors = [
-                ("CTk", {"fg_color": [current_colors['background'], current_colors['surface']]}),
-                ("CTkToplevel", {"fg_color": [current_colors['background'], current_colors['surface']]}),
-                ("CTkFrame", {"fg_color": [current_colors['surface'], current_colors['surface_light']]}),
-                ("CTkButton", {
-                    "fg_color": [current_colors['primary'], current_colors['primary_hover']],
-                    "hover_color": [current_colors['primary_hover'], current_colors['primary']],
-                    "border_color": [current_colors['primary'], current_colors['primary_hover']],
-                    "text_color": [current_colors['text_primary'], current_colors['text_primary']],
-                    "border_width": [1, 1]
-                }),
-                ("CTkLabel", {
-                    "fg_color": "transparent",
-                    "text_color": [current_colors['text_primary'], current_colors['text_secondary']]
-                }),
-                ("CTkEntry", {
-                    "fg_color": [current_colors['surface_light'], current_colors['surface']],
-                    "border_color": [current_colors['border'], current_colors['border']],
-                    "text_color": [current_colors['text_primary'], current_colors['text_primary']],
-                    "placeholder_text_color": [current_colors['text_secondary'], current_colors['text_secondary']]
-                }),
-                ("CTkTextbox", {
-                    "fg_color": [current_colors['surface_light'], current_colors['surface']],
-                    "border_color": [current_colors['border'], current_colors['border']],
-                    "text_color": [current_colors['text_primary'], current_colors['text_primary']]
-                }),
-                ("CTkScrollableFrame", {
-                    "fg_color": [current_colors['surface'], current_colors['surface_light']],
-                    "scrollbar_fg_color": [current_colors['surface_light'], current_colors['surface']],
-                    "scrollbar_button_color": [current_colors['primary'], current_colors['primary_hover']],
-                    "scrollbar_button_hover_color": [current_colors['primary_hover'], current_colors['primary']]
-                }),
-                ("CTkProgressBar", {
-                    "fg_color": [current_colors['surface_light'], current_colors['surface']],
-                    "progress_color": [current_colors['secondary'], current_colors['secondary']],
-                    "border_color": [current_colors['border'], current_colors['border']]
-                }),
-                ("CTkCheckBox", {
-                    "fg_color": [current_colors['surface_light'], current_colors['surface']],
-                    "border_color": [current_colors['border'], current_colors['border']],
-                    "hover_color": [current_colors['primary'], current_colors['primary_hover']],
-                    "checkmark_color": [current_colors['text_primary'], current_colors['text_primary']],
-                    "text_color": [current_colors['text_primary'], current_colors['text_primary']]
-                }),
-                ("CTkRadioButton", {
-                    "fg_color": [current_colors['surface_light'], current_colors['surface']],
-                    "border_color": [current_colors['border'], current_colors['border']],
-                    "hover_color": [current_colors['primary'], current_colors['primary_hover']],
-                    "checkmark_color": [current_colors['text_primary'], current_colors['text_primary']],
-                    "text_color": [current_colors['text_primary'], current_colors['text_primary']]
-                }),
-                ("CTkOptionMenu", {
-                    "fg_color": [current_colors['surface_light'], current_colors['surface']],
-                    "button_color": [current_colors['primary'], current_colors['primary_hover']],
-                    "button_hover_color": [current_colors['primary_hover'], current_colors['primary']],
-                    "text_color": [current_colors['text_primary'], current_colors['text_primary']],
-                    "dropdown_fg_color": [current_colors['surface'], current_colors['surface_light']],
-                    "dropdown_text_color": [current_colors['text_primary'], current_colors['text_primary']],
-                    "dropdown_hover_color": [current_colors['primary'], current_colors['primary_hover']]
-                })
-            ]
+            # The spec only depends on the palette, so build it once per mode
+            mode = self._appearance_mode.lower()
+            if mode == self._last_applied_mode:
+                return
+            self._last_applied_mode = mode
+            colors = ModernUI._theme_spec_cache.get(mode)
+            if colors is None:
+                colors = ModernUI._theme_spec_cache[mode] = self._build_theme_spec(current_colors)
 
             # Apply custom theme
             for widget, color_dict in colors:
@@ -272,10 +573,21 @@ class ModernUI:
         # Restore settings from config into UI
         self.restore_settings_to_ui()
 
+    @classmethod
+    def _font(cls, size, weight="normal", family="Segoe UI"):
+        """Return a shared CTkFont, creating it on first use"""
+        key = (size, weight, family)
+        font = cls._FONT_CACHE.get(key)
+        if font is None:
+            font = ctk.CTkFont(size=size, weight=weight, family=family)
+            cls._FONT_CACHE[key] = font
+        return font
+
     def _create_settings_category(self, parent, title, options, ffmpeg_disabled=False, disabled_keys=None):
         """Create a settings category with title and checkboxes"""
         if disabled_keys is None:
             disabled_keys = []
+        current_colors = self.get_current_colors()
 
         # Category frame
         category_frame = ctk.CTkFrame(parent, fg_color="transparent")
@@ -285,9 +597,10 @@ class ModernUI:
         title_label = ctk.CTkLabel(
             category_frame,
             text=title,
-            font=ctk.CTkFont(size=14, weight="bold", family="Segoe UI"),
-            text_color=(self.get_current_colors()['text_primary'], self.get_current_colors()['text_primary'])
+            font=self._font(14, "bold"),
+            text_color=current_colors['text_primary']
         )
+        self._register(title_label, text_color=('text_primary', 'text_primary'))
         title_label.pack(anchor="w", pady=(0, 10))
 
         # Checkboxes container
@@ -303,27 +616,43 @@ class ModernUI:
                 checkboxes_frame,
                 text=text,
                 variable=var,
-                font=ctk.CTkFont(size=12, family="Segoe UI"),
+                font=self._font(12),
                 state="disabled" if ffmpeg_disabled and key in disabled_keys else "normal",
                 command=lambda k=key, v=var: self._save_metadata_setting(k, v.get()),
-                text_color=(self.get_current_colors()['text_primary'], self.get_current_colors()['text_primary']),
-                hover_color=(self.get_current_colors()['primary'], self.get_current_colors()['primary_hover'])
+                text_color=current_colors['text_primary'],
+                hover_color=(current_colors['primary'], current_colors['primary_hover'])
             )
+            self._register(checkbox, hover_color=('primary', 'primary_hover'), text_color=('text_primary', 'text_primary'))
             checkbox.pack(anchor="w", pady=2)
+            if key in disabled_keys:
+                self._ffmpeg_checkboxes.append(checkbox)
 
         return category_frame
 
+    @contextmanager
+    def _silent(self):
+        """Suppress persistence callbacks while variables are set programmatically"""
+        previous = self._silenced
+        self._silenced = True
+        try:
+            yield
+        finally:
+            self._silenced = previous
+
     def restore_settings_to_ui(self):
         """Restore all settings from config into UI elements"""
         try:
-            # Restore metadata settings
-            for key, var in self.metadata_vars.items():
-                saved_value = self.config.get(key, False)
-                var.set(saved_value)
-
-            # Restore cookie file setting
-            cookie_file = self.config.get("cookie_file", "")
-            self.cookie_var.set(cookie_file)
+            with self._silent():
+                # Restore metadata settings, skipping values that are already current
+                for key, var in self.metadata_vars.items():
+                    saved_value = self.config.get(key, False)
+                    if var.get() != saved_value:
+                        var.set(saved_value)
+
+                # Restore cookie file setting
+                cookie_file = self.config.get("cookie_file", "")
+                if self.cookie_var.get() != cookie_file:
+                    self.cookie_var.set(cookie_file)
 
             # Restore theme (already handled in setup_appearance)
             # Restore output directory (handled per-task)
@@ -347,8 +676,9 @@ class ModernUI:
             fg_color=(current_colors['surface'], current_colors['surface_light']),
             corner_radius=16,
             border_width=2,
-            border_color=(current_colors['border'], current_colors['border'])
+            border_color=current_colors['border']
         )
+        self._register(self.scrollable_frame, fg_color=('surface', 'surface_light'), border_color=('border', 'border'))
         self.scrollable_frame.pack(fill="both", expand=True, padx=30, pady=0)
 
     def create_scrollable_content(self):
@@ -374,11 +704,12 @@ class ModernUI:
         current_colors = self.get_current_colors()
         welcome_card = ctk.CTkFrame(
             parent,
-            fg_color=(current_colors['card'], current_colors['card']),
+            fg_color=current_colors['card'],
             corner_radius=12,
             border_width=1,
-            border_color=(current_colors['border'], current_colors['border'])
+            border_color=current_colors['border']
         )
+        self._register(welcome_card, fg_color=('card', 'card'), border_color=('border', 'border'))
         welcome_card.pack(fill="x", pady=(0, 25))
 
         # Welcome content
@@ -389,9 +720,10 @@ class ModernUI:
         welcome_title = ctk.CTkLabel(
             welcome_content,
             text="🚀 Ready to Download",
-            font=ctk.CTkFont(size=20, weight="bold", family="Segoe UI"),
-            text_color=(current_colors['text_primary'], current_colors['text_primary'])
+            font=self._font(20, "bold"),
+            text_color=current_colors['text_primary']
         )
+        self._register(welcome_title, text_color=('text_primary', 'text_primary'))
         welcome_title.pack(anchor="w", pady=(0, 8))
 
         # Welcome description
@@ -399,67 +731,23 @@ class ModernUI:
             welcome_content,
             text="Configure your download settings below, then add tasks to start downloading YouTube content.\n"
                  "Supports playlists, individual videos, and various quality options.",
-            font=ctk.CTkFont(size=13, family="Segoe UI"),
-            text_color=(current_colors['text_secondary'], current_colors['text_secondary']),
+            font=self._font(13),
+            text_color=current_colors['text_secondary'],
             justify="left"
         )
+        self._register(welcome_desc, text_color=('text_secondary', 'text_secondary'))
         welcome_desc.pack(anchor="w")
 
     def restore_tasks_from_config(self):
-        """Restore number of tasks and their URLs from config"""
+        """Queue saved tasks for restoration; they are created one per idle tick after first paint"""
+        self._restoring_tasks = True
+        pending = deque()
         try:
-            self._restoring_tasks = True
             tasks_data = self.config.get("tasks", []) or []
 
             if tasks_data:
                 # New structured storage path
-                for item in tasks_data:
-                    try:
-                        url_value = (item.get("url") or "").strip()
-                        fmt_value = (item.get("format") or self.config.get("default_format", "audio")).strip()
-                        output_value = item.get("output") or self.config.get("output_directory", self.config.get_default_output_directory())
-
-                        # Extract video/playlist info
-                        video_name = item.get("video_name", "")
-                        playlist_name = item.get("playlist_name", "")
-                        is_playlist = item.get("is_playlist", False)
-
-                        task = self.add_task(url=url_value)
-
-                        # Set video/playlist info
-                        if hasattr(task, 'video_name'):
-                            task.video_name = video_name
-                        if hasattr(task, 'playlist_name'):
-                            task.playlist_name = playlist_name
-                        if hasattr(task, 'is_playlist'):
-                            task.is_playlist = is_playlist
-
-                        # Update subtitle with video/playlist name (skip URL analysis during restoration)
-                        display_name = playlist_name if is_playlist and playlist_name else video_name
-                        if display_name:
-                            task.update_subtitle(display_name)
-                        # Skip URL analysis during restoration to avoid crashes
-                        # elif url_value:
-                        #     if hasattr(task, 'update_video_info'):
-                        #         task.update_video_info(url_value, force=True)
-
-                        try:
-                            task.format_var.set(fmt_value if fmt_value in ("audio", "video") else self.config.get("default_format", "audio"))
-                        except Exception:
-                            pass
-                        try:
-                            if output_value:
-                                task.output_var.set(output_value)
-                        except Exception:
-                            pass
-                    except Exception as e:
-                        # Log error but continue with other tasks
-                        print(f"Error restoring task: {e}")
-                        # Fallback: add an empty task if malformed
-                        try:
-                            self.add_task(url="")
-                        except Exception:
-                            pass
+                pending.extend(tasks_data)
             else:
                 # Backwards compatibility with older settings
                 urls = self.config.get("task_urls", []) or []
@@ -471,44 +759,107 @@ class ModernUI:
                 if count < 1:
                     count = 1
 
-                for i in range(count):
-                    url_value = urls[i] if i < len(urls) else ""
-                    try:
-                        self.add_task(url=url_value)
-                    except Exception as e:
-                        print(f"Error adding task {i}: {e}")
-                        try:
-                            self.add_task(url="")
-                        except Exception:
-                            pass
+                # Pad missing URLs with empty tasks; extra saved URLs beyond count are ignored
+                for _, url_value in zip_longest(range(count), urls[:count], fillvalue=""):
+                    pending.append({"url": url_value or ""})
         except Exception as e:
             # Critical error in restoration - log and continue with empty task
             print(f"Critical error during task restoration: {e}")
+
+        if not pending:
+            pending.append({})
+        self._restore_queue = pending
+        self.root.after_idle(self._restore_next_task)
+
+    def _restore_next_task(self):
+        """Restore one queued task, then yield back to the event loop until the queue is empty"""
+        try:
+            if self._restore_queue:
+                self._restore_task(self._restore_queue.popleft())
+            if self._restore_queue:
+                self.root.after_idle(self._restore_next_task)
+            else:
+                self._finish_task_restoration()
+        except Exception as e:
+            # Window may have been destroyed while restoration was still queued
+            print(f"Error during task restoration: {e}")
+
+    def _restore_task(self, item):
+        """Create a single task from its saved settings"""
+        try:
+            url_value = (item.get("url") or "").strip()
+            fmt_value = (item.get("format") or self.config.get("default_format", "audio")).strip()
+            output_value = item.get("output") or self.config.get("output_directory", self.config.get_default_output_directory())
+
+            # Extract video/playlist info
+            video_name = item.get("video_name", "")
+            playlist_name = item.get("playlist_name", "")
+            is_playlist = item.get("is_playlist", False)
+
+            task = self.add_task(url=url_value)
+
+            # Set video/playlist info
+            if hasattr(task, 'video_name'):
+                task.video_name = video_name
+            if hasattr(task, 'playlist_name'):
+                task.playlist_name = playlist_name
+            if hasattr(task, 'is_playlist'):
+                task.is_playlist = is_playlist
+
+            # Update subtitle with video/playlist name (skip URL analysis during restoration)
+            display_name = playlist_name if is_playlist and playlist_name else video_name
+            if display_name:
+                task.update_subtitle(display_name)
+
+            try:
+                task.format_var.set(fmt_value if fmt_value in ("audio", "video") else self.config.get("default_format", "audio"))
+            except Exception:
+                pass
+            try:
+                if output_value:
+                    task.output_var.set(output_value)
+            except Exception:
+                pass
+        except Exception as e:
+            # Log error but continue with other tasks
+            print(f"Error restoring task: {e}")
+            # Fallback: add an empty task if malformed
             try:
                 self.add_task(url="")
             except Exception:
                 pass
-        finally:
-            self._restoring_tasks = False
 
-            # Apply deferred operations after all tasks are created for better performance
-            if tasks_data:
-                try:
-                    # Batch apply colors and bindings to all tasks
-                    for task in self.tasks:
-                        try:
-                            task.finalize_gui_setup()  # Finalize GUI setup first
-                            task.update_colors()
-                            self._attach_task_bindings(task)
-                        except Exception as e:
-                            print(f"Error applying deferred operations to task: {e}")
-                except Exception as e:
-                    print(f"Error during deferred task operations: {e}")
+    def _finish_task_restoration(self):
+        """Apply the deferred per-task setup once every queued task exists"""
+        self._restoring_tasks = False
 
-            # Don't persist immediately after restore to avoid overwriting restored data
+        # Unmap the task container while every task frame is packed into it, so Tk
+        # computes the layout once when it is shown again instead of once per task
+        container = self.tasks_list_frame
+        try:
+            container.pack_forget()
+        except Exception:
+            container = None
+
+        # Batch apply colors and bindings to all tasks
+        for task in self.tasks:
+            try:
+                task.finalize_gui_setup()  # Finalize GUI setup first
+                task.update_colors()
+                self._attach_task_bindings(task)
+            except Exception as e:
+                print(f"Error applying deferred operations to task: {e}")
+
+        if container is not None:
+            container.pack(fill="both", expand=True, padx=25, pady=(15, 25))
+
+        # Don't persist immediately after restore to avoid overwriting restored data
 
     def _attach_task_bindings(self, task):
         """Attach listeners to task inputs for persistence"""
+        # Recycled tasks keep the traces attached when they were first added
+        if task._bindings_attached:
+            return
         try:
             # Create a closure that captures the task reference
             def make_url_callback(t):
@@ -523,23 +874,73 @@ class ModernUI:
             task.url_var.trace_add("write", make_url_callback(task))
             task.output_var.trace_add("write", make_output_callback(task))
             task.format_var.trace_add("write", make_format_callback(task))
+            task._bindings_attached = True
         except Exception:
             pass
 
     def _on_task_changed(self, task, change_type):
         """Handle changes to task variables"""
-        if getattr(self, '_restoring_tasks', False):
+        if self._restoring_tasks or self._silenced:
             return
 
-        # Update video info if URL changed
+        # Update video info only if the URL actually changed since the last analysis
         if change_type == "url":
             url = task.get_url()
-            if url and hasattr(task, 'update_video_info'):
-                task.update_video_info(url, force=True)
+            if url and url != task._last_analyzed_url:
+                self._schedule_video_info(task)
 
         # Schedule persistence for all changes
+        self._dirty_tasks.add(task)
         self._schedule_persist_tasks()
 
+    def _schedule_video_info(self, task):
+        """Refresh a task's video info once its URL has stopped changing for 500 ms"""
+        if task._info_after_id is not None:
+            try:
+                self.root.after_cancel(task._info_after_id)
+            except Exception:
+                pass
+        task._info_after_id = self.root.after(500, lambda: self._refresh_video_info(task))
+
+    def _refresh_video_info(self, task):
+        """Run a debounced video info refresh for a task"""
+        task._info_after_id = None
+        url = task.get_url()
+        if url and url != task._last_analyzed_url:
+            self._queue_video_info(task, url)
+
+    def _queue_video_info(self, task, url):
+        """Queue a background video info lookup for a task's URL"""
+        # Only the latest URL queued for a task is applied; older lookups are dropped
+        task._last_analyzed_url = url
+        self._metadata_queue.put((task, url))
+
+    def _metadata_worker(self):
+        """Fetch queued video info off the UI thread and hand results back to it"""
+        while True:
+            task, url = self._metadata_queue.get()
+            if task._last_analyzed_url != url:
+                continue
+            try:
+                info = task.analyze_url_and_extract_info(url)
+            except Exception as e:
+                print(f"Error updating video info for {url}: {e}")
+                continue
+            try:
+                self.root.after(0, lambda t=task, u=url, i=info: self._apply_video_info(t, u, i))
+            except Exception:
+                # Main loop is gone
+                break
+
+    def _apply_video_info(self, task, url, info):
+        """Show fetched video info on a task if its URL hasn't changed since"""
+        if task._last_analyzed_url != url or not task._is_alive():
+            return
+        task.apply_info(*info)
+        if task._idx is not None:
+            self._dirty_tasks.add(task)
+            self._schedule_persist_tasks()
+
     def _schedule_persist_tasks(self):
         try:
             if self._persist_after_id is not None:
@@ -547,43 +948,80 @@ class ModernUI:
                     self.root.after_cancel(self._persist_after_id)
                 except Exception:
                     pass
+                # Changes keep arriving: back off further, up to a second
+                self._persist_delay = min(self._persist_delay + 100, 1000)
             # Debounce saves to avoid excessive disk writes
-            self._persist_after_id = self.root.after(300, self._persist_tasks_to_config)
+            self._persist_after_id = self.root.after(self._persist_delay, self._persist_tasks_to_config)
         except Exception:
             # Fallback to immediate persist
             self._persist_tasks_to_config()
 
+    def _build_task_row(self, t):
+        """Snapshot a single task's persisted fields, in _TASK_FIELDS order"""
+        try:
+            format_var, output_var = self._task_vars(t)
+            return (t.get_url(), format_var.get(), output_var.get()) + self._task_info(t)
+        except Exception:
+            return (
+                "",
+                self.config.get("default_format", "audio"),
+                self.config.get("output_directory", self.config.get_default_output_directory()),
+                "",
+                "",
+                False
+            )
+
     def _persist_tasks_to_config(self):
         """Save current tasks count and URLs to config"""
+        # A partially restored task list must never overwrite the saved one
+        if self._restoring_tasks:
+            return
+        self._persist_after_id = None
+        self._persist_delay = 300
         try:
+            # Refresh only the fields of tasks that changed since the last save
+            state = self._task_state
+            columns = [state[field] for field in self._TASK_FIELDS]
+            for t in self._dirty_tasks:
+                idx = t._idx
+                for column, value in zip(columns, self._build_task_row(t)):
+                    column[idx] = value
+            self._dirty_tasks.clear()
+
             # Build structured tasks array
-            tasks_array = []
-            for t in getattr(self, 'tasks', []):
-                try:
-                    tasks_array.append({
-                        "url": t.get_url(),
-                        "format": t.format_var.get() if hasattr(t, 'format_var') else self.config.get("default_format", "audio"),
-                        "output": t.output_var.get() if hasattr(t, 'output_var') else self.config.get("output_directory", self.config.get_default_output_directory()),
-                        "video_name": getattr(t, 'video_name', ""),
-                        "playlist_name": getattr(t, 'playlist_name', ""),
-                        "is_playlist": getattr(t, 'is_playlist', False)
-                    })
-                except Exception:
-                    tasks_array.append({
-                        "url": "",
-                        "format": self.config.get("default_format", "audio"),
-                        "output": self.config.get("output_directory", self.config.get_default_output_directory()),
-                        "video_name": "",
-                        "playlist_name": "",
-                        "is_playlist": False
-                    })
+            fields = self._TASK_FIELDS
+            tasks_array = [dict(zip(fields, values)) for values in zip(*columns)]
 
             # Store new structure
             self.config.settings["tasks"] = tasks_array
             # Maintain backwards-compatible fields
-            self.config.settings["task_urls"] = [t.get("url", "") for t in tasks_array]
+            self.config.settings["task_urls"] = list(state["url"])
             self.config.settings["tasks_count"] = len(tasks_array)
+            self._queue_settings_save()
+        except Exception:
+            pass
+
+    def _queue_settings_save(self):
+        """Ask the writer thread to save the settings; at most one request is pending"""
+        try:
+            self._save_queue.put_nowait(True)
+        except queue.Full:
+            pass
+
+    def _save_worker(self):
+        """Write the settings to disk off the UI thread whenever a save is requested"""
+        while True:
+            if self._save_queue.get() is None:
+                break
+            # The current settings are taken when the file is written, not when the save was
+            # requested, so an older copy can never overwrite a newer synchronous save
             self.config.save_settings()
+
+    def _flush_pending_save(self):
+        """Wait for the writer thread to finish a pending save, then stop it"""
+        try:
+            self._save_queue.put(None, timeout=5)
+            self._save_thread.join(timeout=5)
         except Exception:
             pass
 
@@ -596,6 +1034,7 @@ class ModernUI:
             fg_color=(current_colors['surface'], current_colors['surface_light']),
             corner_radius=0
         )
+        self._register(header_frame, fg_color=('surface', 'surface_light'))
         header_frame.pack(fill="x", padx=0, pady=(0, 20))
 
         # Create inner header with padding
@@ -620,7 +1059,7 @@ class ModernUI:
         self.logo_label = ctk.CTkLabel(
             self.title_frame,
             text="🎬",
-            font=ctk.CTkFont(size=32, weight="bold")
+            font=self._font(32, "bold", family=None)
         )
         self.logo_label.pack(side="left", padx=(0, 10))
 
@@ -628,18 +1067,20 @@ class ModernUI:
         self.title_label = ctk.CTkLabel(
             self.title_frame,
             text="YouTube Media Downloader",
-            font=ctk.CTkFont(size=28, weight="bold", family="Segoe UI"),
-            text_color=(current_colors['text_primary'], current_colors['text_primary'])
+            font=self._font(28, "bold"),
+            text_color=current_colors['text_primary']
         )
+        self._register(self.title_label, text_color=('text_primary', 'text_primary'))
         self.title_label.pack(side="left")
 
         # Subtitle
         self.subtitle_label = ctk.CTkLabel(
             self.title_frame,
             text="Professional media extraction tool",
-            font=ctk.CTkFont(size=12, family="Segoe UI"),
-            text_color=(current_colors['text_secondary'], current_colors['text_secondary'])
+            font=self._font(12),
+            text_color=current_colors['text_secondary']
         )
+        self._register(self.subtitle_label, text_color=('text_secondary', 'text_secondary'))
         self.subtitle_label.pack(side="left", padx=(15, 0))
 
         # Right section: Action buttons
@@ -662,12 +1103,14 @@ class ModernUI:
             command=self.toggle_theme,
             fg_color=(current_colors['surface_light'], current_colors['surface']),
             hover_color=(current_colors['primary'], current_colors['primary_hover']),
-            text_color=(current_colors['text_primary'], current_colors['text_primary']),
-            font=ctk.CTkFont(size=20),
+            text_color=current_colors['text_primary'],
+            font=self._font(20, family=None),
             corner_radius=12,
             border_width=2,
-            border_color=(current_colors['border'], current_colors['border'])
+            border_color=current_colors['border']
         )
+        # text_color is set by update_theme_button
+        self._register(self.theme_button, fg_color=('surface_light', 'surface'), hover_color=('primary', 'primary_hover'), border_color=('border', 'border'))
         self.theme_button.pack(side="left", padx=(0, 10))
 
         # Import button with modern styling
@@ -677,12 +1120,13 @@ class ModernUI:
             width=140,
             height=45,
             command=self.show_import_dialog,
-            fg_color=(current_colors['secondary'], current_colors['secondary']),
-            hover_color=(current_colors['secondary'], current_colors['secondary']),
-            text_color=(current_colors['text_primary'], current_colors['text_primary']),
-            font=ctk.CTkFont(size=14, weight="bold", family="Segoe UI"),
+            fg_color=current_colors['secondary'],
+            hover_color=current_colors['secondary'],
+            text_color=current_colors['text_primary'],
+            font=self._font(14, "bold"),
             corner_radius=12
         )
+        self._register(self.import_button, fg_color=('secondary', 'secondary'), hover_color=('secondary', 'secondary'), text_color=('text_primary', 'text_primary'))
         self.import_button.pack(side="left")
 
         # Add hover animations
@@ -690,41 +1134,42 @@ class ModernUI:
 
     def _setup_hover_animations(self):
         """Setup smooth hover animations for interactive elements"""
-        current_colors = self.get_current_colors()
-
         # Theme button hover effect
-        def theme_hover_in(e):
-            current_colors = self.get_current_colors()
-            self.theme_button.configure(
-                fg_color=(current_colors['primary'], current_colors['primary_hover']),
-                border_color=(current_colors['primary'], current_colors['primary_hover'])
-            )
+        self._bind_hover(
+            self.theme_button,
+            normal={'fg_color': ('surface_light', 'surface'), 'border_color': ('border', 'border')},
+            hover={'fg_color': ('primary', 'primary_hover'), 'border_color': ('primary', 'primary_hover')}
+        )
 
-        def theme_hover_out(e):
-            current_colors = self.get_current_colors()
-            self.theme_button.configure(
-                fg_color=(current_colors['surface_light'], current_colors['surface']),
-                border_color=(current_colors['border'], current_colors['border'])
-            )
+        # Import button hover effect (already styled)
+        self._bind_hover(
+            self.import_button,
+            normal={'fg_color': ('secondary', 'secondary')},
+            hover={'fg_color': ('accent', 'accent')}
+        )
 
-        self.theme_button.bind("<Enter>", theme_hover_in)
-        self.theme_button.bind("<Leave>", theme_hover_out)
+    def _register(self, widget, **roles):
+        """Remember which palette keys a widget's color options use so toggle_theme can recolor it"""
+        self._themable_widgets.append((widget, roles))
 
-        # Import button hover effect (already styled)
-        def import_hover_in(e):
-            current_colors = self.get_current_colors()
-            self.import_button.configure(
-                fg_color=(current_colors['accent'], current_colors['accent'])
-            )
+    def _restyle_widgets(self, colors):
+        """Recolor every registered widget from the palette in one pass"""
+        for widget, roles in self._themable_widgets:
+            try:
+                widget.configure(**{option: colors[light] if light == dark else (colors[light], colors[dark])
+                                    for option, (light, dark) in roles.items()})
+            except Exception:
+                pass
 
-        def import_hover_out(e):
+    def _bind_hover(self, button, normal, hover):
+        """Swap button colors on mouse enter/leave; specs map an option to (light, dark) palette keys"""
+        def apply(spec):
             current_colors = self.get_current_colors()
-            self.import_button.configure(
-                fg_color=(current_colors['secondary'], current_colors['secondary'])
-            )
+            button.configure(**{option: current_colors[light] if light == dark else (current_colors[light], current_colors[dark])
+                                for option, (light, dark) in spec.items()})
 
-        self.import_button.bind("<Enter>", import_hover_in)
-        self.import_button.bind("<Leave>", import_hover_out)
+        button.bind("<Enter>", lambda e: apply(hover))
+        button.bind("<Leave>", lambda e: apply(normal))
 
     def show_import_dialog(self):
         """Show a modal dialog to import files from one directory to another."""
@@ -786,7 +1231,7 @@ class ModernUI:
 
         # Filename similarity option
         name_sim_var = ctk.BooleanVar(value=False)
-        name_sim_chk = ctk.CTkCheckBox(dup_row, text="Skip if filename similarity >= (%)", variable=name_sim_var)
+        name_sim_chk = ctk.CTkCheckBox(dup_row, text="Skip if name matches any existing file >= (%)", variable=name_sim_var)
         name_sim_chk.pack(side="left")
         name_thresh_var = ctk.StringVar(value="70")
         name_thresh_entry = ctk.CTkEntry(dup_row, textvariable=name_thresh_var, width=60, height=28)
@@ -800,6 +1245,12 @@ class ModernUI:
         content_secs_entry = ctk.CTkEntry(dup_row, textvariable=content_secs_var, width=60, height=28)
         content_secs_entry.pack(side="left", padx=(8, 0))
 
+        # Reject anything but a plain non-negative number as it is typed (ASCII digits only;
+        # isdigit() alone also accepts characters such as "²" that float() rejects)
+        vcmd_number = (dialog.register(lambda P: P == "" or (P.isascii() and P.replace(".", "", 1).isdigit())), "%P")
+        name_thresh_entry.configure(validate="key", validatecommand=vcmd_number)
+        content_secs_entry.configure(validate="key", validatecommand=vcmd_number)
+
         # Initialize entry states (disabled until checked)
         name_thresh_entry.configure(state="disabled")
         content_secs_entry.configure(state="disabled")
@@ -839,14 +1290,18 @@ class ModernUI:
         prog_label = ctk.CTkLabel(container, text="")
         prog_label.pack(anchor="w", pady=(6, 0))
 
-        log_box = ctk.CTkTextbox(container, height=140, font=ctk.CTkFont(size=11, family="Consolas"))
+        # Read-only log without an undo stack; inserts are bracketed by enabling it briefly
+        log_box = ctk.CTkTextbox(container, height=140, font=self._font(11, family="Consolas"),
+                                 undo=False, autoseparators=False, maxundo=0, state="disabled")
         log_box.pack(fill="both", expand=True, pady=(8, 8))
 
         # Buttons row
         btn_row = ctk.CTkFrame(container, fg_color="transparent")
         btn_row.pack(fill="x", pady=(4, 0))
         # Shared state for undo
-        import_state = {"actions": [], "backup_root": None}
+        import_state = {"actions": [], "backup_root": None, "output_dir": None, "future": None, "cancel": False}
+        # Shutdown cancels a running import and drops its backups through this reference
+        self._import_state = import_state
 
         start_btn = ctk.CTkButton(btn_row, text="Start Import", height=34,
                                   command=lambda: self._start_import_worker(
@@ -867,15 +1322,37 @@ class ModernUI:
                                  command=lambda: self._start_undo_worker(dialog, prog, prog_label, log_box, undo_btn, start_btn, import_state))
         undo_btn.pack(side="left", padx=(8, 0))
         close_btn = ctk.CTkButton(btn_row, text="Close", height=34, fg_color=("gray70", "gray30"), hover_color=("gray60", "gray40"),
-                                  command=lambda: self._close_dialog_safe(dialog))
+                                  command=lambda: self._close_dialog_safe(dialog, import_state))
         close_btn.pack(side="right")
-
-    def _close_dialog_safe(self, dialog):
+        dialog.protocol("WM_DELETE_WINDOW", lambda: self._close_dialog_safe(dialog, import_state))
+
+    def _close_dialog_safe(self, dialog, import_state=None):
+        if import_state is not None:
+            # The worker is still writing into the backup directory; removing it now would
+            # orphan whatever the worker recreates and lose the undo data
+            future = import_state.get("future")
+            if future is not None and not future.done():
+                try:
+                    messagebox.showwarning("Import", "Please wait for the running import or undo to finish.", parent=dialog)
+                except Exception:
+                    pass
+                return
+            # The last import can't be undone once the dialog is gone
+            self._discard_import_backup(import_state)
+            if self._import_state is import_state:
+                self._import_state = None
         try:
             dialog.destroy()
         except Exception:
             pass
 
+    def _discard_import_backup(self, import_state):
+        """Delete the originals kept for undoing overwrites of the last import"""
+        backup_root = import_state.get("backup_root")
+        import_state["backup_root"] = None
+        if backup_root:
+            shutil.rmtree(backup_root, ignore_errors=True)
+
     def _browse_dir_into_var(self, var, title="Select Directory"):
         try:
             directory = filedialog.askdirectory(title=title, initialdir=var.get() or self.config.get("output_directory", self.config.get_default_output_directory()))
@@ -884,6 +1361,55 @@ class ModernUI:
         except Exception:
             pass
 
+    def _make_dialog_reporters(self):
+        """Build thread-safe log/status/progress callbacks for an import or undo worker"""
+        # Every update goes through one queue that _drain_dialog_events applies in batches
+        events = queue.Queue()
+
+        def log(msg):
+            events.put(("log", msg))
+
+        def set_status(text):
+            events.put(("status", text))
+
+        def set_progress(value):
+            events.put(("progress", value))
+
+        return log, set_status, set_progress, events
+
+    def _drain_dialog_events(self, prog, prog_label, log_box, events, future):
+        """Apply queued worker updates every 100 ms until the worker ends"""
+        # Only the latest status and progress matter; log lines are joined into one insert
+        lines = []
+        status = None
+        progress = None
+        while True:
+            try:
+                kind, value = events.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "log":
+                lines.append(value)
+            elif kind == "status":
+                status = value
+            else:
+                progress = value
+        try:
+            if lines:
+                log_box.configure(state="normal")
+                log_box.insert("end", "\n".join(lines) + "\n")
+                log_box.configure(state="disabled")
+                log_box.see("end")
+            if status is not None:
+                prog_label.configure(text=status)
+            if progress is not None:
+                prog.set(progress)
+        except Exception:
+            # Dialog was closed
+            return
+        if not future.done() or not events.empty():
+            self.root.after(100, lambda: self._drain_dialog_events(prog, prog_label, log_box, events, future))
+
     def _start_import_worker(self, dialog, input_dir, output_dir, override_existing,
                              use_name_similarity, name_threshold_str,
                              use_content_similarity, content_seconds_str,
@@ -910,9 +1436,10 @@ class ModernUI:
 
         # Persist last used settings
         try:
-            self.config.set("last_import_input_dir", input_dir)
-            self.config.set("last_import_output_dir", output_dir)
-            self.config.set("import_override_existing", bool(override_existing))
+            with self.config.batch():
+                self.config.set("last_import_input_dir", input_dir)
+                self.config.set("last_import_output_dir", output_dir)
+                self.config.set("import_override_existing", bool(override_existing))
         except Exception:
             pass
 
@@ -924,27 +1451,23 @@ class ModernUI:
                 pass
             return
 
-        # Parse thresholds
-        name_threshold = None
-        content_seconds = None
+        # Parse thresholds; the entries filter keystrokes, but a bad value still gets the message below
         try:
-            if use_name_similarity:
-                name_threshold = float(name_threshold_str)
-                if name_threshold < 0 or name_threshold > 100:
-                    raise ValueError()
-        except Exception:
+            name_threshold = float(name_threshold_str) if use_name_similarity and name_threshold_str else None
+        except ValueError:
+            name_threshold = None
+        try:
+            content_seconds = float(content_seconds_str) if use_content_similarity and content_seconds_str else None
+        except ValueError:
+            content_seconds = None
+        if use_name_similarity and (name_threshold is None or name_threshold < 0 or name_threshold > 100):
             try:
                 messagebox.showerror("Import", "Please enter a valid filename similarity percentage (0-100).")
             except Exception:
                 pass
             return
 
-        try:
-            if use_content_similarity:
-                content_seconds = float(content_seconds_str)
-                if content_seconds <= 0 or content_seconds > 3600:
-                    raise ValueError()
-        except Exception:
+        if use_content_similarity and (content_seconds is None or content_seconds <= 0 or content_seconds > 3600):
             try:
                 messagebox.showerror("Import", "Please enter a valid number of seconds (1-3600) for content match.")
             except Exception:
@@ -968,136 +1491,241 @@ class ModernUI:
         except Exception:
             pass
 
-        def log(msg):
-            try:
-                log_box.insert("end", f"{msg}\n")
-                log_box.see("end")
-            except Exception:
-                pass
-
-        def set_status(text):
-            try:
-                prog_label.configure(text=text)
-            except Exception:
-                pass
+        log, set_status, set_progress, events = self._make_dialog_reporters()
 
-        def set_progress(value):
-            try:
-                prog.set(value)
-            except Exception:
-                pass
+        # rapidfuzz is optional; both scorers return a 0-100 similarity and only report a
+        # stem reaching the cutoff. rapidfuzz skips hopeless candidates in C; the difflib
+        # fallback checks SequenceMatcher's cheap upper bounds before the full ratio
+        try:
+            from rapidfuzz import fuzz, process
+
+            def best_match(name, stems, cutoff):
+                match = process.extractOne(name, stems, scorer=fuzz.ratio, score_cutoff=cutoff)
+                return match[1] if match else None
+        except ImportError:
+            import difflib
+
+            def best_match(name, stems, cutoff):
+                matcher = difflib.SequenceMatcher()
+                matcher.set_seq2(name)
+                cutoff /= 100.0
+                for stem in stems:
+                    matcher.set_seq1(stem)
+                    if (matcher.real_quick_ratio() >= cutoff and matcher.quick_ratio() >= cutoff
+                            and matcher.ratio() >= cutoff):
+                        return matcher.ratio() * 100.0
+                return None
+
+        # Per destination directory: lowercased stems of the files that were already there
+        # (files this import copies in are not added, so numbered series are not collapsed)
+        sibling_stems = {}
+
+        def _sibling_stems(dst_dir):
+            stems = sibling_stems.get(dst_dir)
+            if stems is None:
+                stems = sibling_stems[dst_dir] = []
+                try:
+                    with os.scandir(dst_dir) as it:
+                        for entry in it:
+                            if entry.is_file():
+                                stems.append(os.path.splitext(entry.name)[0].lower())
+                except OSError:
+                    pass
+            return stems
 
-        def _filenames_similar(src_path, dst_path, threshold_percent):
+        def _filenames_similar(src_name, dst_dir, threshold_percent):
+            """Compare src_name with the files in dst_dir, returning (similar, ratio)"""
             try:
-                src_name = os.path.splitext(os.path.basename(src_path))[0]
-                dst_name = os.path.splitext(os.path.basename(dst_path))[0]
-                ratio = difflib.SequenceMatcher(None, src_name.lower(), dst_name.lower()).ratio() * 100.0
-                return ratio >= threshold_percent, ratio
+                ratio = best_match(src_name, _sibling_stems(dst_dir), threshold_percent)
+                return (True, ratio) if ratio is not None else (False, 0.0)
             except Exception:
                 return False, 0.0
 
-        def _content_similar(src_path, dst_path, seconds):
+        def _content_similar(src_path, dst_path, seconds, src_stat):
             try:
                 # Compare first N bytes proportional to seconds as a heuristic when duration unknown.
                 # Read a fixed byte window per second (e.g., 256KB/s) capped at 8MB
                 bytes_per_sec = 262144  # 256 KB
                 max_bytes = int(min(8 * 1024 * 1024, max(1, seconds) * bytes_per_sec))
-                size_src = os.path.getsize(src_path) if os.path.exists(src_path) else 0
-                size_dst = os.path.getsize(dst_path) if os.path.exists(dst_path) else 0
+                try:
+                    dst_stat = os.stat(dst_path)
+                except OSError:
+                    return False
+                size_src = src_stat.st_size if src_stat is not None else 0
+                size_dst = dst_stat.st_size
                 if size_src == 0 or size_dst == 0:
                     return False
-                to_read = min(max_bytes, size_src, size_dst)
-                with open(src_path, 'rb') as f1, open(dst_path, 'rb') as f2:
-                    chunk1 = f1.read(to_read)
-                    chunk2 = f2.read(to_read)
-                if not chunk1 or not chunk2:
+                # Duplicates share their byte length; skip reading files that can't match
+                if size_src != size_dst:
                     return False
-                # Use a quick hash-based check
-                import hashlib
-                h1 = hashlib.blake2s(chunk1, digest_size=16).digest()
-                h2 = hashlib.blake2s(chunk2, digest_size=16).digest()
-                return h1 == h2
+                to_read = min(max_bytes, size_src, size_dst)
+                # Signatures are cached, so repeated imports of unchanged files skip the reads.
+                # src is read here at most once per version; a following overwrite copies it
+                # in the kernel from the page cache this read just warmed
+                src_sig = _head_signature(src_path, src_stat.st_mtime_ns, size_src, to_read)
+                dst_sig = _head_signature(dst_path, dst_stat.st_mtime_ns, size_dst, to_read)
+                return bin(src_sig ^ dst_sig).count('1') <= _SIGNATURE_MAX_DISTANCE
             except Exception:
                 return False
 
+        abs_output = os.path.abspath(output_dir)
+
+        def _scan_files(src_dir, dest_dir, rel_dir=""):
+            """Yield (src, dst, path relative to both roots, stat or None, lowercased stem) for every file below src_dir"""
+            # scandir entries carry their type, so each file needs only its own stat call
+            try:
+                with os.scandir(src_dir) as it:
+                    entries = list(it)
+            except OSError:
+                return
+            subdirs = []
+            for entry in entries:
+                try:
+                    if entry.is_dir():
+                        # Like os.walk, don't descend into symlinked directories; also skip an
+                        # output directory nested in the input, which fills up while we scan
+                        if not entry.is_symlink() and os.path.abspath(entry.path) != abs_output:
+                            subdirs.append(entry)
+                        continue
+                except OSError:
+                    pass
+                try:
+                    src_stat = entry.stat()
+                except OSError:
+                    src_stat = None
+                # Lowercased stem, compared against existing names by _filenames_similar
+                src_name = os.path.splitext(entry.name)[0].lower()
+                yield entry.path, os.path.join(dest_dir, entry.name), os.path.join(rel_dir, entry.name), src_stat, src_name
+            for entry in subdirs:
+                yield from _scan_files(entry.path, os.path.join(dest_dir, entry.name), os.path.join(rel_dir, entry.name))
+
         def worker():
             try:
-                # Collect files to copy (recursive)
-                files = []
-                for root, _, filenames in os.walk(input_dir):
-                    for name in filenames:
-                        src_path = os.path.join(root, name)
-                        rel = os.path.relpath(src_path, input_dir)
-                        dest_path = os.path.join(output_dir, rel)
-                        files.append((src_path, dest_path))
-
-                total = len(files)
+                # Files to copy are streamed from the scan, so copying starts right away;
+                # the total is only known once the scan is exhausted
+                files = _scan_files(input_dir, output_dir)
+                total = None
                 copied = 0
                 skipped = 0
                 errors = 0
 
-                if total == 0:
-                    set_status("No files found in input directory")
-                    return
-
-                set_status(f"Preparing to import {total} file(s)...")
+                set_status("Scanning input directory...")
+                if use_name_similarity and name_threshold is not None:
+                    log(f"Name similarity: each file is compared with every file already in its target folder (>= {name_threshold:.1f}% skips it)")
 
-                # Prepare backup directory for overwritten files
-                backup_root = None
+                # Prepare backup directory for overwritten files; it lives in the output
+                # directory so originals can be hardlinked, and is created on first use
+                self._discard_import_backup(import_state)
                 import_state["actions"] = []
-                import_state["backup_root"] = None
+                import_state["output_dir"] = abs_output
+                backup_root = os.path.join(output_dir, time.strftime(_IMPORT_BACKUP_PREFIX + "%Y%m%d-%H%M%S"))
+                import_state["backup_root"] = backup_root
 
-                for idx, (src, dst) in enumerate(files, start=1):
+                def report_progress():
+                    done = copied + skipped + errors
                     try:
-                        # Make sure destination directory exists
-                        os.makedirs(os.path.dirname(dst), exist_ok=True)
+                        if total is None:
+                            if done % 10 == 0:
+                                set_status(f"Scanning... imported {copied}, skipped {skipped}, errors {errors} ({done} so far)")
+                            return
+                        set_progress(done / total)
+                        if done % 10 == 0 or done == total:
+                            set_status(f"Imported {copied}, skipped {skipped}, errors {errors} ({done}/{total})")
+                    except Exception:
+                        pass
 
-                        if os.path.exists(dst):
-                            # Similarity-based duplicate checks
+                # Copies are I/O-bound and independent, so they run on a thread pool; the
+                # duplicate checks and all bookkeeping stay on this thread
+                pending = {}
+                made_dirs = set()
+                with ThreadPoolExecutor(max_workers=min(8, (os.cpu_count() or 1) * 2)) as executor:
+                    seen = 0
+                    for src, dst, rel, src_stat, src_name in files:
+                        if import_state.get("cancel"):
+                            log("Import cancelled; finishing copies already started")
+                            break
+                        seen += 1
+                        try:
+                            # Make sure destination directory exists (once per directory)
+                            dst_dir = os.path.dirname(dst)
+                            if dst_dir not in made_dirs:
+                                os.makedirs(dst_dir, exist_ok=True)
+                                made_dirs.add(dst_dir)
+
+                            # Similarity-based duplicate checks; names are compared with every
+                            # file already in the target directory, not just the same name
                             if use_name_similarity and name_threshold is not None:
-                                similar, ratio = _filenames_similar(src, dst, name_threshold)
+                                similar, ratio = _filenames_similar(src_name, dst_dir, name_threshold)
                                 if similar:
                                     skipped += 1
-                                    log(f"Skipped by name similarity ({ratio:.1f}% >= {name_threshold:.1f}%): {os.path.relpath(dst, output_dir)}")
+                                    log(f"Skipped by name similarity ({ratio:.1f}% >= {name_threshold:.1f}%): {rel}")
                                     continue
-                            if use_content_similarity and content_seconds is not None:
-                                try:
-                                    if _content_similar(src, dst, content_seconds):
-                                        skipped += 1
-                                        log(f"Skipped by content similarity (first {int(content_seconds)}s match): {os.path.relpath(dst, output_dir)}")
-                                        continue
-                                except Exception as e:
-                                    log(f"Content similarity check error, proceeding: {e}")
-                            if override_existing:
-                                import shutil
-                                # Overwrite without creating backups per user preference
-                                shutil.copy2(src, dst)
-                                # Track overwrite (no backup available to restore)
-                                import_state["actions"].append(("overwritten", dst, None))
-                                copied += 1
-                                log(f"Overwritten: {os.path.relpath(dst, output_dir)}")
+
+                            # Atomically claim new destinations; an existing file makes this fail
+                            try:
+                                dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0), 0o666)
+                            except FileExistsError:
+                                dst_fd = None
+
+                            if dst_fd is None:
+                                if use_content_similarity and content_seconds is not None:
+                                    try:
+                                        if _content_similar(src, dst, content_seconds, src_stat):
+                                            skipped += 1
+                                            log(f"Skipped by content similarity (first {int(content_seconds)}s match): {rel}")
+                                            continue
+                                    except Exception as e:
+                                        log(f"Content similarity check error, proceeding: {e}")
+                                if override_existing:
+                                    # Keep the original in the backup directory so undo can restore it
+                                    backup = os.path.join(backup_root, rel)
+                                    pending[executor.submit(_replace_with_backup, src, dst, backup)] = ("overwritten", src, dst, rel)
+                                else:
+                                    # Prioritize existing output file; skip duplicate
+                                    skipped += 1
+                                    log(f"Skipped (exists): {rel}")
+                            else:
+                                pending[executor.submit(_copy_file, src, dst, dst_fd)] = ("created", src, dst, rel)
+                        except Exception as e:
+                            errors += 1
+                            log(f"Error copying {src} -> {dst}: {e}")
+                        finally:
+                            report_progress()
+
+                    total = seen
+                    if total == 0:
+                        set_status("No files found in input directory")
+                        return
+                    report_progress()
+
+                    for future in as_completed(pending):
+                        kind, src, dst, rel = pending[future]
+                        try:
+                            future.result()
+                            if kind == "overwritten":
+                                # Track overwrite with the backup undo restores from
+                                import_state["actions"].append(("overwritten", dst, os.path.join(backup_root, rel)))
+                                log(f"Overwritten: {rel}")
                             else:
-                                # Prioritize existing output file; skip duplicate
-                                skipped += 1
-                                log(f"Skipped (exists): {os.path.relpath(dst, output_dir)}")
-                        else:
-                            import shutil
-                            shutil.copy2(src, dst)
-                            # Track creation for undo
-                            import_state["actions"].append(("created", dst))
+                                # Track creation for undo
+                                import_state["actions"].append(("created", dst))
+                                log(f"Copied: {rel}")
                             copied += 1
-                            log(f"Copied: {os.path.relpath(dst, output_dir)}")
-                    except Exception as e:
-                        errors += 1
-                        log(f"Error copying {src} -> {dst}: {e}")
+                        except Exception as e:
+                            errors += 1
+                            log(f"Error copying {src} -> {dst}: {e}")
+                            if kind == "created":
+                                # Don't leave the claimed, partially written file behind
+                                try:
+                                    os.remove(dst)
+                                except OSError:
+                                    pass
+                        report_progress()
 
-                    # Update progress
-                    try:
-                        set_progress(idx / total)
-                        if idx % 10 == 0 or idx == total:
-                            set_status(f"Imported {copied}, skipped {skipped}, errors {errors} ({idx}/{total})")
-                    except Exception:
-                        pass
+                if import_state.get("cancel"):
+                    # The app is closing; nothing will be left to undo this import
+                    self._discard_import_backup(import_state)
+                    return
 
                 # Final status
                 set_status(f"Done. Imported {copied}, skipped {skipped}, errors {errors}.")
@@ -1105,21 +1733,26 @@ class ModernUI:
                     messagebox.showinfo("Import", f"Completed. Imported {copied}, skipped {skipped}, errors {errors}.")
                 except Exception:
                     pass
-            finally:
-                try:
-                    start_btn.configure(state="normal")
-                    # Enable undo if there were any actions to revert
-                    if import_state.get("actions"):
-                        undo_btn.configure(state="normal")
-                    else:
-                        undo_btn.configure(state="disabled")
-                except Exception:
-                    pass
+            except Exception as e:
+                log(f"Import failed: {e}")
+
+        def on_done():
+            try:
+                start_btn.configure(state="normal")
+                # Enable undo if there were any actions to revert
+                if import_state.get("actions"):
+                    undo_btn.configure(state="normal")
+                else:
+                    undo_btn.configure(state="disabled")
+            except Exception:
+                pass
 
         # Run worker in background
         try:
-            th = threading.Thread(target=worker, daemon=True)
-            th.start()
+            future = self._bg_pool.submit(worker)
+            import_state["future"] = future
+            future.add_done_callback(lambda f: self.root.after(0, on_done))
+            self.root.after(100, lambda: self._drain_dialog_events(prog, prog_label, log_box, events, future))
         except Exception as e:
             try:
                 messagebox.showerror("Import", f"Failed to start import: {e}")
@@ -1143,44 +1776,32 @@ class ModernUI:
         except Exception:
             pass
 
-        def log(msg):
-            try:
-                log_box.insert("end", f"{msg}\n")
-                log_box.see("end")
-            except Exception:
-                pass
+        log, set_status, set_progress, events = self._make_dialog_reporters()
 
-        def set_status(text):
-            try:
-                prog_label.configure(text=text)
-            except Exception:
-                pass
+        def remove_empty_dirs(dirs, stop_at):
+            """Remove each emptied directory (and emptied parents below stop_at) once, deepest first"""
+            if not stop_at:
+                return
+            prefix = os.path.join(stop_at, "")
+            candidates = set()
+            for path in dirs:
+                path = os.path.abspath(path)
+                while path.startswith(prefix) and path not in candidates:
+                    candidates.add(path)
+                    path = os.path.dirname(path)
+            for path in sorted(candidates, key=lambda p: -p.count(os.sep)):
+                try:
+                    os.rmdir(path)
+                except OSError:
+                    pass
 
-        def set_progress(value):
-            try:
-                prog.set(value)
-            except Exception:
-                pass
-
-        def safe_rmdir_empty_dirs(path, stop_at):
-            try:
-                path = os.path.abspath(path)
-                stop_at = os.path.abspath(stop_at)
-                while path.startswith(stop_at) and path != stop_at:
-                    try:
-                        os.rmdir(path)
-                    except OSError:
-                        break
-                    path = os.path.dirname(path)
-            except Exception:
-                pass
-
-        def worker():
+        def worker():
             try:
                 total = len(actions)
                 undone = 0
                 errors = 0
                 set_status(f"Undoing last import ({total} action(s))...")
+                emptied_dirs = set()
 
                 # Undo in reverse order
                 for idx, action in enumerate(reversed(actions), start=1):
@@ -1196,13 +1817,16 @@ class ModernUI:
                                 except Exception as e:
                                     errors += 1
                                     log(f"Error removing {dst}: {e}")
-                                # Attempt to clean up empty directories up to dialog's output dir if known
-                                safe_rmdir_empty_dirs(os.path.dirname(dst), stop_at=os.path.dirname(dst))
+                                # Empty directories are cleaned up together once all files are gone
+                                emptied_dirs.add(os.path.dirname(dst))
                         elif action[0] == "overwritten":
                             _, dst, backup_path = action
                             try:
-                                # Without backups, we cannot restore originals; just inform the user
-                                log(f"Cannot restore overwritten file (no backup): {dst}")
+                                if backup_path and os.path.exists(backup_path):
+                                    os.replace(backup_path, dst)
+                                    log(f"Restored overwritten file: {dst}")
+                                else:
+                                    log(f"Cannot restore overwritten file (no backup): {dst}")
                             except Exception as e:
                                 errors += 1
                                 log(f"Error handling overwritten entry {dst}: {e}")
@@ -1216,7 +1840,11 @@ class ModernUI:
                         except Exception:
                             pass
 
-                # No backup root management needed if no backups created
+                remove_empty_dirs(emptied_dirs, import_state.get("output_dir"))
+
+                # Originals have been moved back; drop what is left of the backup directory
+                if backup_root:
+                    shutil.rmtree(backup_root, ignore_errors=True)
 
                 set_status(f"Undo completed. Undone {undone} action(s), errors {errors}.")
                 # Clear state
@@ -1226,16 +1854,21 @@ class ModernUI:
                     messagebox.showinfo("Undo", f"Undo completed. Undone {undone} action(s), errors {errors}.")
                 except Exception:
                     pass
-            finally:
-                try:
-                    start_btn.configure(state="normal")
-                    undo_btn.configure(state="disabled")
-                except Exception:
-                    pass
+            except Exception as e:
+                log(f"Undo failed: {e}")
+
+        def on_done():
+            try:
+                start_btn.configure(state="normal")
+                undo_btn.configure(state="disabled")
+            except Exception:
+                pass
 
         try:
-            th = threading.Thread(target=worker, daemon=True)
-            th.start()
+            future = self._bg_pool.submit(worker)
+            import_state["future"] = future
+            future.add_done_callback(lambda f: self.root.after(0, on_done))
+            self.root.after(100, lambda: self._drain_dialog_events(prog, prog_label, log_box, events, future))
         except Exception as e:
             try:
                 messagebox.showerror("Undo", f"Failed to start undo: {e}")
@@ -1245,14 +1878,20 @@ class ModernUI:
     def create_tasks_section(self, parent):
         """Create the tasks management section with modern card design"""
         current_colors = self.get_current_colors()
+        # Colors used more than once below
+        primary = current_colors['primary']
+        primary_hover = current_colors['primary_hover']
+        secondary = current_colors['secondary']
+        danger = current_colors['danger']
         # Tasks card container
         tasks_card = ctk.CTkFrame(
             parent,
-            fg_color=(current_colors['card'], current_colors['card']),
+            fg_color=current_colors['card'],
             corner_radius=12,
             border_width=1,
-            border_color=(current_colors['border'], current_colors['border'])
+            border_color=current_colors['border']
         )
+        self._register(tasks_card, fg_color=('card', 'card'), border_color=('border', 'border'))
         tasks_card.pack(fill="both", expand=True, pady=(0, 0))
 
         # Tasks header
@@ -1263,18 +1902,20 @@ class ModernUI:
         tasks_title = ctk.CTkLabel(
             tasks_header,
             text="📋 Download Tasks",
-            font=ctk.CTkFont(size=18, weight="bold", family="Segoe UI"),
-            text_color=(current_colors['text_primary'], current_colors['text_primary'])
+            font=self._font(18, "bold"),
+            text_color=current_colors['text_primary']
         )
+        self._register(tasks_title, text_color=('text_primary', 'text_primary'))
         tasks_title.pack(side="left")
 
         # Tasks description
         tasks_desc = ctk.CTkLabel(
             tasks_header,
             text="Add multiple download tasks and manage them independently",
-            font=ctk.CTkFont(size=12, family="Segoe UI"),
-            text_color=(current_colors['text_secondary'], current_colors['text_secondary'])
+            font=self._font(12),
+            text_color=current_colors['text_secondary']
         )
+        self._register(tasks_desc, text_color=('text_secondary', 'text_secondary'))
         tasks_desc.pack(side="left", padx=(15, 0))
 
         # Controls section
@@ -1288,11 +1929,12 @@ class ModernUI:
             width=120,
             height=38,
             command=self.add_task,
-            font=ctk.CTkFont(size=12, family="Segoe UI"),
-            fg_color=(current_colors['primary'], current_colors['primary_hover']),
-            hover_color=(current_colors['primary_hover'], current_colors['primary']),
+            font=self._font(12),
+            fg_color=(primary, primary_hover),
+            hover_color=(primary_hover, primary),
             corner_radius=8
         )
+        self._register(add_btn, fg_color=('primary', 'primary_hover'), hover_color=('primary_hover', 'primary'))
         add_btn.pack(side="left", padx=(0, 8))
 
         run_all_btn = ctk.CTkButton(
@@ -1301,11 +1943,12 @@ class ModernUI:
             width=110,
             height=38,
             command=self.run_all_tasks,
-            font=ctk.CTkFont(size=12, family="Segoe UI"),
-            fg_color=(current_colors['secondary'], current_colors['secondary']),
-            hover_color=(current_colors['secondary'], current_colors['secondary']),
+            font=self._font(12),
+            fg_color=secondary,
+            hover_color=secondary,
             corner_radius=8
         )
+        self._register(run_all_btn, fg_color=('secondary', 'secondary'), hover_color=('secondary', 'secondary'))
         run_all_btn.pack(side="left", padx=(0, 8))
 
         scram_btn = ctk.CTkButton(
@@ -1314,11 +1957,12 @@ class ModernUI:
             width=110,
             height=38,
             command=self.scram_all_tasks,
-            font=ctk.CTkFont(size=12, family="Segoe UI"),
-            fg_color=(current_colors['danger'], current_colors['danger']),
-            hover_color=(current_colors['danger'], current_colors['danger']),
+            font=self._font(12),
+            fg_color=danger,
+            hover_color=danger,
             corner_radius=8
         )
+        self._register(scram_btn, fg_color=('danger', 'danger'), hover_color=('danger', 'danger'))
         scram_btn.pack(side="left")
 
         # Container for task items (stacked vertically) with modern styling
@@ -1335,14 +1979,18 @@ class ModernUI:
     def create_metadata_section(self, parent):
         """Create metadata options section with modern card design"""
         current_colors = self.get_current_colors()
+        # Colors used more than once below
+        text_primary = current_colors['text_primary']
+        text_secondary = current_colors['text_secondary']
         # Metadata card container
         metadata_card = ctk.CTkFrame(
             parent,
-            fg_color=(current_colors['card'], current_colors['card']),
+            fg_color=current_colors['card'],
             corner_radius=12,
             border_width=1,
-            border_color=(current_colors['border'], current_colors['border'])
+            border_color=current_colors['border']
         )
+        self._register(metadata_card, fg_color=('card', 'card'), border_color=('border', 'border'))
         metadata_card.pack(fill="x", pady=(0, 25))
 
         # Metadata header
@@ -1353,25 +2001,28 @@ class ModernUI:
         metadata_title = ctk.CTkLabel(
             metadata_header,
             text="⚙️ Download Settings",
-            font=ctk.CTkFont(size=18, weight="bold", family="Segoe UI"),
-            text_color=(current_colors['text_primary'], current_colors['text_primary'])
+            font=self._font(18, "bold"),
+            text_color=text_primary
         )
+        self._register(metadata_title, text_color=('text_primary', 'text_primary'))
         metadata_title.pack(anchor="w")
 
         # Metadata description
         metadata_desc = ctk.CTkLabel(
             metadata_header,
             text="Configure how your downloads are processed and saved",
-            font=ctk.CTkFont(size=12, family="Segoe UI"),
-            text_color=(current_colors['text_secondary'], current_colors['text_secondary'])
+            font=self._font(12),
+            text_color=text_secondary
         )
+        self._register(metadata_desc, text_color=('text_secondary', 'text_secondary'))
         metadata_desc.pack(anchor="w", pady=(2, 0))
         
         # Initialize metadata variables
         self.metadata_vars = {}
 
-        # Organize settings into logical categories using columns
-        ffmpeg_disabled = not self.downloader.ffmpeg_available
+        # Organize settings into logical categories using columns; FFmpeg is probed
+        # after the window paints, so its checkboxes start enabled
+        ffmpeg_disabled = self.downloader is not None and not self.downloader.ffmpeg_available
 
         # Create main categories container with columns
         categories_container = ctk.CTkFrame(metadata_card, fg_color="transparent")
@@ -1385,46 +2036,19 @@ class ModernUI:
         right_column = ctk.CTkFrame(categories_container, fg_color="transparent")
         right_column.pack(side="left", fill="both", expand=True, padx=(15, 0))
 
-        # Category 1: Metadata Embedding (Left Column)
-        self._create_settings_category(
-            left_column, "📝 Metadata Embedding",
-            [
-                ("embed_metadata", "Embed Metadata", self._load_metadata_setting("embed_metadata", True and not ffmpeg_disabled)),
-                ("embed_thumbnail", "Embed Thumbnail", self._load_metadata_setting("embed_thumbnail", True and not ffmpeg_disabled)),
-                ("embed_chapters", "Embed Chapters", self._load_metadata_setting("embed_chapters", True and not ffmpeg_disabled)),
-            ],
-            ffmpeg_disabled, ["embed_metadata", "embed_thumbnail", "embed_chapters"]
-        )
-
-        # Category 2: File Options (Left Column)
-        self._create_settings_category(
-            left_column, "💾 File Options",
-            [
-                ("write_thumbnail", "Save Thumbnail", self._load_metadata_setting("write_thumbnail", True)),
-                ("include_author", "Include Author", self._load_metadata_setting("include_author", False)),
-                ("write_description", "Save Description", self._load_metadata_setting("write_description", False)),
-                ("write_info_json", "Save Info JSON", self._load_metadata_setting("write_info_json", False)),
-            ]
-        )
-
-        # Category 3: Playlist Options (Right Column)
-        self._create_settings_category(
-            right_column, "📀 Playlist Options",
-            [
-                ("playlist_album_override", "Use Playlist as Album", self._load_metadata_setting("playlist_album_override", False)),
-                ("create_m3u", "Create M3U", self._load_metadata_setting("create_m3u", False)),
-                ("m3u_to_parent", "Place M3U in parent folder", self._load_metadata_setting("m3u_to_parent", False)),
-            ]
-        )
-
-        # Category 4: Download Options (Right Column)
-        self._create_settings_category(
-            right_column, "📥 Download Options",
-            [
-                ("embed_subs", "Download Subtitles", self._load_metadata_setting("embed_subs", False)),
-                ("force_playlist_redownload", "Force Re-download All", self._load_metadata_setting("force_playlist_redownload", False)),
-            ]
-        )
+        # Read every setting in one pass, then build the categories from the table
+        defaults = {key: default and not (needs_ffmpeg and ffmpeg_disabled)
+                    for _, _, options, needs_ffmpeg in self._SETTINGS_CATEGORIES
+                    for key, _, default in options}
+        values = self.config.get_many(defaults, defaults)
+        columns = {"left": left_column, "right": right_column}
+        for column, title, options, needs_ffmpeg in self._SETTINGS_CATEGORIES:
+            self._create_settings_category(
+                columns[column], title,
+                [(key, label, values[key]) for key, label, _ in options],
+                ffmpeg_disabled=needs_ffmpeg and ffmpeg_disabled,
+                disabled_keys=[key for key, _, _ in options] if needs_ffmpeg else None
+            )
 
         # Performance note with modern styling
         perf_frame = ctk.CTkFrame(metadata_card, fg_color="transparent")
@@ -1433,116 +2057,92 @@ class ModernUI:
         perf_note = ctk.CTkLabel(
             perf_frame,
             text="🚀 Optimized for maximum speed using all available CPU cores",
-            font=ctk.CTkFont(size=11, family="Segoe UI"),
-            text_color=(current_colors['text_secondary'], current_colors['text_secondary']),
+            font=self._font(11),
+            text_color=text_secondary,
             justify="left"
         )
+        self._register(perf_note, text_color=('text_secondary', 'text_secondary'))
         perf_note.pack(anchor="w")
 
         # Add button for updating existing files with modern styling
         update_existing_btn = ctk.CTkButton(
             perf_frame,
             text="🔄 Update Existing Files Album",
-            font=ctk.CTkFont(size=12, family="Segoe UI"),
+            font=self._font(12),
             height=36,
             command=self.update_existing_files_album,
-            fg_color=(current_colors['accent'], current_colors['accent']),
-            hover_color=(current_colors['warning'], current_colors['warning']),
-            text_color=(current_colors['text_primary'], current_colors['text_primary']),
+            fg_color=current_colors['accent'],
+            hover_color=current_colors['warning'],
+            text_color=text_primary,
             corner_radius=8
         )
+        self._register(update_existing_btn, fg_color=('accent', 'accent'), hover_color=('warning', 'warning'), text_color=('text_primary', 'text_primary'))
         update_existing_btn.pack(anchor="w", pady=(10, 0))
 
         # Info text about the update existing files feature with modern styling
         update_info = ctk.CTkLabel(
             metadata_card,
             text="💡 Use this to update album metadata on already downloaded playlist files",
-            font=ctk.CTkFont(size=11, family="Segoe UI"),
-            text_color=(current_colors['text_secondary'], current_colors['text_secondary']),
+            font=self._font(11),
+            text_color=text_secondary,
             justify="left"
         )
+        self._register(update_info, text_color=('text_secondary', 'text_secondary'))
         update_info.pack(anchor="w", padx=25, pady=(5, 20))
 
     def update_existing_files_album(self):
         """Update album metadata for existing playlist files"""
-        from tkinter import simpledialog, messagebox
 
         # Check FFmpeg availability
-        if not self.downloader.ffmpeg_available:
+        if not self._get_downloader().ffmpeg_available:
             messagebox.showerror("Error", "FFmpeg is required for metadata updates but is not available.\n\nPlease install FFmpeg and ensure it's on your PATH.")
             return
 
-        # Ask for output directory
-        output_dir = filedialog.askdirectory(
-            title="Select Directory with Playlist Files",
-            initialdir=self.config.get("output_directory", self.config.get_default_output_directory())
-        )
-        if not output_dir:
-            return
-
-        # Ask for playlist name
-        playlist_name = simpledialog.askstring(
-            "Playlist Name",
-            "Enter the playlist name to use as album metadata:",
-            parent=self.root
-        )
-        if not playlist_name or not playlist_name.strip():
+        # Directory, playlist name and file type are collected in one form
+        form = UpdateAlbumDialog(
+            self.root,
+            initial_dir=self.config.get("output_directory", self.config.get_default_output_directory())
+        ).show()
+        if not form:
             return
-
-        playlist_name = playlist_name.strip()
-
-        # Ask for format type
-        from tkinter import messagebox
-        format_choice = messagebox.askquestion(
-            "File Format",
-            "Are the files audio files? (Select 'No' for video files)",
-            icon='question'
+        output_dir = form["output_dir"]
+        playlist_name = form["playlist_name"]
+        is_audio = form["is_audio"]
+
+        # Run on the shared background pool; the result is reported back on the Tk thread
+        future = self._bg_pool.submit(
+            self.downloader.update_existing_playlist_files_album,
+            output_path=output_dir,
+            playlist_title=playlist_name,
+            is_audio=is_audio
         )
-        is_audio = format_choice == 'yes'
-
-        # Confirm operation
-        file_types = "audio" if is_audio else "video"
-        confirm = messagebox.askyesno(
-            "Confirm Update",
-            f"This will update the album metadata of all {file_types} files in:\n{output_dir}\n\n"
-            f"Album name: '{playlist_name}'\n\n"
-            f"Continue?",
-            icon='warning'
-        )
-
-        if not confirm:
-            return
+        future.add_done_callback(lambda f: self.root.after(0, self._on_update_done, f))
 
-        # Disable button during operation
-        # Note: We can't easily access the button reference here, so we'll proceed
-
-        def update_worker():
-            try:
-                self.downloader.update_existing_playlist_files_album(
-                    output_path=output_dir,
-                    playlist_title=playlist_name,
-                    is_audio=is_audio
-                )
-                messagebox.showinfo("Success", "Album metadata update completed!\n\nCheck the logs for details.")
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to update album metadata:\n\n{str(e)}")
-
-        # Run in background thread
-        import threading
-        thread = threading.Thread(target=update_worker, daemon=True)
-        thread.start()
+    def _on_update_done(self, future):
+        """Report the result of an album metadata update"""
+        error = future.exception()
+        if error is None:
+            messagebox.showinfo("Success", "Album metadata update completed!\n\nCheck the logs for details.")
+        else:
+            messagebox.showerror("Error", f"Failed to update album metadata:\n\n{str(error)}")
 
     def create_cookie_section(self, parent):
         """Create cookie file section with modern card design"""
         current_colors = self.get_current_colors()
+        # Colors used more than once below
+        border = current_colors['border']
+        text_secondary = current_colors['text_secondary']
+        primary = current_colors['primary']
+        primary_hover = current_colors['primary_hover']
         # Cookie card container
         cookie_card = ctk.CTkFrame(
             parent,
-            fg_color=(current_colors['card'], current_colors['card']),
+            fg_color=current_colors['card'],
             corner_radius=12,
             border_width=1,
-            border_color=(current_colors['border'], current_colors['border'])
+            border_color=border
         )
+        self._register(cookie_card, fg_color=('card', 'card'), border_color=('border', 'border'))
         cookie_card.pack(fill="x", pady=(0, 25))
 
         # Cookie header
@@ -1553,18 +2153,20 @@ class ModernUI:
         cookie_title = ctk.CTkLabel(
             cookie_header,
             text="🍪 Browser Authentication",
-            font=ctk.CTkFont(size=18, weight="bold", family="Segoe UI"),
-            text_color=(current_colors['text_primary'], current_colors['text_primary'])
+            font=self._font(18, "bold"),
+            text_color=current_colors['text_primary']
         )
+        self._register(cookie_title, text_color=('text_primary', 'text_primary'))
         cookie_title.pack(anchor="w")
 
         # Cookie description
         cookie_desc = ctk.CTkLabel(
             cookie_header,
             text="Optional: Use browser cookies for accessing restricted content",
-            font=ctk.CTkFont(size=12, family="Segoe UI"),
-            text_color=(current_colors['text_secondary'], current_colors['text_secondary'])
+            font=self._font(12),
+            text_color=text_secondary
         )
+        self._register(cookie_desc, text_color=('text_secondary', 'text_secondary'))
         cookie_desc.pack(anchor="w", pady=(2, 0))
 
         # Cookie file input row with modern styling
@@ -1577,11 +2179,12 @@ class ModernUI:
             textvariable=self.cookie_var,
             placeholder_text="Path to YouTube cookies.txt file",
             height=38,
-            font=ctk.CTkFont(size=13, family="Segoe UI"),
+            font=self._font(13),
             corner_radius=8,
             border_width=2,
-            border_color=(current_colors['border'], current_colors['border'])
+            border_color=border
         )
+        self._register(self.cookie_entry, border_color=('border', 'border'))
         self.cookie_entry.pack(side="left", fill="x", expand=True, padx=(0, 12))
 
         browse_cookie_btn = ctk.CTkButton(
@@ -1590,11 +2193,12 @@ class ModernUI:
             width=90,
             height=38,
             command=self.browse_cookie_file,
-            font=ctk.CTkFont(size=12, family="Segoe UI"),
+            font=self._font(12),
             corner_radius=8,
-            fg_color=(current_colors['primary'], current_colors['primary_hover']),
-            hover_color=(current_colors['primary_hover'], current_colors['primary'])
+            fg_color=(primary, primary_hover),
+            hover_color=(primary_hover, primary)
         )
+        self._register(browse_cookie_btn, fg_color=('primary', 'primary_hover'), hover_color=('primary_hover', 'primary'))
         browse_cookie_btn.pack(side="left")
 
         # Cookie info text with modern styling
@@ -1602,15 +2206,16 @@ class ModernUI:
             cookie_card,
             text="🎯 Use for age-restricted or region-blocked content.\n"
                  "Export cookies from your browser or use a cookie extractor extension.",
-            font=ctk.CTkFont(size=11, family="Segoe UI"),
-            text_color=(current_colors['text_secondary'], current_colors['text_secondary']),
+            font=self._font(11),
+            text_color=text_secondary,
             justify="left"
         )
+        self._register(cookie_info, text_color=('text_secondary', 'text_secondary'))
         cookie_info.pack(anchor="w", padx=25, pady=(0, 20))
 
-        # Bind to save on change (with debouncing)
-        self.cookie_var.trace_add("write", self._on_cookie_file_changed)
-        self._cookie_save_after_id = None
+        # Save once editing is finished rather than on every keystroke
+        self.cookie_entry.bind("<FocusOut>", lambda e: self._save_cookie_file_delayed())
+        self.cookie_entry.bind("<Return>", lambda e: self._save_cookie_file_delayed())
 
     def _save_metadata_setting(self, key, value):
         """Save a metadata setting to config"""
@@ -1619,17 +2224,8 @@ class ModernUI:
         except Exception as e:
             print(f"Error saving metadata setting {key}: {e}")
 
-    def _load_metadata_setting(self, key, default=False):
-        """Load a metadata setting from config"""
-        try:
-            return self.config.get(key, default)
-        except Exception as e:
-            print(f"Error loading metadata setting {key}: {e}")
-            return default
-
     def browse_cookie_file(self):
         """Browse for cookie file"""
-        from tkinter import filedialog
         file_path = filedialog.askopenfilename(
             title="Select Cookie File",
             filetypes=[("Cookie files", "*.txt"), ("All files", "*.*")]
@@ -1639,40 +2235,32 @@ class ModernUI:
             # Save immediately when browsed
             self._save_cookie_file(file_path)
 
-    def _on_cookie_file_changed(self, *args):
-        """Handle cookie file changes with debouncing"""
-        if getattr(self, '_restoring_tasks', False):
-            return
-
-        try:
-            if self._cookie_save_after_id is not None:
-                try:
-                    self.root.after_cancel(self._cookie_save_after_id)
-                except Exception:
-                    pass
-
-            # Debounce saves to avoid excessive disk writes
-            self._cookie_save_after_id = self.root.after(500, self._save_cookie_file_delayed)
-        except Exception:
-            # Fallback to immediate save
-            self._save_cookie_file_delayed()
-
     def _save_cookie_file(self, file_path):
         """Save cookie file path to config"""
         self.config.set("cookie_file", file_path)
 
+    def _path_exists_cached(self, path, ttl=1.0):
+        """os.path.exists, reusing the answer for the same path for ttl seconds"""
+        now = time.monotonic()
+        hit = self._exists_cache.get(path)
+        if hit is not None and now - hit[1] < ttl:
+            return hit[0]
+        exists = os.path.exists(path)
+        self._exists_cache[path] = (exists, now)
+        return exists
+
     def _save_cookie_file_delayed(self):
         """Save cookie file path with validation"""
         try:
             file_path = self.cookie_var.get().strip()
-            if file_path and not os.path.exists(file_path):
+            if file_path == self.config.get("cookie_file", ""):
+                return
+            if file_path and not self._path_exists_cached(file_path):
                 # Don't save invalid paths, just warn
                 return
             self._save_cookie_file(file_path)
         except Exception:
             pass
-        finally:
-            self._cookie_save_after_id = None
 
     # ===== Legacy single-output directory handlers (kept for config persistence) =====
     # These are used to persist a default output directory used to prefill new tasks
@@ -1692,7 +2280,7 @@ class ModernUI:
             download_frame,
             text="⬇️ Download",
             height=45,
-            font=ctk.CTkFont(size=16, weight="bold"),
+            font=self._font(16, "bold", family=None),
             command=self.start_download
         )
         self.download_button.pack(pady=10)
@@ -1702,7 +2290,7 @@ class ModernUI:
             download_frame,
             text="⏹️ Abort Download",
             height=45,
-            font=ctk.CTkFont(size=16, weight="bold"),
+            font=self._font(16, "bold", family=None),
             fg_color=("red", "darkred"),
             hover_color=("darkred", "red"),
             command=self.abort_download
@@ -1718,7 +2306,7 @@ class ModernUI:
         progress_label = ctk.CTkLabel(
             progress_frame, 
             text="Progress", 
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=self._font(14, "bold", family=None)
         )
         progress_label.pack(anchor="w", padx=15, pady=(15, 10))
         
@@ -1726,7 +2314,7 @@ class ModernUI:
         self.playlist_counter = ctk.CTkLabel(
             progress_frame,
             text="",
-            font=ctk.CTkFont(size=12, weight="bold"),
+            font=self._font(12, "bold", family=None),
             text_color=("blue", "lightblue")
         )
         self.playlist_counter.pack(anchor="w", padx=15, pady=(0, 5))
@@ -1741,7 +2329,7 @@ class ModernUI:
         self.progress_text = ctk.CTkLabel(
             progress_frame,
             text="Ready to download",
-            font=ctk.CTkFont(size=12)
+            font=self._font(12, family=None)
         )
         self.progress_text.pack(anchor="w", padx=15, pady=(0, 15))
 
@@ -1754,7 +2342,7 @@ class ModernUI:
         status_label = ctk.CTkLabel(
             status_frame, 
             text="Status Log", 
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=self._font(14, "bold", family=None)
         )
         status_label.pack(anchor="w", padx=15, pady=(15, 10))
         
@@ -1762,7 +2350,7 @@ class ModernUI:
         self.status_text = ctk.CTkTextbox(
             status_frame,
             height=150,
-            font=ctk.CTkFont(size=11, family="Consolas")
+            font=self._font(11, family="Consolas")
         )
         self.status_text.pack(fill="x", padx=15, pady=(0, 10))
         
@@ -1776,14 +2364,6 @@ class ModernUI:
         )
         clear_button.pack(anchor="w", padx=15, pady=(0, 15))
 
-    def browse_output(self):
-        """Browse for output directory"""
-        directory = filedialog.askdirectory(initialdir=self.output_var.get())
-        if directory:
-            self.output_var.set(directory)
-            # Save to config
-            self._save_output_directory(directory)
-
     def _save_output_directory(self, directory):
         """Save output directory to config (used as default for new tasks)"""
         self.config.set("output_directory", directory)
@@ -1818,18 +2398,31 @@ class ModernUI:
         """Add a new task row (optionally with preset URL)"""
         # Default to the process current working directory for newly added tasks
         # but keep config-based defaults when restoring from saved state
-        if not getattr(self, '_restoring_tasks', False):
+        if not self._restoring_tasks:
             try:
                 default_output = os.getcwd()
             except Exception:
                 default_output = self.config.get("output_directory", self.config.get_default_output_directory())
         else:
             default_output = self.config.get("output_directory", self.config.get_default_output_directory())
-        task = TaskItem(self, parent_frame=self.tasks_list_frame, default_output=default_output)
+        if self._task_pool:
+            # Reuse a removed task card instead of building a new widget tree
+            task = self._task_pool.pop()
+            with self._silent():
+                task.reset(default_output)
+            if not self._restoring_tasks:
+                task.frame.pack(fill="x", pady=(0, 15))
+        else:
+            task = TaskItem(self, parent_frame=self.tasks_list_frame, default_output=default_output)
+        task._idx = len(self.tasks)
         self.tasks.append(task)
+        for column, value in zip(self._task_state.values(), self._build_task_row(task)):
+            column.append(value)
+        # Fields set after creation (URL, restored format/output) are picked up on save
+        self._dirty_tasks.add(task)
 
         # Defer color updates and bindings during bulk restoration for better performance
-        if not getattr(self, '_restoring_tasks', False):
+        if not self._restoring_tasks:
             # Update task colors to match current theme
             task.update_colors()
             # Attach bindings for persistence BEFORE setting URL
@@ -1843,30 +2436,43 @@ class ModernUI:
         try:
             if url:
                 task.url_var.set(url)
-                # Update video info for new tasks (not during restoration)
-                if not getattr(self, '_restoring_tasks', False) and hasattr(task, 'update_video_info'):
-                    task.update_video_info(url, force=True)
+                # Look up video info for new tasks in the background (not during restoration)
+                if not self._restoring_tasks:
+                    self._queue_video_info(task, url)
         except Exception:
             pass
-        # Re-number task titles
-        for idx, t in enumerate(self.tasks, start=1):
-            t.update_title(f"Task {idx}")
+        # Appended last, so only the new task needs a number
+        task.update_title(f"Task {len(self.tasks)}")
         # Persist updated tasks unless we're restoring
-        if not getattr(self, '_restoring_tasks', False):
+        if not self._restoring_tasks:
             self._schedule_persist_tasks()
         return task
 
     def remove_task(self, task):
         """Remove a task row"""
         try:
-            if task in self.tasks:
-                # Abort if running
+            # task._idx locates the task directly instead of scanning self.tasks
+            idx = task._idx
+            if idx is not None and idx < len(self.tasks) and self.tasks[idx] is task:
+                # Abort if running; only idle tasks are kept for reuse
                 if task.is_running:
                     task.abort()
-                task.destroy()
-                self.tasks.remove(task)
-                for idx, t in enumerate(self.tasks, start=1):
-                    t.update_title(f"Task {idx}")
+                    task.destroy()
+                elif len(self._task_pool) < self._TASK_POOL_SIZE:
+                    task.detach()
+                    self._task_pool.append(task)
+                else:
+                    task.destroy()
+                task._idx = None
+                del self.tasks[idx]
+                for column in self._task_state.values():
+                    del column[idx]
+                self._dirty_tasks.discard(task)
+                # Only the tasks after the removed one move up
+                for i in range(idx, len(self.tasks)):
+                    t = self.tasks[i]
+                    t._idx = i
+                    t.update_title(f"Task {i + 1}")
                 # Persist after removal
                 self._schedule_persist_tasks()
         except Exception:
@@ -1886,25 +2492,23 @@ class ModernUI:
     
     def is_playlist_url(self, url):
         """Detect if the URL is a playlist based on YouTube URL parameters"""
-        import re
-        
-        # YouTube playlist patterns
-        playlist_patterns = [
-            r'[?&]list=([^&]+)',  # Standard playlist parameter
-            r'playlist\?list=([^&]+)',  # Playlist URL format
-            r'watch\?v=[^&]+&list=([^&]+)',  # Video with playlist
-        ]
-        
-        for pattern in playlist_patterns:
-            if re.search(pattern, url):
-                return True
-        
+        # Standard list= parameter (also covers playlist?list= and watch?v=...&list=)
+        if _parse_url(url)[1] is not None:
+            return True
+
         # Check for playlist-specific domains
         if 'youtube.com/playlist' in url or 'youtube.com/watch?list=' in url:
             return True
             
         return False
 
+    @staticmethod
+    def classify_urls(urls):
+        """is_playlist_url for many URLs at once, returned as a list of bools in input order"""
+        parse = _parse_url
+        return [parse(url)[1] is not None or 'youtube.com/playlist' in url or 'youtube.com/watch?list=' in url
+                for url in urls]
+
     # Per-task progress is handled inside TaskItem
     def update_progress(self, d):
         return
@@ -1943,29 +2547,57 @@ class ModernUI:
 
     def toggle_theme(self):
         """Toggle between dark and light themes"""
-        current_mode = ctk.get_appearance_mode()
-        new_mode = "Light" if current_mode == "Dark" else "Dark"
+        # Read the live mode: under "auto" the OS may have switched it since it was cached
+        new_mode = "Light" if ctk.get_appearance_mode() == "Dark" else "Dark"
 
         # Save to config first
         self.config.set("theme", new_mode.lower())
 
-        # Update CustomTkinter appearance
+        # Update CustomTkinter appearance; the cache is updated first so the tracker
+        # callback fired by set_appearance_mode sees no change
+        old_colors = self.get_current_colors()
+        self._appearance_mode = new_mode
         ctk.set_appearance_mode(new_mode)
+        self._repaint_theme(old_colors)
 
-        # Reapply modern styling for the new theme
-        self._apply_modern_styling()
+    def _on_appearance_mode_changed(self, mode):
+        """Follow an appearance change CustomTkinter made on its own (OS theme under "auto")"""
+        if mode == self._appearance_mode:
+            return
+        old_colors = self.get_current_colors()
+        self._appearance_mode = mode
+        try:
+            self._repaint_theme(old_colors)
+        except Exception as e:
+            print(f"Error applying appearance change: {e}")
+
+    def _repaint_theme(self, old_colors):
+        """Recolor the window after the appearance mode changed from the old_colors palette"""
+        new_mode = self._appearance_mode
+        # Palettes are fixed per mode, so both cached entries stay valid across toggles
+        new_colors = self.get_current_colors()
 
         # Update theme button text
         self.update_theme_button()
 
-        # Update all existing task items
+        # Nothing else to repaint if the palettes are identical; only the
+        # per-mode overrides can differ, the shared base entries never do
+        overrides = _MODE_COLORS.get(new_mode.lower(), _MODE_COLORS['dark'])
+        if all(old_colors.get(k) == new_colors[k] for k in overrides):
+            return
+
+        # Reapply modern styling for the new theme
+        self._apply_modern_styling()
+        self._restyle_widgets(new_colors)
+
+        # Update all existing task items (each skips itself if its colors are unaffected)
         for task in self.tasks:
             task.update_colors()
     
 
     def update_theme_button(self):
         """Update theme button text and styling"""
-        current_mode = ctk.get_appearance_mode()
+        current_mode = self._appearance_mode
         current_colors = self.get_current_colors()
 
         # Use better contrast icons that work in both themes
@@ -1982,28 +2614,13 @@ class ModernUI:
             text=icon_text,
             text_color=text_color,
             fg_color=(current_colors['surface_light'], current_colors['surface']),
-            border_color=(current_colors['border'], current_colors['border'])
+            border_color=current_colors['border']
         )
 
     def toggle_maximize(self, event=None):
         """Toggle maximized window state"""
         try:
-            # Check current state
-            try:
-                current_state = self.root.state()
-                is_zoomed = 'zoomed' in current_state
-            except:
-                try:
-                    is_zoomed = self.root.attributes('-zoomed')
-                except:
-                    # Fallback: check if window is approximately screen size
-                    screen_width = self.root.winfo_screenwidth()
-                    screen_height = self.root.winfo_screenheight()
-                    window_width = self.root.winfo_width()
-                    window_height = self.root.winfo_height()
-                    is_zoomed = (window_width >= screen_width - 50 and window_height >= screen_height - 50)
-
-            if is_zoomed:
+            if self.is_maximized():
                 # Restore to normal window and center it
                 try:
                     self.root.state('normal')
@@ -2055,38 +2672,18 @@ class ModernUI:
 
     def setup_signal_handlers(self):
         """Set up signal handlers for graceful exit"""
+        import signal
+
         def signal_handler(signum, frame):
             """Handle SIGINT (Ctrl+C) and SIGTERM signals"""
             running = any(t.is_running for t in getattr(self, 'tasks', []))
             if running:
                 print("\n🛑 Tasks in progress. Aborting all and cleaning up...")
-                for t in self.tasks:
-                    try:
-                        if t.is_running:
-                            t.abort()
-                    except Exception:
-                        pass
-                # Give a moment for cleanup to complete
-                import time
-                time.sleep(1)
-                print("✅ Cleanup completed. Exiting...")
             else:
                 print("\n👋 Exiting gracefully...")
-            
-            # Save config before exit (only if not maximized)
-            try:
-                if not self.is_maximized():
-                    geometry = self.root.geometry()
-                    self.config.set("window_size", geometry)
-            except:
-                pass
-            
-            # Exit cleanly
-            try:
-                self.root.quit()
-                self.root.destroy()
-            except:
-                pass
+            self._shutdown(from_signal=True)
+            if running:
+                print("✅ Cleanup completed. Exiting...")
             sys.exit(0)
         
         # Register signal handlers
@@ -2096,13 +2693,25 @@ class ModernUI:
 
     def on_closing(self):
         """Handle window closing"""
-        # Save window size to config (only if not maximized)
-        try:
-            if not self.is_maximized():
-                geometry = self.root.geometry()
-                self.config.set("window_size", geometry)
-        except Exception:
-            pass
+        running = any(t.is_running for t in getattr(self, 'tasks', []))
+        if running and not messagebox.askokcancel("Quit", "Tasks in progress. Quit and abort all?\n\nIncomplete files will be cleaned up automatically."):
+            return
+        self._shutdown()
+
+    def _shutdown(self, from_signal=False):
+        """Save settings and tasks, abort running tasks and close the window"""
+        # Window size and cookie path are written to disk together
+        with self.config.batch():
+            # Save window size to config (only if not maximized)
+            try:
+                if not self.is_maximized():
+                    geometry = self.root.geometry()
+                    self.config.set("window_size", geometry)
+            except Exception:
+                pass
+
+            # A cookie path still being edited has not lost focus yet
+            self._save_cookie_file_delayed()
 
         # Persist tasks before closing
         try:
@@ -2110,18 +2719,57 @@ class ModernUI:
         except Exception:
             pass
 
-        running = any(t.is_running for t in getattr(self, 'tasks', []))
-        if running:
-            if messagebox.askokcancel("Quit", "Tasks in progress. Quit and abort all?\n\nIncomplete files will be cleaned up automatically."):
-                for t in self.tasks:
-                    try:
-                        if t.is_running:
-                            t.abort()
-                    except Exception:
-                        pass
-                self.root.destroy()
-        else:
+        aborted = False
+        for t in getattr(self, 'tasks', []):
+            try:
+                if t.is_running:
+                    t.abort()
+                    aborted = True
+                # Debounced playlist state/M3U updates would otherwise be lost with the window
+                t._flush_m3u()
+            except Exception:
+                pass
+        if aborted and from_signal:
+            # Give a moment for cleanup to complete
+            time.sleep(1)
+
+        self._finish_import_on_exit()
+
+        self._flush_pending_save()
+        try:
+            if from_signal:
+                self.root.quit()
             self.root.destroy()
+        except Exception:
+            pass
+
+    def _finish_import_on_exit(self):
+        """Stop a running import/undo and delete the backups kept for undoing it"""
+        import_state = self._import_state
+        if import_state is None:
+            return
+        self._import_state = None
+        future = import_state.get("future")
+        if future is not None and not future.done():
+            # The worker stops scanning, lets started copies finish and removes the backups
+            # itself (pool threads are joined before the interpreter exits)
+            import_state["cancel"] = True
+            return
+        self._discard_import_backup(import_state)
+
+    def _remove_stale_import_backups(self):
+        """Delete undo backups a previous session left in the last import's output directory"""
+        output_dir = self.config.get("last_import_output_dir", "")
+        if not output_dir:
+            return
+        try:
+            with os.scandir(output_dir) as it:
+                stale = [entry.path for entry in it
+                         if entry.name.startswith(_IMPORT_BACKUP_PREFIX) and entry.is_dir(follow_symlinks=False)]
+        except OSError:
+            return
+        for path in stale:
+            shutil.rmtree(path, ignore_errors=True)
 
     def run(self):
         """Start the GUI application"""
@@ -2143,6 +2791,22 @@ class ModernUI:
 
     def is_maximized(self):
         """Check if the window is in maximized/zoomed state"""
+        return self._is_maximized
+
+    def _on_root_configure(self, event):
+        """Schedule a maximized-state refresh when the main window is resized"""
+        # The binding also fires for every child widget; only the window itself matters
+        if event.widget is not self.root or self._maximize_check_pending:
+            return
+        self._maximize_check_pending = True
+        self.root.after_idle(self._refresh_maximized)
+
+    def _refresh_maximized(self):
+        self._maximize_check_pending = False
+        self._is_maximized = bool(self._query_maximized())
+
+    def _query_maximized(self):
+        """Ask the window manager whether the window is maximized/zoomed"""
         try:
             current_state = self.root.state()
             return 'zoomed' in current_state
@@ -2178,662 +2842,4 @@ Installation Instructions:
 
 Downloads will still work but without advanced features."""
         
-        messagebox.showwarning("FFmpeg Not Found", warning_text) 
-
-
-    def _run_on_ui(self, fn):
-        """Schedule a callable to run on the Tk main thread safely."""
-        try:
-            if not self._is_alive():
-                return
-            self.ui.root.after(0, lambda: fn() if self._is_alive() else None)
-        except Exception:
-            pass
-
-    def update_title(self, text: str):
-        self.title_label.configure(text=text)
-
-    def get_url(self) -> str:
-        return self.url_var.get().strip()
-
-    def _browse_output(self):
-        directory = filedialog.askdirectory(initialdir=self.output_var.get())
-        if directory:
-            self.output_var.set(directory)
-            # Also store as default for future tasks
-            self.ui._save_output_directory(directory)
-
-    def _clear_status(self):
-        try:
-            self.status_text.delete("0.0", "end")
-        except Exception:
-            pass
-
-    def _is_alive(self) -> bool:
-        try:
-            return (not self._destroyed) and self.frame.winfo_exists()
-        except Exception:
-            return False
-
-    def _set_progress_text_safe(self, text: str):
-        if not self._is_alive():
-            return
-        def _apply():
-            try:
-                if self._is_alive():
-                    self.progress_text.configure(text=text)
-            except Exception:
-                pass
-        self._run_on_ui(_apply)
-
-    def log(self, message: str):
-        if not self._is_alive():
-            return
-        def _append():
-            try:
-                if self._is_alive():
-                    self.status_text.insert("end", f"{message}\n")
-                    self.status_text.see("end")
-            except Exception:
-                pass
-        self._run_on_ui(_append)
-
-    def start(self):
-        if self.is_running:
-            return
-        url = self.get_url()
-        if not url or not url.startswith(("http://", "https://")):
-            messagebox.showerror("Error", "Please enter a valid URL starting with http:// or https://")
-            return
-        output_dir = self.output_var.get().strip()
-        if not output_dir:
-            messagebox.showerror("Error", "Please choose an output directory")
-            return
-        if not os.path.exists(output_dir):
-            try:
-                os.makedirs(output_dir)
-            except Exception as e:
-                messagebox.showerror("Error", f"Cannot create output directory: {e}")
-                return
-
-        # Detect playlist for early feedback
-        is_playlist = self._is_playlist_url(url)
-        self._is_playlist_task = bool(is_playlist)
-        if is_playlist:
-            self.progress_text.configure(text="📑 Detected playlist - preparing...")
-            self.log("📑 Detected playlist URL - will download all videos")
-        else:
-            self.progress_text.configure(text="🎬 Detected single video - preparing...")
-            self.log("🎬 Detected single video URL")
-
-        # Build metadata options from global UI
-        metadata_options = {key: var.get() for key, var in self.ui.metadata_vars.items()}
-        is_audio = self.format_var.get() == "audio"
-
-        # Switch buttons
-        self.start_btn.configure(state="disabled")
-        self.abort_btn.configure(state="normal")
-        self.progress_bar.set(0)
-        self._last_logged_progress = 0
-        self._last_logged_filename = ""
-        self._aborted = False
-        # Context log for clarity across multiple tasks
-        try:
-            cookie_file_cfg = self.ui.config.get("cookie_file", "") or ""
-            cookie_used = cookie_file_cfg.strip()
-        except Exception:
-            cookie_used = ""
-        self.log(f"🚀 Starting download | URL: {url}\n   Format: {'audio' if is_audio else 'video'} | Output: {output_dir}\n   Cookies: {'yes' if cookie_used else 'no'}")
-
-        def worker():
-            try:
-                # Try to get quick playlist size and title for UX
-                if is_playlist:
-                    try:
-                        with yt_dlp.YoutubeDL({'quiet': True, 'extract_flat': True}) as ydl:
-                            info = ydl.extract_info(url, download=False)
-                            if info and 'entries' in info:
-                                valid_entries = [e for e in info['entries'] if e is not None]
-                                total = len(valid_entries)
-                                # Capture playlist title for clearer logs
-                                pl_title = info.get('title', 'Unknown Playlist')
-                                # Store for end-of-download logging
-                                self._current_playlist_title = pl_title
-                                self._current_playlist_total = total
-                                # Log a clear start banner for the playlist
-                                self.ui.root.after(0, lambda: self.log(f"📑 Playlist start: {pl_title} ({total} videos)"))
-                                self.ui.root.after(0, lambda: self._set_progress_text_safe(f"📋 Playlist: {total} videos"))
-
-                                # Pre-create playlist directory and reconcile existing M3U if requested
-                                try:
-                                    if self.ui.metadata_vars.get('create_m3u', None) and self.ui.metadata_vars['create_m3u'].get():
-                                        playlist_title = info.get('title', 'Unknown_Playlist')
-                                        playlist_dir = self._compute_playlist_directory(output_dir, playlist_title)
-                                        os.makedirs(playlist_dir, exist_ok=True)
-                                        # Remember for finalization
-                                        self._m3u_playlist_dir = playlist_dir
-                                        self._m3u_playlist_title = playlist_title
-                                        # Build expected mapping (index -> title, id)
-                                        expected = []
-                                        for idx, entry in enumerate(valid_entries, start=1):
-                                            try:
-                                                expected.append({
-                                                    'index': idx,
-                                                    'id': entry.get('id'),
-                                                    'title': entry.get('title')
-                                                })
-                                            except Exception:
-                                                pass
-                                        # Reconcile existing M3U and seed state
-                                        self._reconcile_existing_playlist_m3u(playlist_dir, playlist_title, expected)
-                                except Exception:
-                                    pass
-                    except Exception:
-                        pass
-
-                # Get cookie file from UI config
-                cookie_file = self.ui.config.get("cookie_file", "")
-                if cookie_file:
-                    cookie_file = cookie_file.strip()
-
-                self.downloader.download(
-                    url=url,
-                    output_path=output_dir,
-                    is_audio=is_audio,
-                    is_playlist=is_playlist,
-                    metadata_options=metadata_options,
-                    progress_callback=self._update_progress,
-                    cookie_file=cookie_file if cookie_file else None,
-                    force_playlist_redownload=metadata_options.get('force_playlist_redownload', False)
-                )
-                self.ui.root.after(0, lambda: self._completed(True, "Download completed successfully!"))
-            except Exception as e:
-                # Normalize aborts vs errors
-                msg = str(e) if e is not None else ""
-                if (msg and 'aborted' in msg.lower()) or self._aborted or getattr(self.downloader, '_should_abort', False):
-                    self.ui.root.after(0, lambda: self._completed(False, "Download aborted by user"))
-                else:
-                    display = msg if msg else "Unknown error"
-                    self.ui.root.after(0, lambda: self._completed(False, f"Download failed: {display}"))
-
-        import yt_dlp  # local import to avoid top-level dependency if not needed elsewhere
-        self.thread = threading.Thread(target=worker, daemon=True)
-        self.is_running = True
-        self.thread.start()
-
-    def abort(self):
-        if self.is_running:
-            try:
-                self._aborted = True
-                self.log("🛑 Abort requested...")
-                self._set_progress_text_safe("⏹️ Aborting...")
-
-                # Call downloader abort first
-                self.downloader.abort_download()
-
-                # Wait a short time for graceful shutdown
-                import time
-                time.sleep(0.5)
-
-                # If thread is still alive after abort, try to force termination
-                if self.thread and self.thread.is_alive():
-                    self.log("⚠️ Thread still running, attempting force termination...")
-                    try:
-                        # Try to raise KeyboardInterrupt in the thread
-                        import ctypes
-                        if hasattr(ctypes, 'pythonapi'):
-                            thread_id = self.thread.ident
-                            if thread_id:
-                                ctypes.pythonapi.PyThreadState_SetAsyncExc(
-                                    ctypes.c_long(thread_id),
-                                    ctypes.py_object(KeyboardInterrupt)
-                                )
-                                self.log("✅ Force termination signal sent to thread")
-                    except Exception as e:
-                        self.log(f"⚠️ Could not force terminate thread: {e}")
-
-            except Exception as e:
-                self.log(f"⚠️ Error during abort: {e}")
-
-    def destroy(self):
-        try:
-            self._destroyed = True
-            self.frame.destroy()
-        except Exception:
-            pass
-
-    def _is_playlist_url(self, url: str) -> bool:
-        import re
-        patterns = [r'[?&]list=([^&]+)', r'playlist\?list=([^&]+)', r'watch\?v=[^&]+&list=([^&]+)']
-        if any(re.search(p, url) for p in patterns):
-            return True
-        if 'youtube.com/playlist' in url or 'youtube.com/watch?list=' in url:
-            return True
-        return False
-
-    def _update_progress(self, d):
-        if not self._is_alive():
-            return
-        try:
-            if d.get('status') == 'downloading':
-                # Compute progress safely off the UI thread
-                if d.get('total_bytes'):
-                    downloaded = d.get('downloaded_bytes', 0)
-                    total = d.get('total_bytes', 0)
-                    progress = (downloaded / total) if total > 0 else 0
-                else:
-                    progress_str = d.get('_percent_str', '0%').replace('%', '')
-                    try:
-                        progress = float(progress_str) / 100
-                    except ValueError:
-                        progress = 0
-
-                filename = os.path.basename(d.get('filename', '')).rsplit('.', 1)[0]
-                speed = d.get('speed', 0)
-                eta = d.get('eta', 0)
-                if speed and eta:
-                    speed_mb = speed / 1024 / 1024
-                    eta_str = f"{eta // 60}m {eta % 60}s" if eta > 60 else f"{eta}s"
-                    status_text = f"Downloading: {filename} ({speed_mb:.1f} MB/s, ETA: {eta_str})"
-                else:
-                    status_text = f"Downloading: {filename}"
-
-                # Apply UI updates on main thread
-                self._run_on_ui(lambda: self.progress_bar.set(progress))
-                self._set_progress_text_safe(status_text)
-
-                # Per-item start log (once per file)
-                try:
-                    if filename and filename not in self._logged_item_filenames:
-                        info = d.get('info_dict', {}) or {}
-                        pl_idx = info.get('playlist_index')
-                        n_entries = info.get('n_entries') or info.get('playlist_count') or self._current_playlist_total or None
-                        vid_title = info.get('title') or filename
-                        pl_title = info.get('playlist_title') or info.get('playlist') or self._current_playlist_title or None
-                        if pl_idx and n_entries:
-                            self.log(f"▶ Starting: [{int(pl_idx)}/{int(n_entries)}] {vid_title}" + (f" — Playlist: {pl_title}" if pl_title else ""))
-                        else:
-                            self.log(f"▶ Starting: {vid_title}")
-                        self._logged_item_filenames.add(filename)
-                except Exception:
-                    pass
-
-                # Throttled logging
-                progress_percent = progress * 100
-                if (progress_percent - self._last_logged_progress >= 5.0 or filename != self._last_logged_filename):
-                    self.log(f"⏬ {status_text}")
-                    self._last_logged_progress = progress_percent
-                    self._last_logged_filename = filename
-
-            elif d.get('status') == 'finished':
-                filename = os.path.basename(d.get('filename', '')).rsplit('.', 1)[0]
-                self._set_progress_text_safe(f"Processing: {filename}")
-                self.log(f"🔄 Processing: {filename}")
-                # Per-item finish log with index if available
-                try:
-                    info = d.get('info_dict', {}) or {}
-                    pl_idx = info.get('playlist_index')
-                    n_entries = info.get('n_entries') or info.get('playlist_count') or self._current_playlist_total or None
-                    vid_title = info.get('title') or filename
-                    if pl_idx and n_entries:
-                        self.log(f"✅ Finished item: [{int(pl_idx)}/{int(n_entries)}] {vid_title}")
-                except Exception:
-                    pass
-                self._last_logged_progress = 0
-                self._last_logged_filename = ""
-
-                # Attempt M3U incremental update when a file finishes a stage
-                try:
-                    self._maybe_update_m3u(d)
-                except Exception:
-                    pass
-
-            # Postprocessor hooks deliver final filepaths
-            elif d.get('status') == 'postprocessor':
-                try:
-                    # Some postprocessors report 'filepath' field
-                    if d.get('info_dict') or d.get('filepath'):
-                        self._maybe_update_m3u(d)
-                except Exception:
-                    pass
-
-            elif d.get('status') == 'error':
-                error_msg = d.get('error', 'Unknown error')
-                self._set_progress_text_safe(f"Error: {error_msg}")
-                self.log(f"❌ Error: {error_msg}")
-        except Exception as e:
-            self.log(f"❌ Progress update error: {e}")
-
-    def _completed(self, success: bool, message: str):
-        if not self._is_alive():
-            return
-        try:
-            # Final playlist banner for clarity
-            try:
-                if self._is_playlist_task:
-                    pl_title = self._current_playlist_title or "Playlist"
-                    # Attempt to summarize counts from downloader if available
-                    progress = {}
-                    try:
-                        progress = self.downloader.get_playlist_progress() or {}
-                    except Exception:
-                        progress = {}
-                    total = progress.get('total', self._current_playlist_total)
-                    downloaded = progress.get('downloaded')
-                    failed = progress.get('failed')
-                    skipped = progress.get('skipped')
-                    summary_bits = []
-                    if downloaded is not None:
-                        summary_bits.append(f"downloaded {downloaded}")
-                    if skipped is not None:
-                        summary_bits.append(f"skipped {skipped}")
-                    if failed is not None:
-                        summary_bits.append(f"failed {failed}")
-                    summary = (", ".join(summary_bits)) if summary_bits else ""
-                    if total:
-                        self.log(f"📦 Playlist end: {pl_title} ({total} videos){' — ' + summary if summary else ''}")
-                    else:
-                        self.log(f"📦 Playlist end: {pl_title}{' — ' + summary if summary else ''}")
-            except Exception:
-                pass
-
-            error_summary = self.downloader.get_error_summary()
-            if success:
-                if error_summary:
-                    self._set_progress_text_safe("⚠️ Completed with issues")
-                    self.log(f"⚠️ Completed with issues: {error_summary}")
-                    try:
-                        messagebox.showwarning("Completed with Issues", f"Download completed but some videos had issues:\n{error_summary}\n\nCheck the error report in the output folder for details.")
-                    except Exception:
-                        pass
-                else:
-                    self._set_progress_text_safe("✅ Completed")
-                    self.log(f"✅ {message}")
-            else:
-                if "aborted" in message.lower():
-                    self._set_progress_text_safe("⏹️ Aborted")
-                    self.log(f"⏹️ {message}")
-                else:
-                    if error_summary:
-                        self._set_progress_text_safe("⚠️ Completed with errors")
-                        self.log(f"⚠️ Completed with errors: {error_summary}")
-                    else:
-                        self._set_progress_text_safe("❌ Failed")
-                        self.log(f"❌ {message}")
-                    try:
-                        messagebox.showerror("Error", message)
-                    except Exception:
-                        pass
-
-            # Restore buttons/state
-            try:
-                self.abort_btn.configure(state="disabled")
-                self.start_btn.configure(state="normal")
-            except Exception:
-                pass
-            self.is_running = False
-
-            # Finalize M3U: ensure file is written even if last hook missed
-            try:
-                enabled_var = self.ui.metadata_vars.get('create_m3u', None)
-                if enabled_var and enabled_var.get():
-                    # If we had a playlist dir precomputed use it; otherwise, attempt to infer from output_path
-                    target_dir = self._m3u_playlist_dir
-                    if not target_dir:
-                        try:
-                            # Infer from the chosen output directory for this task
-                            out_dir = self.output_var.get().strip()
-                            if out_dir and os.path.isdir(out_dir):
-                                target_dir = out_dir
-                        except Exception:
-                            pass
-                    if target_dir:
-                        self._write_m3u_from_state(target_dir, self._m3u_playlist_title)
-                        self.log("📄 M3U playlist updated.")
-            except Exception:
-                pass
-        except Exception:
-            # If anything fails during completion (likely due to destroyed widgets), just exit quietly
-            pass
-
-    # ===== M3U helpers =====
-    def _sanitize_name(self, name: str) -> str:
-        try:
-            if not name:
-                return ""
-            return re.sub(r'[<>:"/\\|?*]', '_', name)
-        except Exception:
-            return name or ""
-
-    def _compute_playlist_directory(self, output_dir: str, playlist_title: str) -> str:
-        safe_title = self._sanitize_name(playlist_title or 'Unknown_Playlist')
-        return os.path.join(output_dir, safe_title)
-
-    def _state_path(self, directory: str) -> str:
-        return os.path.join(directory, ".playlist_state.json")
-
-    def _load_state(self, directory: str) -> dict:
-        try:
-            path = self._state_path(directory)
-            if os.path.exists(path):
-                with open(path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-        except Exception:
-            pass
-        return {"playlist_title": None, "total_entries": 0, "entries": {}}
-
-    def _save_state(self, directory: str, state: dict):
-        try:
-            path = self._state_path(directory)
-            with open(path, 'w', encoding='utf-8') as f:
-                json.dump(state, f, ensure_ascii=False, indent=2)
-        except Exception:
-            pass
-
-    def _m3u_path(self, directory: str, playlist_title: str = None) -> str:
-        try:
-            base = os.path.basename(directory).strip() or (playlist_title or "playlist")
-        except Exception:
-            base = (playlist_title or "playlist")
-        safe = self._sanitize_name(base)
-        # If user wants M3U in parent folder, place it there
-        try:
-            to_parent = self.ui.metadata_vars.get('m3u_to_parent', None)
-            if to_parent and to_parent.get():
-                parent_dir = os.path.dirname(directory.rstrip(os.sep)) or directory
-                return os.path.join(parent_dir, f"{safe}.m3u")
-        except Exception:
-            pass
-        return os.path.join(directory, f"{safe}.m3u")
-
-    def _write_m3u_from_state(self, directory: str, playlist_title: str = None):
-        state = self._load_state(directory)
-        # Merge provided playlist_title
-        if playlist_title and not state.get("playlist_title"):
-            state["playlist_title"] = playlist_title
-
-        # Build ordered list by playlist index
-        try:
-            entries = state.get("entries", {})
-            ordered = []
-            for k, v in entries.items():
-                try:
-                    ordered.append((int(k), v))
-                except Exception:
-                    pass
-            ordered.sort(key=lambda x: x[0])
-
-            # Prepare lines (relative paths)
-            lines = []
-            included_abs_paths = set()
-            for _, meta in ordered:
-                path = meta.get('path')
-                if not path or not os.path.exists(path):
-                    continue
-                try:
-                    abs_path = os.path.abspath(path)
-                    included_abs_paths.add(abs_path)
-                except Exception:
-                    pass
-                # For parent placement, keep paths relative to the M3U file location
-                try:
-                    target_m3u_dir = os.path.dirname(self._m3u_path(directory, state.get("playlist_title")))
-                    rel = os.path.relpath(path, target_m3u_dir)
-                except Exception:
-                    rel = path
-                lines.append(rel.replace('\\', '/'))
-
-            # Also append any temp extras captured without an index
-            try:
-                for k, meta in list(state.get('entries', {}).items()):
-                    if not isinstance(k, str) or not k.startswith('_extra_'):
-                        continue
-                    path = meta.get('path')
-                    if not path or not os.path.exists(path):
-                        continue
-                    try:
-                        abs_path = os.path.abspath(path)
-                        if abs_path in included_abs_paths:
-                            continue
-                        included_abs_paths.add(abs_path)
-                        target_m3u_dir = os.path.dirname(self._m3u_path(directory, state.get("playlist_title")))
-                        rel = os.path.relpath(path, target_m3u_dir)
-                    except Exception:
-                        rel = path
-                    lines.append(rel.replace('\\', '/'))
-            except Exception:
-                pass
-
-            # Fallback: append any media files present in directory but missing from expected list
-            try:
-                media_exts = ('.mp3', '.m4a', '.flac', '.ogg', '.wav', '.mp4', '.mkv', '.webm')
-                dir_entries = []
-                for fn in os.listdir(directory):
-                    fp = os.path.join(directory, fn)
-                    if os.path.isfile(fp) and fn.lower().endswith(media_exts):
-                        try:
-                            abs_fp = os.path.abspath(fp)
-                            if abs_fp not in included_abs_paths:
-                                dir_entries.append(fp)
-                        except Exception:
-                            pass
-                # Deterministic order for extras: alphabetical by filename
-                dir_entries.sort(key=lambda p: os.path.basename(p).lower())
-                for fp in dir_entries:
-                    try:
-                        target_m3u_dir = os.path.dirname(self._m3u_path(directory, state.get("playlist_title")))
-                        rel = os.path.relpath(fp, target_m3u_dir)
-                    except Exception:
-                        rel = fp
-                    lines.append(rel.replace('\\', '/'))
-            except Exception:
-                pass
-
-            m3u_file = self._m3u_path(directory, state.get("playlist_title"))
-            with open(m3u_file, 'w', encoding='utf-8') as f:
-                f.write("#EXTM3U\n")
-                for rel in lines:
-                    # Basic M3U without EXTINF duration; Samsung Music accepts plain entries
-                    f.write(f"{rel}\n")
-        except Exception:
-            pass
-
-    def _reconcile_existing_playlist_m3u(self, directory: str, playlist_title: str, expected_entries: list):
-        """Seed or fix M3U before download by matching existing files to expected order."""
-        try:
-            state = self._load_state(directory)
-            state['playlist_title'] = playlist_title or state.get('playlist_title') or ''
-            state['total_entries'] = max(state.get('total_entries', 0) or 0, len(expected_entries))
-
-            # Build quick lookup by sanitized title stem
-            expected_by_stem = {}
-            for item in expected_entries:
-                title = item.get('title') or ''
-                stem = self._sanitize_name(title).lower()
-                expected_by_stem[stem] = item
-
-            # Scan directory for media files
-            media_exts = ('.mp3', '.m4a', '.flac', '.ogg', '.wav', '.mp4', '.mkv', '.webm')
-            for root, _, files in os.walk(directory):
-                if os.path.abspath(root) != os.path.abspath(directory):
-                    continue
-                for fn in files:
-                    if not fn.lower().endswith(media_exts):
-                        continue
-                    stem = os.path.splitext(fn)[0].lower()
-                    # Find best match by prefix or equality
-                    match = None
-                    if stem in expected_by_stem:
-                        match = expected_by_stem[stem]
-                    else:
-                        for key, item in expected_by_stem.items():
-                            if stem.startswith(key[:50]):
-                                match = item
-                                break
-                    if match:
-                        idx = int(match.get('index') or 0)
-                        if idx > 0:
-                            path = os.path.join(directory, fn)
-                            state.setdefault('entries', {})[str(idx)] = {
-                                'id': match.get('id'),
-                                'title': match.get('title'),
-                                'path': path
-                            }
-            self._save_state(directory, state)
-            self._write_m3u_from_state(directory, playlist_title)
-        except Exception:
-            pass
-
-    def _maybe_update_m3u(self, d: dict):
-        # Check toggle
-        try:
-            enabled_var = self.ui.metadata_vars.get('create_m3u', None)
-            if not enabled_var or not enabled_var.get():
-                return
-        except Exception:
-            return
-
-        info = d.get('info_dict', {}) or {}
-        pl_index = info.get('playlist_index')
-        # Accept zero/None indices in postprocessor stage, but prefer explicit playlist_index
-        # If no playlist_index, try to derive from state later; for now, still record the path
-        # Prefer final filepath reported by postprocessor; fallback to filename
-        final_path = info.get('filepath') or d.get('filepath') or d.get('filename')
-        if not final_path:
-            return
-        directory = os.path.dirname(final_path)
-        playlist_title = info.get('playlist_title') or info.get('playlist') or ''
-        total = info.get('n_entries') or info.get('playlist_count') or 0
-        video_id = info.get('id')
-        title = info.get('title')
-
-        # Update state and M3U
-        try:
-            state = self._load_state(directory)
-            if playlist_title:
-                state['playlist_title'] = playlist_title
-            if total:
-                try:
-                    state['total_entries'] = max(int(total), int(state.get('total_entries', 0) or 0))
-                except Exception:
-                    pass
-            entries = state.setdefault('entries', {})
-            if pl_index:
-                key = str(int(pl_index))
-                entries[key] = {
-                    'id': video_id,
-                    'title': title,
-                    'path': final_path
-                }
-            else:
-                # No index available; temporarily store under a special key to be appended later
-                tmp_key = f"_extra_{video_id or os.path.basename(final_path)}"
-                entries[tmp_key] = {
-                    'id': video_id,
-                    'title': title,
-                    'path': final_path
-                }
-            self._save_state(directory, state)
-            self._write_m3u_from_state(directory, playlist_title)
-        except Exception:
-            pass
\ No newline at end of file
+        messagebox.showwarning("FFmpeg Not Found", warning_text)
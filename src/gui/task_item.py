@@ -1,31 +1,197 @@
 import os
+import re
 import json
+import hashlib
+import tempfile
 import threading
+import time
+from collections import OrderedDict, deque
+from functools import lru_cache
+from operator import itemgetter
 from tkinter import filedialog, messagebox
 import customtkinter as ctk
 from typing import TYPE_CHECKING
 
-from ..core.downloader import Downloader
-
 if TYPE_CHECKING:
     from .modern_ui import ModernUI
 
 
+# Windows/Unix forbidden filename characters plus ASCII control characters become '_';
+# newlines and carriage returns become spaces and NUL is dropped
+_SANITIZE_TABLE = str.maketrans({
+    **{chr(i): '_' for i in range(0x20)},
+    **dict.fromkeys('<>:"/\\|?*', '_'),
+    '\n': ' ',
+    '\r': ' ',
+    '\0': None,
+})
+
+_MEDIA_EXTS = ('.mp3', '.m4a', '.flac', '.ogg', '.wav', '.mp4', '.mkv', '.webm')
+_MEDIA_EXTS_BYTES = tuple(os.fsencode(ext) for ext in _MEDIA_EXTS)
+
+# Buffer size for the state JSON and M3U writes (one write() per file instead of one per entry)
+_WRITE_BUFFER_SIZE = 64 * 1024
+# Interval at which queued progress, status and log lines are applied to the task widgets
+_UI_TICK_MS = 100
+# Most recent item file names remembered for the once-per-item "Starting" log line
+_LOGGED_ITEMS_MAX = 4096
+# Minimum seconds between playlist state/M3U rewrites while a playlist is downloading
+_M3U_FLUSH_INTERVAL = 2.0
+
+# YouTube video and playlist ids (the playlist pattern also covers playlist?list= and watch?v=...&list=)
+_YT_URL_RE = re.compile(r'(?:v=|/)([0-9A-Za-z_-]{11})')
+_PLAYLIST_RE = re.compile(r'[?&]list=([^&]+)')
+# http(s) URL check for start(), capturing the first list= value in the same pass
+_URL_RE = re.compile(r'https?://(?:.*?[?&]list=(?P<list>[^&]+))?')
+
+# Flat playlist listings from the pre-scan, shared by all tasks and persisted next to the
+# settings so pressing Start again on the same playlist skips the extra extraction
+_PLAYLIST_CACHE_TTL = 900
+_TRACKING_PARAM_RE = re.compile(r'[?&](?:si|feature|pp|utm_[a-z]+)=[^&]*')
+# Listing only: entries stay unresolved and no DASH/HLS manifests are fetched
+_PLAYLIST_SCAN_OPTS = {
+    'quiet': True,
+    'no_color': True,
+    'extract_flat': 'in_playlist',
+    'skip_download': True,
+    'youtube_include_dash_manifest': False,
+    'youtube_include_hls_manifest': False,
+}
+_playlist_cache = None  # key -> {ts, title, entries}; loaded on first use
+_playlist_cache_lock = threading.Lock()
+
+
+def _playlist_cache_key(url: str) -> str:
+    """Hash of the URL without share/tracking parameters"""
+    return hashlib.sha1(_TRACKING_PARAM_RE.sub('', url).encode('utf-8')).hexdigest()
+
+
+def _playlist_cache_fresh(hit, now: float) -> bool:
+    """True for a well-formed playlist cache entry younger than the TTL"""
+    return (isinstance(hit, dict)
+            and isinstance(hit.get('ts'), (int, float))
+            and 'title' in hit
+            and now - hit['ts'] < _PLAYLIST_CACHE_TTL
+            and isinstance(hit.get('entries'), list)
+            and all(isinstance(e, dict) for e in hit['entries']))
+
+
+def _write_text_atomic(path: str, text: str):
+    """Write text to a temporary file next to path and rename it over path
+
+    Readers (media players, a later state load) see either the old or the new
+    content, never a half-written one.
+    """
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path) or None, suffix=".tmp")
+    try:
+        with open(fd, 'w', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as f:
+            f.write(text)
+        # mkstemp creates the file owner-only; keep the permissions of the file being replaced
+        try:
+            mode = os.stat(path).st_mode & 0o777
+        except OSError:
+            mode = 0o644
+        os.chmod(tmp, mode)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
+
+@lru_cache(maxsize=4096)
+def _sanitize_name(name: str) -> str:
+    """Sanitize filename to be safe for all filesystems"""
+    try:
+        if not name:
+            return ""
+        # Replace unsafe characters (including newlines, carriage returns) in one pass
+        name = name.translate(_SANITIZE_TABLE)
+        # Remove leading/trailing dots and spaces (Windows issue)
+        name = name.strip('. ')
+        # Truncate to reasonable length (255 bytes for most filesystems)
+        if len(name.encode('utf-8')) > 200:
+            name = name[:200]
+        return name if name else "untitled"
+    except Exception:
+        return "untitled"
+
+
+@lru_cache(maxsize=256)
+def _parse_url(url: str):
+    """Return (video_id, playlist_id) for a URL; either may be None"""
+    video = _YT_URL_RE.search(url)
+    playlist = _PLAYLIST_RE.search(url)
+    return (video.group(1) if video else None, playlist.group(1) if playlist else None)
+
+
+def _match_playlist_files(names, expected_by_stem):
+    """Pair media file names with expected playlist entries, returning (name, entry) tuples"""
+    matches = []
+    claimed = set()
+    unmatched = []
+    # Exact stem matches first; these are the common case and cost one dict lookup each
+    for fn in names:
+        stem = os.path.splitext(fn)[0].lower()
+        item = expected_by_stem.get(stem)
+        if item is None:
+            unmatched.append((fn, stem))
+        else:
+            matches.append((fn, item))
+            claimed.add(stem)
+    if not unmatched:
+        return matches
+
+    # Prefix fallback only considers entries no file has claimed yet, so the candidate
+    # pool shrinks as matches accumulate and exact matches are never overwritten.
+    # Entries are bucketed by their 50-char prefix; a file stem is then looked up once per
+    # distinct prefix length instead of being compared against every pending entry.
+    # Among several matching buckets the earliest expected entry wins, as in a linear scan.
+    by_prefix = {}
+    for order, (key, item) in enumerate(expected_by_stem.items()):
+        if key and key not in claimed:
+            by_prefix.setdefault(key[:50], deque()).append((order, item))
+    lengths = sorted({len(prefix) for prefix in by_prefix})
+    for fn, stem in unmatched:
+        best = None
+        for length in lengths:
+            if length > len(stem):
+                break
+            prefix = stem[:length]
+            bucket = by_prefix.get(prefix)
+            if bucket and (best is None or bucket[0][0] < by_prefix[best][0][0]):
+                best = prefix
+        if best is not None:
+            bucket = by_prefix[best]
+            matches.append((fn, bucket.popleft()[1]))
+            if not bucket:
+                del by_prefix[best]
+    return matches
+
+
 class TaskItem:
     """Represents a single download task with its own controls, progress, and terminal"""
+    # Palette keys the task widgets are painted with (see update_colors)
+    _PALETTE_KEYS = ('card', 'border', 'secondary', 'danger', 'surface', 'surface_light',
+                     'text_primary', 'text_secondary')
+
     def __init__(self, ui: 'ModernUI', parent_frame, default_output: str):
         self.ui = ui
 
         # Modern color palette (inherited from main UI)
         self.colors = ui.get_current_colors()
+        # Set when the palette changed in a way that affects this task's widgets
+        self._is_paint_dirty = False
 
         # Create modern task card - defer packing during restoration for better performance
         self.frame = ctk.CTkFrame(
             parent_frame,
-            fg_color=(self.colors['card'], self.colors['card']),
+            fg_color=self.colors['card'],
             corner_radius=10,
             border_width=1,
-            border_color=(self.colors['border'], self.colors['border'])
+            border_color=self.colors['border']
         )
 
         # Defer packing during bulk restoration to improve performance
@@ -38,9 +204,20 @@ class TaskItem:
         self.is_running = False
         self._aborted = False
         self._destroyed = False
+        # Catches the card being destroyed with its parent rather than through destroy()
+        self.frame.bind("<Destroy>", lambda e: setattr(self, '_destroyed', True), add="+")
         # M3U tracking for finalization
         self._m3u_playlist_dir = None
         self._m3u_playlist_title = None
+        self._m3u_path_cache = {}  # (directory, playlist_title, to_parent) -> M3U file path
+        self._create_m3u_enabled = False  # Snapshot of the M3U settings taken in start()
+        self._m3u_to_parent = False
+        self._m3u_fingerprint = {}  # M3U file path -> hash of the lines last written
+        self._state_cache = {}  # directory -> playlist state, parsed from disk once per run
+        self._state_digest = {}  # state file path -> digest of the JSON last written
+        self._m3u_dirty = {}  # directory -> playlist title with state not yet flushed
+        self._m3u_last_flush = 0.0
+        self._m3u_lock = threading.RLock()
         # Playlist context for clearer logs
         self._current_playlist_title = None
         self._current_playlist_total = 0
@@ -58,8 +235,8 @@ class TaskItem:
         self.title_label = ctk.CTkLabel(
             left_section,
             text="Task 1",
-            font=ctk.CTkFont(size=16, weight="bold", family="Segoe UI"),
-            text_color=(self.colors['text_primary'], self.colors['text_primary'])
+            font=self.ui._font(16, "bold"),
+            text_color=self.colors['text_primary']
         )
         self.title_label.pack(side="left")
 
@@ -67,8 +244,8 @@ class TaskItem:
         self.subtitle_label = ctk.CTkLabel(
             left_section,
             text="",
-            font=ctk.CTkFont(size=11, family="Segoe UI"),
-            text_color=(self.colors['text_secondary'], self.colors['text_secondary'])
+            font=self.ui._font(11),
+            text_color=self.colors['text_secondary']
         )
         self.subtitle_label.pack(side="left", padx=(10, 0), pady=(2, 0))
 
@@ -79,10 +256,10 @@ class TaskItem:
             width=32,
             height=32,
             command=lambda: self.ui.remove_task(self),
-            font=ctk.CTkFont(size=14, weight="bold", family="Segoe UI"),
+            font=self.ui._font(14, "bold"),
             fg_color=(self.colors['surface_light'], self.colors['surface']),
-            hover_color=(self.colors['danger'], self.colors['danger']),
-            text_color=(self.colors['text_primary'], self.colors['text_primary']),
+            hover_color=self.colors['danger'],
+            text_color=self.colors['text_primary'],
             corner_radius=6
         )
         self.remove_btn.pack(side="right")
@@ -98,8 +275,8 @@ class TaskItem:
         url_label = ctk.CTkLabel(
             url_row,
             text="🔗 URL:",
-            font=ctk.CTkFont(size=13, weight="bold", family="Segoe UI"),
-            text_color=(self.colors['text_primary'], self.colors['text_primary'])
+            font=self.ui._font(13, "bold"),
+            text_color=self.colors['text_primary']
         )
         url_label.pack(side="left", padx=(0, 12))
 
@@ -109,10 +286,10 @@ class TaskItem:
             textvariable=self.url_var,
             placeholder_text="https://www.youtube.com/watch?v=...",
             height=36,
-            font=ctk.CTkFont(size=12, family="Segoe UI"),
+            font=self.ui._font(12),
             corner_radius=8,
             border_width=2,
-            border_color=(self.colors['border'], self.colors['border'])
+            border_color=self.colors['border']
         )
         self.url_entry.pack(side="left", fill="x", expand=True)
 
@@ -123,8 +300,8 @@ class TaskItem:
         fmt_label = ctk.CTkLabel(
             fmt_row,
             text="📋 Format:",
-            font=ctk.CTkFont(size=13, weight="bold", family="Segoe UI"),
-            text_color=(self.colors['text_primary'], self.colors['text_primary'])
+            font=self.ui._font(13, "bold"),
+            text_color=self.colors['text_primary']
         )
         fmt_label.pack(side="left", padx=(0, 12))
 
@@ -138,8 +315,8 @@ class TaskItem:
             text="🎵 Audio (MP3)",
             variable=self.format_var,
             value="audio",
-            font=ctk.CTkFont(size=12, family="Segoe UI"),
-            text_color=(self.colors['text_primary'], self.colors['text_primary']),
+            font=self.ui._font(12),
+            text_color=self.colors['text_primary'],
             hover_color=(self.colors['primary'], self.colors['primary_hover'])
         )
         video_radio = ctk.CTkRadioButton(
@@ -147,8 +324,8 @@ class TaskItem:
             text="🎬 Video",
             variable=self.format_var,
             value="video",
-            font=ctk.CTkFont(size=12, family="Segoe UI"),
-            text_color=(self.colors['text_primary'], self.colors['text_primary']),
+            font=self.ui._font(12),
+            text_color=self.colors['text_primary'],
             hover_color=(self.colors['primary'], self.colors['primary_hover'])
         )
         audio_radio.pack(side="left", padx=(0, 15))
@@ -161,8 +338,8 @@ class TaskItem:
         out_label = ctk.CTkLabel(
             out_row,
             text="📁 Output:",
-            font=ctk.CTkFont(size=13, weight="bold", family="Segoe UI"),
-            text_color=(self.colors['text_primary'], self.colors['text_primary'])
+            font=self.ui._font(13, "bold"),
+            text_color=self.colors['text_primary']
         )
         out_label.pack(side="left", padx=(0, 12))
 
@@ -171,10 +348,10 @@ class TaskItem:
             out_row,
             textvariable=self.output_var,
             height=36,
-            font=ctk.CTkFont(size=12, family="Segoe UI"),
+            font=self.ui._font(12),
             corner_radius=8,
             border_width=2,
-            border_color=(self.colors['border'], self.colors['border'])
+            border_color=self.colors['border']
         )
         self.output_entry.pack(side="left", fill="x", expand=True, padx=(0, 12))
 
@@ -184,7 +361,7 @@ class TaskItem:
             width=85,
             height=36,
             command=self._browse_output,
-            font=ctk.CTkFont(size=12, family="Segoe UI"),
+            font=self.ui._font(12),
             fg_color=(self.colors['primary'], self.colors['primary_hover']),
             hover_color=(self.colors['primary_hover'], self.colors['primary']),
             corner_radius=8
@@ -201,7 +378,7 @@ class TaskItem:
             height=8,
             corner_radius=4,
             border_width=1,
-            border_color=(self.colors['border'], self.colors['border'])
+            border_color=self.colors['border']
         )
         self.progress_bar.pack(fill="x", pady=(0, 8))
         self.progress_bar.set(0)
@@ -210,8 +387,8 @@ class TaskItem:
         self.progress_text = ctk.CTkLabel(
             progress_section,
             text="⏳ Ready to download",
-            font=ctk.CTkFont(size=13, family="Segoe UI"),
-            text_color=(self.colors['text_secondary'], self.colors['text_secondary'])
+            font=self.ui._font(13),
+            text_color=self.colors['text_secondary']
         )
         self.progress_text.pack(anchor="w")
 
@@ -226,8 +403,8 @@ class TaskItem:
         terminal_title = ctk.CTkLabel(
             terminal_header,
             text="📋 Activity Log",
-            font=ctk.CTkFont(size=14, weight="bold", family="Segoe UI"),
-            text_color=(self.colors['text_primary'], self.colors['text_primary'])
+            font=self.ui._font(14, "bold"),
+            text_color=self.colors['text_primary']
         )
         terminal_title.pack(side="left")
 
@@ -238,9 +415,9 @@ class TaskItem:
             width=80,
             height=28,
             command=self._clear_status,
-            font=ctk.CTkFont(size=11, family="Segoe UI"),
+            font=self.ui._font(11),
             fg_color=(self.colors['surface_light'], self.colors['surface']),
-            hover_color=(self.colors['danger'], self.colors['danger']),
+            hover_color=self.colors['danger'],
             corner_radius=6
         )
         clear_btn.pack(side="right")
@@ -249,10 +426,10 @@ class TaskItem:
         self.status_text = ctk.CTkTextbox(
             terminal_section,
             height=140,
-            font=ctk.CTkFont(size=11, family="Consolas"),
+            font=self.ui._font(11, family="Consolas"),
             corner_radius=8,
             border_width=2,
-            border_color=(self.colors['border'], self.colors['border']),
+            border_color=self.colors['border'],
             fg_color=(self.colors['surface_light'], self.colors['surface'])
         )
         self.status_text.pack(fill="x", pady=(8, 0))
@@ -272,9 +449,9 @@ class TaskItem:
             width=100,
             height=36,
             command=self.start,
-            font=ctk.CTkFont(size=13, family="Segoe UI"),
-            fg_color=(self.colors['secondary'], self.colors['secondary']),
-            hover_color=(self.colors['secondary'], self.colors['secondary']),
+            font=self.ui._font(13),
+            fg_color=self.colors['secondary'],
+            hover_color=self.colors['secondary'],
             corner_radius=8
         )
         self.start_btn.pack(side="left", padx=(0, 10))
@@ -286,9 +463,9 @@ class TaskItem:
             width=100,
             height=36,
             command=self.abort,
-            font=ctk.CTkFont(size=13, family="Segoe UI"),
-            fg_color=(self.colors['danger'], self.colors['danger']),
-            hover_color=(self.colors['danger'], self.colors['danger']),
+            font=self.ui._font(13),
+            fg_color=self.colors['danger'],
+            hover_color=self.colors['danger'],
             corner_radius=8
         )
         self.abort_btn.pack(side="left")
@@ -299,13 +476,22 @@ class TaskItem:
         self.playlist_name = ""
         self.is_playlist = False
         self._last_analyzed_url = ""
+        self._info_after_id = None  # Pending debounced video info refresh (scheduled by the UI)
+        self._idx = None  # Position in the UI's task list and persisted task columns
+        self._bindings_attached = False  # Persistence traces survive recycling (see reset)
 
         # Internal tracking for throttled logging and UI updates
         self._last_logged_progress = 0
         self._last_logged_filename = ""
-        self._logged_item_filenames = set()
-        self._last_ui_update_time = 0  # For throttling UI updates to prevent freezes
-        self._last_progress_value = 0  # Track last progress bar value
+        self._logged_item_filenames = OrderedDict()  # Bounded set of items with a start log line
+        self._progress_raw_name = None  # Last hook 'filename' and its display stem
+        self._progress_stem = ""
+        # Progress, status text and log lines posted from worker threads; the latest
+        # progress/status win and a 100 ms Tk tick applies everything in one go
+        self._pending_progress = None
+        self._pending_status = None
+        self._pending_logs = deque()
+        self._drain_scheduled = False
 
     def _get_downloader(self):
         """Get or create downloader instance lazily"""
@@ -340,17 +526,7 @@ class TaskItem:
 
         try:
             # Analyze URL to get video/playlist info
-            is_playlist, video_name, playlist_name = self.analyze_url_and_extract_info(url)
-
-            # Update task info
-            self.is_playlist = is_playlist
-            self.video_name = video_name if not is_playlist else ""
-            self.playlist_name = playlist_name if is_playlist else ""
-
-            # Update subtitle display
-            display_name = playlist_name if is_playlist else video_name
-            self.update_subtitle(display_name)
-
+            self.apply_info(*self.analyze_url_and_extract_info(url))
         except Exception as e:
             # More specific error handling
             error_msg = f"Error updating video info for {url}: {e}"
@@ -362,14 +538,12 @@ class TaskItem:
                 pass
             # Log the error for debugging but don't re-raise
 
-    def _run_on_ui(self, fn):
-        """Schedule a callable to run on the Tk main thread safely."""
-        try:
-            if not self._is_alive():
-                return
-            self.ui.root.after(0, lambda: fn() if self._is_alive() else None)
-        except Exception:
-            pass
+    def apply_info(self, is_playlist: bool, video_name: str, playlist_name: str):
+        """Store analyzed video/playlist info and show it in the subtitle"""
+        self.is_playlist = is_playlist
+        self.video_name = video_name if not is_playlist else ""
+        self.playlist_name = playlist_name if is_playlist else ""
+        self.update_subtitle(playlist_name if is_playlist else video_name)
 
     def update_title(self, text: str):
         self.title_label.configure(text=text)
@@ -384,41 +558,49 @@ class TaskItem:
 
     def update_colors(self):
         """Update colors when theme changes"""
-        self.colors = self.ui.get_current_colors()
+        colors = self.ui.get_current_colors()
+        if colors is not self.colors:
+            if not self._is_paint_dirty:
+                self._is_paint_dirty = any(self.colors.get(k) != colors.get(k) for k in self._PALETTE_KEYS)
+            self.colors = colors
+        # Widgets already show this palette; skip the configure round-trips
+        if not self._is_paint_dirty:
+            return
         # Update frame colors
         self.frame.configure(
-            fg_color=(self.colors['card'], self.colors['card']),
-            border_color=(self.colors['border'], self.colors['border'])
+            fg_color=self.colors['card'],
+            border_color=self.colors['border']
         )
         # Update button colors
         self.start_btn.configure(
-            fg_color=(self.colors['secondary'], self.colors['secondary']),
-            hover_color=(self.colors['secondary'], self.colors['secondary'])
+            fg_color=self.colors['secondary'],
+            hover_color=self.colors['secondary']
         )
         self.abort_btn.configure(
-            fg_color=(self.colors['danger'], self.colors['danger']),
-            hover_color=(self.colors['danger'], self.colors['danger'])
+            fg_color=self.colors['danger'],
+            hover_color=self.colors['danger']
         )
         # Update remove button colors
         self.remove_btn.configure(
             fg_color=(self.colors['surface_light'], self.colors['surface']),
-            hover_color=(self.colors['danger'], self.colors['danger']),
-            text_color=(self.colors['text_primary'], self.colors['text_primary'])
+            hover_color=self.colors['danger'],
+            text_color=self.colors['text_primary']
         )
         # Update text colors
-        self.title_label.configure(text_color=(self.colors['text_primary'], self.colors['text_primary']))
-        self.subtitle_label.configure(text_color=(self.colors['text_secondary'], self.colors['text_secondary']))
-        self.progress_text.configure(text_color=(self.colors['text_secondary'], self.colors['text_secondary']))
+        self.title_label.configure(text_color=self.colors['text_primary'])
+        self.subtitle_label.configure(text_color=self.colors['text_secondary'])
+        self.progress_text.configure(text_color=self.colors['text_secondary'])
+        self._is_paint_dirty = False
 
     def update_status_indicator(self, status: str):
         """Update the status indicator color based on task state"""
         # Status indicator widget not yet implemented - method is a placeholder
         # color_map = {
-        #     'idle': (self.colors['text_secondary'], self.colors['text_secondary']),
-        #     'running': (self.colors['secondary'], self.colors['secondary']),
-        #     'completed': (self.colors['success'], self.colors['success']),
-        #     'error': (self.colors['danger'], self.colors['danger']),
-        #     'aborted': (self.colors['warning'], self.colors['warning'])
+        #     'idle': self.colors['text_secondary'],
+        #     'running': self.colors['secondary'],
+        #     'completed': self.colors['success'],
+        #     'error': self.colors['danger'],
+        #     'aborted': self.colors['warning']
         # }
         # color = color_map.get(status, color_map['idle'])
         # self.status_indicator.configure(text_color=color)
@@ -445,33 +627,51 @@ class TaskItem:
             pass
 
     def _is_alive(self) -> bool:
-        try:
-            return (not self._destroyed) and self.frame.winfo_exists()
-        except Exception:
-            return False
+        # _destroyed is also set by the <Destroy> binding, so no Tk round-trip is needed here
+        return not self._destroyed
 
     def _set_progress_text_safe(self, text: str):
-        if not self._is_alive():
+        if self._destroyed:
             return
-        def _apply():
-            try:
-                if self._is_alive():
-                    self.progress_text.configure(text=text)
-            except Exception:
-                pass
-        self._run_on_ui(_apply)
+        self._pending_status = text
+        self._schedule_drain()
 
     def log(self, message: str):
+        if self._destroyed:
+            return
+        self._pending_logs.append(message)
+        self._schedule_drain()
+
+    def _schedule_drain(self):
+        """Arm the UI tick that applies pending progress, status and log lines (at most one pending)"""
+        if self._drain_scheduled:
+            return
+        self._drain_scheduled = True
+        try:
+            self.ui.root.after(_UI_TICK_MS, self._drain_progress)
+        except Exception:
+            self._drain_scheduled = False
+
+    def _drain_progress(self):
+        """Apply the latest progress/status and all queued log lines on the Tk thread"""
+        self._drain_scheduled = False
+        progress, self._pending_progress = self._pending_progress, None
+        status, self._pending_status = self._pending_status, None
+        # Take only what is queued now; lines the worker appends meanwhile go to the next tick
+        pending_logs = self._pending_logs
+        lines = [pending_logs.popleft() for _ in range(len(pending_logs))]
         if not self._is_alive():
             return
-        def _append():
-            try:
-                if self._is_alive():
-                    self.status_text.insert("end", f"{message}\n")
-                    self.status_text.see("end")
-            except Exception:
-                pass
-        self._run_on_ui(_append)
+        try:
+            if progress is not None:
+                self.progress_bar.set(progress)
+            if status is not None:
+                self.progress_text.configure(text=status)
+            if lines:
+                self.status_text.insert("end", "\n".join(lines) + "\n")
+                self.status_text.see("end")
+        except Exception:
+            pass
 
     def start(self):
         if self.is_running:
@@ -481,8 +681,9 @@ class TaskItem:
         url = self.get_url()
         url = ' '.join(url.split())  # Remove all newlines, tabs, and normalize whitespace
         
-        # Validate URL format
-        if not url or not url.startswith(("http://", "https://")):
+        # Validate URL format; the same match picks up a playlist id for detection below
+        url_match = _URL_RE.match(url)
+        if not url_match:
             messagebox.showerror("Error", "Please enter a valid URL starting with http:// or https://")
             return
         
@@ -515,8 +716,9 @@ class TaskItem:
                 messagebox.showerror("Error", f"Cannot create output directory: {e}")
                 return
 
-        # Detect playlist for early feedback
-        is_playlist = self._is_playlist_url(url)
+        # Detect playlist for early feedback (same rules as _is_playlist_url)
+        is_playlist = (url_match.group('list') is not None
+                       or 'youtube.com/playlist' in url or 'youtube.com/watch?list=' in url)
         self._is_playlist_task = bool(is_playlist)
         if is_playlist:
             self.progress_text.configure(text="📑 Detected playlist - preparing...")
@@ -529,6 +731,9 @@ class TaskItem:
 
         # Build metadata options from global UI
         metadata_options = {key: var.get() for key, var in self.ui.metadata_vars.items()}
+        # M3U toggles are read once per run; the download hooks check these plain flags
+        self._create_m3u_enabled = bool(metadata_options.get('create_m3u'))
+        self._m3u_to_parent = bool(metadata_options.get('m3u_to_parent'))
         is_audio = self.format_var.get() == "audio"
 
         # Switch buttons
@@ -537,9 +742,12 @@ class TaskItem:
         self.progress_bar.set(0)
         self._last_logged_progress = 0
         self._last_logged_filename = ""
-        self._last_ui_update_time = 0
-        self._last_progress_value = 0
         self._aborted = False
+        # Re-read playlist state from disk on every run; other tasks may have written it
+        self._state_cache.clear()
+        self._state_digest.clear()
+        self._m3u_dirty.clear()
+        self._m3u_last_flush = 0.0
         # Context log for clarity across multiple tasks
         try:
             cookie_file_cfg = self.ui.config.get("cookie_file", "") or ""
@@ -553,42 +761,38 @@ class TaskItem:
                 # Try to get quick playlist size and title for UX
                 if is_playlist:
                     try:
-                        import yt_dlp
-                        with yt_dlp.YoutubeDL({'quiet': True, 'extract_flat': True}) as ydl:
-                            info = ydl.extract_info(url, download=False)
-                            if info and 'entries' in info:
-                                valid_entries = [e for e in info['entries'] if e is not None]
-                                total = len(valid_entries)
-                                # Capture playlist title for clearer logs
-                                pl_title = info.get('title', 'Unknown Playlist')
-                                # Store for end-of-download logging
-                                self._current_playlist_title = pl_title
-                                self._current_playlist_total = total
-                                # Log a clear start banner for the playlist
-                                self.ui.root.after(0, lambda: self.log(f"📑 Playlist start: {pl_title} ({total} videos)"))
-                                self.ui.root.after(0, lambda: self._set_progress_text_safe(f"📋 Playlist: {total} videos"))
-
-                                # Pre-create playlist directory and reconcile existing M3U if requested
-                                try:
-                                    enabled_var = self.ui.metadata_vars.get('create_m3u', None)
-                                    if enabled_var and enabled_var.get():
-                                        playlist_dir = self._compute_playlist_directory(output_dir, pl_title)
-                                        os.makedirs(playlist_dir, exist_ok=True)
-                                        self._m3u_playlist_dir = playlist_dir
-                                        self._m3u_playlist_title = pl_title
-                                        expected = []
-                                        for idx, entry in enumerate(valid_entries, start=1):
-                                            try:
-                                                expected.append({
-                                                    'index': idx,
-                                                    'id': entry.get('id'),
-                                                    'title': entry.get('title')
-                                                })
-                                            except Exception:
-                                                pass
-                                        self._reconcile_existing_playlist_m3u(playlist_dir, pl_title, expected)
-                                except Exception:
-                                    pass
+                        pl_title, valid_entries = self._get_cached_or_flatten(
+                            url, refresh=metadata_options.get('force_playlist_redownload', False))
+                        if valid_entries is not None:
+                            total = len(valid_entries)
+                            # Store for end-of-download logging
+                            self._current_playlist_title = pl_title
+                            self._current_playlist_total = total
+                            # Log a clear start banner for the playlist
+                            self.ui.root.after(0, lambda: self.log(f"📑 Playlist start: {pl_title} ({total} videos)"))
+                            self.ui.root.after(0, lambda: self._set_progress_text_safe(f"📋 Playlist: {total} videos"))
+
+                            # Pre-create playlist directory and reconcile existing M3U if requested
+                            try:
+                                if self._create_m3u_enabled:
+                                    playlist_dir = self._compute_playlist_directory(output_dir, pl_title)
+                                    os.makedirs(playlist_dir, exist_ok=True)
+                                    self._m3u_playlist_dir = playlist_dir
+                                    self._m3u_playlist_title = pl_title
+                                    expected = []
+                                    # Indices are plain ints from here on; reconcile uses them as-is
+                                    for idx, entry in enumerate(valid_entries, start=1):
+                                        try:
+                                            expected.append({
+                                                'index': idx,
+                                                'id': entry.get('id'),
+                                                'title': entry.get('title')
+                                            })
+                                        except Exception:
+                                            pass
+                                    self._reconcile_existing_playlist_m3u(playlist_dir, pl_title, expected)
+                            except Exception:
+                                pass
                     except Exception:
                         pass
 
@@ -658,6 +862,45 @@ class TaskItem:
         self.is_running = True
         self.thread.start()
 
+    def _get_cached_or_flatten(self, url: str, refresh: bool = False):
+        """Return (title, entries) of a playlist's flat listing, reusing one fetched in the last 15 minutes"""
+        global _playlist_cache
+        key = _playlist_cache_key(url)
+        cache_file = os.path.join(self.ui.config.config_dir, "playlist_cache.json")
+        now = time.time()
+        with _playlist_cache_lock:
+            if _playlist_cache is None:
+                try:
+                    with open(cache_file, 'r', encoding='utf-8') as f:
+                        _playlist_cache = json.load(f)
+                except Exception:
+                    _playlist_cache = {}
+                if not isinstance(_playlist_cache, dict):
+                    _playlist_cache = {}
+            hit = _playlist_cache.get(key)
+        # Malformed entries (e.g. from a hand-edited file) count as misses and get replaced
+        if not refresh and _playlist_cache_fresh(hit, now):
+            return hit['title'], hit['entries']
+
+        import yt_dlp
+        with yt_dlp.YoutubeDL(dict(_PLAYLIST_SCAN_OPTS)) as ydl:
+            info = ydl.extract_info(url, download=False)
+        if not info or 'entries' not in info:
+            return None, None
+        title = info.get('title', 'Unknown Playlist')
+        entries = [{'id': e.get('id'), 'title': e.get('title')} for e in info['entries'] if e is not None]
+
+        with _playlist_cache_lock:
+            # Expired listings are dropped whenever a new one is stored
+            _playlist_cache = {k: v for k, v in _playlist_cache.items() if _playlist_cache_fresh(v, now)}
+            _playlist_cache[key] = {'ts': now, 'title': title, 'entries': entries}
+            try:
+                os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+                _write_text_atomic(cache_file, json.dumps(_playlist_cache, ensure_ascii=False))
+            except Exception as e:
+                print(f"Error saving playlist cache: {e}")
+        return title, entries
+
     def abort(self):
         if self.is_running:
             try:
@@ -665,44 +908,84 @@ class TaskItem:
                 self.log("🛑 Abort requested...")
                 self._set_progress_text_safe("⏹️ Aborting...")
 
-                # Call downloader abort first
+                # Cooperative cancel: the downloader's progress and postprocessor hooks check
+                # the abort flag and unwind the worker on their next call
                 self._get_downloader().abort_download()
-
-                # Wait a short time for graceful shutdown
-                import time
-                time.sleep(0.5)
-
-                # If thread is still alive after abort, try to force termination
-                if self.thread and self.thread.is_alive():
-                    self.log("⚠️ Thread still running, attempting force termination...")
-                    try:
-                        # Try to raise KeyboardInterrupt in the thread
-                        import ctypes
-                        if hasattr(ctypes, 'pythonapi'):
-                            thread_id = self.thread.ident
-                            if thread_id:
-                                ctypes.pythonapi.PyThreadState_SetAsyncExc(
-                                    ctypes.c_long(thread_id),
-                                    ctypes.py_object(KeyboardInterrupt)
-                                )
-                                self.log("✅ Force termination signal sent to thread")
-                    except Exception as e:
-                        self.log(f"⚠️ Could not force terminate thread: {e}")
-
+                # Write out items that finished before the abort; the task may be removed
+                # or the app closed before _completed runs
+                self._flush_m3u()
             except Exception as e:
                 self.log(f"⚠️ Error during abort: {e}")
 
+    def detach(self):
+        """Hide the task card so the UI can reuse it for a later task"""
+        try:
+            if self._info_after_id is not None:
+                self.ui.root.after_cancel(self._info_after_id)
+                self._info_after_id = None
+            self.frame.pack_forget()
+        except Exception:
+            pass
+
+    def reset(self, default_output: str):
+        """Return a detached task to the state of a freshly constructed one (left unpacked)"""
+        self.downloader = None
+        self.thread = None
+        self.is_running = False
+        self._aborted = False
+        self._m3u_playlist_dir = None
+        self._m3u_playlist_title = None
+        self._m3u_path_cache.clear()
+        self._create_m3u_enabled = False
+        self._m3u_to_parent = False
+        self._m3u_fingerprint.clear()
+        self._state_cache.clear()
+        self._state_digest.clear()
+        self._m3u_dirty.clear()
+        self._m3u_last_flush = 0.0
+        self._current_playlist_title = None
+        self._current_playlist_total = 0
+        self._is_playlist_task = False
+        self.video_name = ""
+        self.playlist_name = ""
+        self.is_playlist = False
+        self._last_analyzed_url = ""
+        self._idx = None
+        self._last_logged_progress = 0
+        self._last_logged_filename = ""
+        self._logged_item_filenames = OrderedDict()  # Bounded set of items with a start log line
+        self._progress_raw_name = None  # Last hook 'filename' and its display stem
+        self._progress_stem = ""
+        self._pending_progress = None
+        self._pending_status = None
+        self._pending_logs.clear()
+
+        self.url_var.set("")
+        self.format_var.set(self.ui.config.get("default_format", "audio"))
+        self.output_var.set(default_output)
+        self.update_subtitle("")
+        self.progress_bar.set(0)
+        self.progress_text.configure(text="⏳ Ready to download")
+        self._clear_status()
+        self.start_btn.configure(state="normal")
+        self.abort_btn.configure(state="disabled")
+
     def destroy(self):
         try:
             self._destroyed = True
+            self._flush_m3u()
+            if self._info_after_id is not None:
+                self.ui.root.after_cancel(self._info_after_id)
+                self._info_after_id = None
             self.frame.destroy()
         except Exception:
             pass
 
     def _is_playlist_url(self, url: str) -> bool:
-        import re
-        patterns = [r'[?&]list=([^&]+)', r'playlist\?list=([^&]+)', r'watch\?v=[^&]+&list=([^&]+)']
-        if any(re.search(p, url) for p in patterns):
+        # Every playlist form contains one of these; plain video URLs stop here
+        if 'list=' not in url and 'playlist' not in url:
+            return False
+        if _parse_url(url)[1] is not None:
             return True
         if 'youtube.com/playlist' in url or 'youtube.com/watch?list=' in url:
             return True
@@ -756,7 +1039,8 @@ class TaskItem:
             return False, "Unknown Video", "Unknown Playlist"
 
     def _update_progress(self, d):
-        if not self._is_alive():
+        # Runs on the download thread, so only the plain flag is checked (no Tk calls)
+        if self._destroyed:
             return
         try:
             if d.get('status') == 'downloading':
@@ -772,33 +1056,30 @@ class TaskItem:
                     except ValueError:
                         progress = 0
 
-                filename = os.path.basename(d.get('filename', '')).rsplit('.', 1)[0]
-                speed = d.get('speed', 0)
-                eta = d.get('eta', 0)
-                if speed and eta:
-                    speed_mb = speed / 1024 / 1024
-                    eta_str = f"{eta // 60}m {eta % 60}s" if eta > 60 else f"{eta}s"
-                    status_text = f"Downloading: {filename} ({speed_mb:.1f} MB/s, ETA: {eta_str})"
-                else:
-                    status_text = f"Downloading: {filename}"
-
-                # Throttle UI updates to prevent freezes (update at most 4 times per second)
-                import time
-                current_time = time.time()
-                time_since_last_update = current_time - self._last_ui_update_time
-                progress_change = abs(progress - self._last_progress_value)
-                
-                # Update UI only if: 250ms passed OR progress changed by >2% OR different file
-                should_update_ui = (time_since_last_update > 0.25 or 
-                                   progress_change > 0.02 or 
-                                   filename != self._last_logged_filename)
-                
-                if should_update_ui:
-                    # Apply UI updates on main thread
-                    self._run_on_ui(lambda p=progress: self.progress_bar.set(p))
+                raw_name = d.get('filename', '')
+                if raw_name != self._progress_raw_name:
+                    self._progress_raw_name = raw_name
+                    self._progress_stem = os.path.basename(raw_name).rsplit('.', 1)[0]
+                filename = self._progress_stem
+
+                # Only the latest snapshot is kept; the UI tick picks it up
+                self._pending_progress = progress
+                progress_percent = progress * 100
+                log_due = (progress_percent - self._last_logged_progress >= 5.0
+                           or filename != self._last_logged_filename)
+
+                # The label shows only the latest text, so it is formatted once per UI tick
+                # (when the previous one was consumed) or when a log line needs it
+                if log_due or self._pending_status is None:
+                    speed = d.get('speed', 0)
+                    eta = d.get('eta', 0)
+                    if speed and eta:
+                        speed_mb = speed / 1024 / 1024
+                        eta_str = f"{eta // 60}m {eta % 60}s" if eta > 60 else f"{eta}s"
+                        status_text = f"Downloading: {filename} ({speed_mb:.1f} MB/s, ETA: {eta_str})"
+                    else:
+                        status_text = f"Downloading: {filename}"
                     self._set_progress_text_safe(status_text)
-                    self._last_ui_update_time = current_time
-                    self._last_progress_value = progress
 
                 # Per-item start log (once per file)
                 try:
@@ -812,13 +1093,14 @@ class TaskItem:
                             self.log(f"▶ Starting: [{int(pl_idx)}/{int(n_entries)}] {vid_title}" + (f" — Playlist: {pl_title}" if pl_title else ""))
                         else:
                             self.log(f"▶ Starting: {vid_title}")
-                        self._logged_item_filenames.add(filename)
+                        self._logged_item_filenames[filename] = None
+                        if len(self._logged_item_filenames) > _LOGGED_ITEMS_MAX:
+                            self._logged_item_filenames.popitem(last=False)
                 except Exception:
                     pass
 
                 # Throttled logging
-                progress_percent = progress * 100
-                if (progress_percent - self._last_logged_progress >= 5.0 or filename != self._last_logged_filename):
+                if log_due:
                     self.log(f"⏬ {status_text}")
                     self._last_logged_progress = progress_percent
                     self._last_logged_filename = filename
@@ -863,6 +1145,8 @@ class TaskItem:
             self.log(f"❌ Progress update error: {e}")
 
     def _completed(self, success: bool, message: str):
+        # Items finished before an abort/removal must reach the state file and M3U either way
+        self._flush_m3u()
         if not self._is_alive():
             return
         try:
@@ -935,8 +1219,7 @@ class TaskItem:
 
         # Finalize M3U: ensure file is written even if last hook missed
         try:
-            enabled_var = self.ui.metadata_vars.get('create_m3u', None)
-            if enabled_var and enabled_var.get():
+            if self._create_m3u_enabled:
                 target_dir = self._m3u_playlist_dir
                 if not target_dir:
                     try:
@@ -952,32 +1235,9 @@ class TaskItem:
             pass
 
     # ===== M3U helpers =====
-    def _sanitize_name(self, name: str) -> str:
-        """Sanitize filename to be safe for all filesystems"""
-        try:
-            if not name:
-                return ""
-            import re
-            # Remove/replace all unsafe characters including newlines, carriage returns
-            name = name.replace('\n', ' ').replace('\r', ' ').replace('\0', '')
-            # Replace Windows/Unix forbidden characters
-            name = re.sub(r'[<>:"/\\|?*\x00-\x1f]', '_', name)
-            # Remove leading/trailing dots and spaces (Windows issue)
-            name = name.strip('. ')
-            # Truncate to reasonable length (255 bytes for most filesystems)
-            if len(name.encode('utf-8')) > 200:
-                name = name[:200]
-            return name if name else "untitled"
-        except Exception:
-            return "untitled"
-
     def _maybe_update_m3u(self, d: dict):
         # Check toggle
-        try:
-            enabled_var = self.ui.metadata_vars.get('create_m3u', None)
-            if not enabled_var or not enabled_var.get():
-                return
-        except Exception:
+        if not self._create_m3u_enabled:
             return
 
         info = d.get('info_dict', {}) or {}
@@ -987,82 +1247,109 @@ class TaskItem:
             return
         directory = os.path.dirname(final_path)
         playlist_title = info.get('playlist_title') or info.get('playlist') or ''
-        total = info.get('n_entries') or info.get('playlist_count') or 0
         video_id = info.get('id')
         title = info.get('title')
-
-        # Update state and M3U
+        # Normalize numeric fields once per hook
         try:
+            total = int(info.get('n_entries') or info.get('playlist_count') or 0)
+            pl_index = int(info.get('playlist_index') or 0)
+        except (TypeError, ValueError):
+            total, pl_index = 0, 0
+
+        # Update the in-memory state; disk and M3U writes are debounced (load/save/write each guard their own file I/O).
+        # The lock keeps this hook from racing a flush from the Tk thread (abort, remove, close)
+        with self._m3u_lock:
             state = self._load_state(directory)
             if playlist_title:
                 state['playlist_title'] = playlist_title
             if total:
-                try:
-                    state['total_entries'] = max(int(total), int(state.get('total_entries', 0) or 0))
-                except Exception:
-                    pass
+                prev_total = state.get('total_entries')
+                state['total_entries'] = max(total, prev_total) if isinstance(prev_total, int) else total
             entries = state.setdefault('entries', {})
-            pl_index = info.get('playlist_index')
             if pl_index:
-                key = str(int(pl_index))
-                entries[key] = {
-                    'id': video_id,
-                    'title': title,
-                    'path': final_path
-                }
+                key = str(pl_index)
             else:
                 # No index available; temporarily store under a special key to be appended later
-                tmp_key = f"_extra_{video_id or os.path.basename(final_path)}"
-                entries[tmp_key] = {
-                    'id': video_id,
-                    'title': title,
-                    'path': final_path
-                }
-            self._save_state(directory, state)
-            self._write_m3u_from_state(directory, playlist_title)
-        except Exception:
-            pass
+                key = f"_extra_{video_id or os.path.basename(final_path)}"
+            entries[key] = {
+                'id': video_id,
+                'title': title,
+                'path': final_path
+            }
+            self._m3u_dirty[directory] = playlist_title
+            if time.monotonic() - self._m3u_last_flush > _M3U_FLUSH_INTERVAL:
+                self._flush_m3u()
+
+    def _flush_m3u(self):
+        """Write pending playlist state and M3U files to disk"""
+        with self._m3u_lock:
+            self._m3u_last_flush = time.monotonic()
+            while self._m3u_dirty:
+                directory, playlist_title = self._m3u_dirty.popitem()
+                try:
+                    self._save_state(directory, self._load_state(directory))
+                    self._write_m3u_from_state(directory, playlist_title)
+                except Exception:
+                    pass
 
     def _compute_playlist_directory(self, output_dir: str, playlist_title: str) -> str:
-        safe_title = self._sanitize_name(playlist_title or 'Unknown_Playlist')
+        safe_title = _sanitize_name(playlist_title or 'Unknown_Playlist')
         return os.path.join(output_dir, safe_title)
 
     def _state_path(self, directory: str) -> str:
         return os.path.join(directory, ".playlist_state.json")
 
     def _load_state(self, directory: str) -> dict:
+        cached = self._state_cache.get(directory)
+        if cached is not None:
+            return cached
+        state = None
         try:
             path = self._state_path(directory)
             if os.path.exists(path):
                 with open(path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                    state = json.load(f)
         except Exception:
             pass
-        return {"playlist_title": None, "total_entries": 0, "entries": {}}
+        if not isinstance(state, dict) or not isinstance(state.get('entries', {}), dict):
+            state = {"playlist_title": None, "total_entries": 0, "entries": {}}
+        self._state_cache[directory] = state
+        return state
 
     def _save_state(self, directory: str, state: dict):
+        self._state_cache[directory] = state
         try:
             path = self._state_path(directory)
-            with open(path, 'w', encoding='utf-8') as f:
-                json.dump(state, f, ensure_ascii=False, indent=2)
+            text = json.dumps(state, ensure_ascii=False, indent=2)
+            # Skip the rewrite when the serialized state matches what was last written
+            digest = hashlib.blake2b(text.encode('utf-8'), digest_size=8).digest()
+            if self._state_digest.get(path) == digest and os.path.exists(path):
+                return
+            _write_text_atomic(path, text)
+            self._state_digest[path] = digest
         except Exception:
             pass
 
     def _m3u_path(self, directory: str, playlist_title: str = None) -> str:
+        # If user wants M3U in parent folder, place it there
+        to_parent = self._m3u_to_parent
+        cache_key = (directory, playlist_title, to_parent)
+        cached = self._m3u_path_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             base = os.path.basename(directory).strip() or (playlist_title or "playlist")
         except Exception:
             base = (playlist_title or "playlist")
-        safe = self._sanitize_name(base)
-        # If user wants M3U in parent folder, place it there
-        try:
-            to_parent = self.ui.metadata_vars.get('m3u_to_parent', None)
-            if to_parent and to_parent.get():
-                parent_dir = os.path.dirname(directory.rstrip(os.sep)) or directory
-                return os.path.join(parent_dir, f"{safe}.m3u")
-        except Exception:
-            pass
-        return os.path.join(directory, f"{safe}.m3u")
+        safe = _sanitize_name(base)
+        if to_parent:
+            parent_dir = os.path.dirname(directory.rstrip(os.sep)) or directory
+            path = os.path.join(parent_dir, f"{safe}.m3u")
+        else:
+            path = os.path.join(directory, f"{safe}.m3u")
+        self._m3u_path_cache[cache_key] = path
+        return path
 
     def _write_m3u_from_state(self, directory: str, playlist_title: str = None):
         state = self._load_state(directory)
@@ -1071,134 +1358,129 @@ class TaskItem:
             state["playlist_title"] = playlist_title
 
         # Build ordered list by playlist index
+        entries = state.get("entries", {})
+        ordered = [(int(k), v) for k, v in entries.items() if k.isdigit() and isinstance(v, dict)]
+        ordered.sort(key=itemgetter(0))
+
+        # abspath()/relpath() call getcwd() each time; resolve against a single lookup instead
+        cwd = os.getcwd()
+
+        def to_abs(path):
+            return os.path.normpath(path if os.path.isabs(path) else os.path.join(cwd, path))
+
+        # Resolve the M3U location once; every entry is made relative to the same base
+        # (for parent placement this keeps paths relative to the M3U file location).
+        # Paths outside the base (e.g. on another drive) are written as absolute paths.
+        m3u_file = self._m3u_path(directory, state.get("playlist_title"))
+        base = os.path.dirname(to_abs(m3u_file))
+        base_prefix = os.path.join(base, '')
+
+        def to_rel(abs_path):
+            # Both sides are normalized absolute paths, so the relative path is the remainder
+            rel = abs_path[len(base_prefix):] if abs_path.startswith(base_prefix) else abs_path
+            return rel.replace('\\', '/')
+
+        # One scandir of the playlist folder answers the existence checks below
+        # instead of a stat per entry; paths outside the folder still get stat'ed
+        abs_dir = to_abs(directory)
+        present = {}
         try:
-            entries = state.get("entries", {})
-            ordered = []
-            for k, v in entries.items():
-                try:
-                    ordered.append((int(k), v))
-                except Exception:
-                    pass
-            ordered.sort(key=lambda x: x[0])
-
-            # Prepare lines (relative paths)
-            lines = []
-            included_abs_paths = set()
-            for _, meta in ordered:
-                path = meta.get('path')
-                if not path or not os.path.exists(path):
-                    continue
-                try:
-                    abs_path = os.path.abspath(path)
-                    included_abs_paths.add(abs_path)
-                except Exception:
-                    pass
-                # For parent placement, keep paths relative to the M3U file location
-                try:
-                    target_m3u_dir = os.path.dirname(self._m3u_path(directory, state.get("playlist_title")))
-                    rel = os.path.relpath(path, target_m3u_dir)
-                except Exception:
-                    rel = path
-                lines.append(rel.replace('\\', '/'))
-
-            # Also append any temp extras captured without an index
-            try:
-                for k, meta in list(state.get('entries', {}).items()):
-                    if not isinstance(k, str) or not k.startswith('_extra_'):
-                        continue
-                    path = meta.get('path')
-                    if not path or not os.path.exists(path):
-                        continue
-                    try:
-                        abs_path = os.path.abspath(path)
-                        if abs_path in included_abs_paths:
-                            continue
-                        included_abs_paths.add(abs_path)
-                        target_m3u_dir = os.path.dirname(self._m3u_path(directory, state.get("playlist_title")))
-                        rel = os.path.relpath(path, target_m3u_dir)
-                    except Exception:
-                        rel = path
-                    lines.append(rel.replace('\\', '/'))
-            except Exception:
-                pass
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if entry.is_file():
+                        present[os.path.join(abs_dir, entry.name)] = entry.name
+        except OSError:
+            pass
 
-            # Fallback: append any media files present in directory but missing from expected list
-            try:
-                media_exts = ('.mp3', '.m4a', '.flac', '.ogg', '.wav', '.mp4', '.mkv', '.webm')
-                dir_entries = []
-                for fn in os.listdir(directory):
-                    fp = os.path.join(directory, fn)
-                    if os.path.isfile(fp) and fn.lower().endswith(media_exts):
-                        try:
-                            abs_fp = os.path.abspath(fp)
-                            if abs_fp not in included_abs_paths:
-                                dir_entries.append(fp)
-                        except Exception:
-                            pass
-                # Deterministic order for extras: alphabetical by filename
-                dir_entries.sort(key=lambda p: os.path.basename(p).lower())
-                for fp in dir_entries:
-                    try:
-                        target_m3u_dir = os.path.dirname(self._m3u_path(directory, state.get("playlist_title")))
-                        rel = os.path.relpath(fp, target_m3u_dir)
-                    except Exception:
-                        rel = fp
-                    lines.append(rel.replace('\\', '/'))
-            except Exception:
-                pass
+        def exists(abs_path):
+            if os.path.dirname(abs_path) == abs_dir:
+                return abs_path in present
+            return os.path.exists(abs_path)
+
+        # Prepare lines (relative paths)
+        lines = []
+        included_abs_paths = set()
+        for _, meta in ordered:
+            path = meta.get('path')
+            if not path:
+                continue
+            abs_path = to_abs(path)
+            if not exists(abs_path):
+                continue
+            included_abs_paths.add(abs_path)
+            lines.append(to_rel(abs_path))
+
+        # Also append any temp extras captured without an index
+        for k, meta in entries.items():
+            if not k.startswith('_extra_') or not isinstance(meta, dict):
+                continue
+            path = meta.get('path')
+            if not path:
+                continue
+            abs_path = to_abs(path)
+            if abs_path in included_abs_paths or not exists(abs_path):
+                continue
+            included_abs_paths.add(abs_path)
+            lines.append(to_rel(abs_path))
+
+        # Fallback: append any media files present in directory but missing from expected list
+        dir_entries = [(fn.lower(), abs_fp) for abs_fp, fn in present.items()
+                       if abs_fp not in included_abs_paths and fn.lower().endswith(_MEDIA_EXTS)]
+        # Deterministic order for extras: alphabetical by filename
+        dir_entries.sort(key=itemgetter(0))
+        lines.extend(to_rel(abs_fp) for _, abs_fp in dir_entries)
+
+        # Skip the rewrite when the playlist content is unchanged since the last write
+        fingerprint = hash(tuple(lines))
+        if self._m3u_fingerprint.get(m3u_file) == fingerprint and os.path.exists(m3u_file):
+            return
 
-            m3u_file = self._m3u_path(directory, state.get("playlist_title"))
-            with open(m3u_file, 'w', encoding='utf-8') as f:
-                f.write("#EXTM3U\n")
-                for rel in lines:
-                    # Basic M3U without EXTINF duration; Samsung Music accepts plain entries
-                    f.write(f"{rel}\n")
-        except Exception:
+        try:
+            # Basic M3U without EXTINF duration; Samsung Music accepts plain entries
+            _write_text_atomic(m3u_file, "#EXTM3U\n" + "".join(f"{rel}\n" for rel in lines))
+            self._m3u_fingerprint[m3u_file] = fingerprint
+        except OSError:
             pass
 
     def _reconcile_existing_playlist_m3u(self, directory: str, playlist_title: str, expected_entries: list):
         """Seed or fix M3U before download by matching existing files to expected order."""
+        state = self._load_state(directory)
+        state['playlist_title'] = playlist_title or state.get('playlist_title') or ''
+        prev_total = state.get('total_entries')
+        state['total_entries'] = max(prev_total if isinstance(prev_total, int) else 0, len(expected_entries))
+
+        # Build quick lookup by sanitized title stem
+        expected_by_stem = {}
+        for item in expected_entries:
+            title = item.get('title') or ''
+            stem = _sanitize_name(title).lower()
+            expected_by_stem[stem] = item
+
+        # Scan the directory itself (not subfolders) for media files, then match names
+        # against the expected entries. On POSIX, scan with bytes paths so only media
+        # names get decoded
+        if os.name == 'posix':
+            scan_dir, media_exts = os.fsencode(directory), _MEDIA_EXTS_BYTES
+        else:
+            scan_dir, media_exts = directory, _MEDIA_EXTS
+        names = []
         try:
-            state = self._load_state(directory)
-            state['playlist_title'] = playlist_title or state.get('playlist_title') or ''
-            state['total_entries'] = max(state.get('total_entries', 0) or 0, len(expected_entries))
-
-            # Build quick lookup by sanitized title stem
-            expected_by_stem = {}
-            for item in expected_entries:
-                title = item.get('title') or ''
-                stem = self._sanitize_name(title).lower()
-                expected_by_stem[stem] = item
-
-            # Scan directory for media files
-            media_exts = ('.mp3', '.m4a', '.flac', '.ogg', '.wav', '.mp4', '.mkv', '.webm')
-            for root, _, files in os.walk(directory):
-                if os.path.abspath(root) != os.path.abspath(directory):
-                    continue
-                for fn in files:
-                    if not fn.lower().endswith(media_exts):
-                        continue
-                    stem = os.path.splitext(fn)[0].lower()
-                    # Find best match by prefix or equality
-                    match = None
-                    if stem in expected_by_stem:
-                        match = expected_by_stem[stem]
-                    else:
-                        for key, item in expected_by_stem.items():
-                            if stem.startswith(key[:50]):
-                                match = item
-                                break
-                    if match:
-                        idx = int(match.get('index') or 0)
-                        if idx > 0:
-                            path = os.path.join(directory, fn)
-                            state.setdefault('entries', {})[str(idx)] = {
-                                'id': match.get('id'),
-                                'title': match.get('title'),
-                                'path': path
-                            }
-            self._save_state(directory, state)
-            self._write_m3u_from_state(directory, playlist_title)
-        except Exception:
+            with os.scandir(scan_dir) as it:
+                for entry in it:
+                    if entry.name.lower().endswith(media_exts) and entry.is_file():
+                        names.append(os.fsdecode(entry.name))
+        except OSError:
             pass
 
+        entries = state.setdefault('entries', {})
+        for fn, match in _match_playlist_files(names, expected_by_stem):
+            idx = match['index']
+            if idx > 0:
+                path = os.path.join(directory, fn)
+                entries[str(idx)] = {
+                    'id': match.get('id'),
+                    'title': match.get('title'),
+                    'path': path
+                }
+        self._save_state(directory, state)
+        self._write_m3u_from_state(directory, playlist_title)
@@ -12,6 +12,20 @@ from ..utils.config import Config
 import os
 import threading
 
+# Playlist-specific URL prefixes
+_PLAYLIST_URL_TOKENS = ('youtube.com/playlist', 'youtube.com/watch?list=')
+
+
+def _has_list_param(url):
+    """True if url has a non-empty list= query parameter (also covers playlist?list= and watch?v=...&list=)"""
+    i = url.find('list=')
+    while i != -1:
+        # Must start a parameter (not e.g. blacklist=) and carry a value
+        if i and url[i - 1] in '?&' and url[i + 5:i + 6] not in ('', '&'):
+            return True
+        i = url.find('list=', i + 5)
+    return False
+
 
 class TerminalUI:
     def __init__(self):
@@ -230,24 +244,12 @@ class TerminalUI:
 
     def is_playlist_url(self, url):
         """Detect if the URL is a playlist based on YouTube URL parameters"""
-        import re
-        
-        # YouTube playlist patterns
-        playlist_patterns = [
-            r'[?&]list=([^&]+)',  # Standard playlist parameter
-            r'playlist\?list=([^&]+)',  # Playlist URL format
-            r'watch\?v=[^&]+&list=([^&]+)',  # Video with playlist
-        ]
-        
-        for pattern in playlist_patterns:
-            if re.search(pattern, url):
-                return True
-        
-        # Check for playlist-specific domains
-        if 'youtube.com/playlist' in url or 'youtube.com/watch?list=' in url:
+        # Standard list= parameter
+        if _has_list_param(url):
             return True
-            
-        return False
+
+        # Check for playlist-specific domains
+        return any(token in url for token in _PLAYLIST_URL_TOKENS)
 
     def update_progress(self, d):
         """Update the progress text and status text"""
@@ -0,0 +1,100 @@
+"""
+Update Album Dialog Module
+
+Single form collecting everything needed to rewrite the album metadata of
+existing playlist files: directory, playlist name and file type.
+"""
+
+import os
+from tkinter import filedialog
+
+import customtkinter as ctk
+
+
+class UpdateAlbumDialog(ctk.CTkToplevel):
+    """Modal form for the 'Update Existing Files Album' action"""
+
+    def __init__(self, parent, initial_dir=""):
+        super().__init__(parent)
+        self.title("Update Existing Files Album")
+        self.resizable(False, False)
+        self.transient(parent)
+        self.result = None
+
+        self.dir_var = ctk.StringVar(value=initial_dir)
+        self.name_var = ctk.StringVar()
+        self.format_var = ctk.StringVar(value="audio")
+
+        container = ctk.CTkFrame(self, fg_color="transparent")
+        container.pack(fill="both", expand=True, padx=20, pady=20)
+
+        # Directory with the playlist files
+        ctk.CTkLabel(container, text="Directory with playlist files").pack(anchor="w")
+        dir_row = ctk.CTkFrame(container, fg_color="transparent")
+        dir_row.pack(fill="x", pady=(4, 12))
+        ctk.CTkEntry(dir_row, textvariable=self.dir_var, width=360, height=32).pack(side="left", fill="x", expand=True)
+        ctk.CTkButton(dir_row, text="Browse", width=80, height=32, command=self._browse).pack(side="left", padx=(8, 0))
+
+        # Playlist name written as the album tag
+        ctk.CTkLabel(container, text="Playlist name to use as album metadata").pack(anchor="w")
+        name_entry = ctk.CTkEntry(container, textvariable=self.name_var, height=32)
+        name_entry.pack(fill="x", pady=(4, 12))
+
+        # File type
+        type_row = ctk.CTkFrame(container, fg_color="transparent")
+        type_row.pack(fill="x", pady=(0, 12))
+        ctk.CTkLabel(type_row, text="File type:").pack(side="left")
+        ctk.CTkRadioButton(type_row, text="Audio", variable=self.format_var, value="audio").pack(side="left", padx=(12, 0))
+        ctk.CTkRadioButton(type_row, text="Video", variable=self.format_var, value="video").pack(side="left", padx=(12, 0))
+
+        # Stands in for a separate confirmation prompt
+        ctk.CTkLabel(container, text="⚠️ The album tag of every file of this type in the directory will be rewritten.",
+                     wraplength=440, justify="left").pack(anchor="w")
+
+        self.error_label = ctk.CTkLabel(container, text="", text_color="#ef4444")
+        self.error_label.pack(anchor="w")
+
+        # Buttons
+        btn_row = ctk.CTkFrame(container, fg_color="transparent")
+        btn_row.pack(fill="x", pady=(8, 0))
+        ctk.CTkButton(btn_row, text="Update", width=100, command=self._ok).pack(side="right")
+        ctk.CTkButton(btn_row, text="Cancel", width=100, fg_color="gray40", hover_color="gray30",
+                      command=self.destroy).pack(side="right", padx=(0, 8))
+
+        self.bind("<Return>", lambda e: self._ok())
+        self.bind("<Escape>", lambda e: self.destroy())
+        name_entry.focus_set()
+        try:
+            self.grab_set()
+        except Exception:
+            pass
+
+    def _browse(self):
+        directory = filedialog.askdirectory(
+            parent=self,
+            title="Select Directory with Playlist Files",
+            initialdir=self.dir_var.get() or None
+        )
+        if directory:
+            self.dir_var.set(directory)
+
+    def _ok(self):
+        directory = self.dir_var.get().strip()
+        name = self.name_var.get().strip()
+        if not directory or not os.path.isdir(directory):
+            self.error_label.configure(text="Please select an existing directory.")
+            return
+        if not name:
+            self.error_label.configure(text="Please enter a playlist name.")
+            return
+        self.result = {
+            "output_dir": directory,
+            "playlist_name": name,
+            "is_audio": self.format_var.get() == "audio",
+        }
+        self.destroy()
+
+    def show(self):
+        """Wait until the dialog is closed and return the form values, or None if cancelled"""
+        self.wait_window()
+        return self.result
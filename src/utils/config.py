@@ -1,6 +1,8 @@
 import json
 import os
 import shutil
+import threading
+from contextlib import contextmanager
 from pathlib import Path
 
 
@@ -13,6 +15,11 @@ class Config:
         # Store config adjacent to the app so it persists regardless of CWD
         self.config_dir = self.project_root / "config"
         self.config_file = self.config_dir / "settings.json"
+        # Serializes writes from the UI thread and background savers
+        self._save_lock = threading.Lock()
+        # set() calls inside batch() are written once when the outermost batch ends
+        self._batch_depth = 0
+        self._batch_dirty = False
 
         # One-time migration: move legacy config stored in CWD (older versions)
         self._migrate_legacy_config_locations()
@@ -87,13 +94,15 @@ class Config:
 
     def save_settings(self, settings=None):
         """Save current settings to config file"""
-        if settings is None:
-            settings = self.settings
-        
         try:
-            self.config_dir.mkdir(exist_ok=True)
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(settings, f, indent=2, ensure_ascii=False)
+            with self._save_lock:
+                # Snapshot the live settings inside the lock, so whichever save writes last
+                # (UI thread or the background writer) also writes the newest values
+                if settings is None:
+                    settings = dict(self.settings)
+                self.config_dir.mkdir(exist_ok=True)
+                with open(self.config_file, 'w', encoding='utf-8') as f:
+                    json.dump(settings, f, indent=2, ensure_ascii=False)
         except Exception as e:
             print(f"Error saving config: {e}")
 
@@ -101,11 +110,32 @@ class Config:
         """Get a setting value"""
         return self.settings.get(key, default)
 
+    def get_many(self, keys, defaults=None):
+        """Get several setting values at once as a dict"""
+        defaults = defaults or {}
+        settings = self.settings
+        return {key: settings.get(key, defaults.get(key)) for key in keys}
+
     def set(self, key, value):
         """Set a setting value and save"""
         self.settings[key] = value
+        if self._batch_depth:
+            self._batch_dirty = True
+            return
         self.save_settings()
 
+    @contextmanager
+    def batch(self):
+        """Coalesce the set() calls made inside the block into a single save"""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._batch_dirty:
+                self._batch_dirty = False
+                self.save_settings()
+
     def get_theme_colors(self, theme=None):
         """Get color scheme for specified theme"""
         if theme is None: